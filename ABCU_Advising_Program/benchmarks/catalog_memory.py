@@ -0,0 +1,97 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          catalog_memory.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Memory comparison of the in-memory catalog representations:
+#               plain dataclass objects, the slotted Course objects and the
+#               column-based CourseCatalog, measured with tracemalloc on
+#               synthetic catalogs read from a CSV file.
+#               Run it from the program folder:
+#                 python -m benchmarks.catalog_memory --sizes 10000 200000
+# ============================================================================
+
+
+# Modules imports
+import argparse  # Command line arguments parsing
+import gc  # Garbage collection before each measure
+import json  # Results file
+import os  # OS tools
+import tempfile  # Folder of the generated catalog
+import time  # Timings
+import tracemalloc  # Memory retained by each representation
+from dataclasses import dataclass, field  # Reference course class without slots
+from benchmarks.generator import generate_catalog, write_catalog_csv  # Synthetic data
+from models.course_catalog import CourseCatalog  # Column-based catalog
+from utils.data_loader import iter_courses_from_file  # Streamed catalog reader
+
+
+# Course class as it was before the slotted Course: one __dict__ per course and a list of prerequisites.
+@dataclass
+class PlainCourse:
+    number: str = ''
+    name: str = ''
+    prerequisites: list[str] = field(default_factory=list)
+
+
+# Representations compared, each one builds its catalog from the courses read from the file.
+REPRESENTATIONS = {
+    "plain_dataclass": lambda courses: [PlainCourse(course.number, course.name, list(course.prerequisites))
+                                        for course in courses],
+    "slotted_course": list,
+    "course_catalog": CourseCatalog,
+}
+
+
+# Build the catalog of a representation from the CSV file and return the memory it retains and the
+# peak memory of the build. The strings read from the file are traced too, so they are counted in the
+# memory of the representation that keeps them.
+def measure(name: str, csv_path: str) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    catalog = REPRESENTATIONS[name](iter_courses_from_file(csv_path))
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    courses = len(catalog)
+    del catalog
+    return {"representation": name, "courses": courses, "retained_bytes": retained, "peak_bytes": peak,
+            "bytes_per_course": retained / courses if courses else 0.0, "build_seconds": elapsed}
+
+
+# Parse the command line arguments.
+def parse_arguments(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Memory of the in-memory catalog representations.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000],
+                        help="Number of courses of the catalogs (default: 10000 100000).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic data (default: 0).")
+    parser.add_argument("--output", help="JSON results file to write.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    arguments = parse_arguments(argv)
+    results: list[dict] = []
+    print(f"{'representation':<18} {'courses':>9} {'retained MB':>12} {'peak MB':>9} {'B/course':>9} {'build s':>8}")
+    with tempfile.TemporaryDirectory(prefix="abcu_catalog_memory_") as folder:
+        for size in arguments.sizes:
+            csv_path = os.path.join(folder, f"catalog_{size}.csv")
+            write_catalog_csv(generate_catalog(size, seed=arguments.seed), csv_path)
+            for name in REPRESENTATIONS:
+                result = measure(name, csv_path)
+                results.append(result)
+                print(f"{name:<18} {result['courses']:>9} {result['retained_bytes'] / 2 ** 20:>12.1f} "
+                      f"{result['peak_bytes'] / 2 ** 20:>9.1f} {result['bytes_per_course']:>9.0f} "
+                      f"{result['build_seconds']:>8.2f}")
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output_file:
+            json.dump({"config": vars(arguments), "results": results}, output_file, indent=4)
+        print(f"Results written to '{arguments.output}'")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          generator.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Generator of synthetic course catalogs and student populations
+#               used by the benchmarks. The same seed gives the same data.
+# ============================================================================
+
+
+# Modules imports
+import csv  # Writing of the CSV files
+import random  # Seeded random generator
+from models.course import Course  # Import the Course class
+from utils.json_writer import JsonArrayWriter  # Streaming writer of the JSON catalog
+
+
+# Departments used for the course numbers, each department has up to 100000 courses.
+DEPARTMENTS = ["CS", "MATH", "PHYS", "CHEM", "BIO", "ENG", "HIST", "ECON", "PSY", "ART",
+               "MUS", "PHIL", "STAT", "GEO", "LING", "EE", "ME", "CE", "NURS", "BUS"]
+# Words used to build the course names.
+SUBJECTS = ["Programming", "Data Structures", "Algorithms", "Databases", "Networks", "Operating Systems",
+            "Calculus", "Linear Algebra", "Statistics", "Mechanics", "Thermodynamics", "Organic Chemistry",
+            "Genetics", "Ecology", "Composition", "Literature", "World History", "Microeconomics",
+            "Cognition", "Drawing", "Harmony", "Ethics", "Probability", "Cartography", "Syntax",
+            "Circuits", "Dynamics", "Structures", "Anatomy", "Accounting", "Machine Learning", "Security"]
+QUALIFIERS = ["Introduction to", "Foundations of", "Applied", "Advanced", "Topics in", "Seminar in",
+              "Principles of", "Methods in"]
+SUFFIXES = ["", "", "", " I", " II", " III", " Laboratory"]
+
+
+# Generate a catalog of course_count courses whose prerequisites form a DAG of levels.
+# Each course gets a level between 0 and max_depth (the lower levels have more courses, like the introductory
+# courses of a real catalog) and up to max_prereqs prerequisites taken from the level just below, often in the
+# same department, so the longest prerequisite chains are max_depth courses long.
+def generate_catalog(course_count: int, max_depth: int = 8, max_prereqs: int = 3, seed: int = 0) -> list[Course]:
+    if course_count < 1:
+        return []
+    rng = random.Random(seed)
+    department_count = max(1, min(len(DEPARTMENTS), course_count // 50))
+    # Level sizes halve at each level, with at least one course per level when possible.
+    weights = [2 ** (max_depth - level) for level in range(max_depth + 1)]
+    sizes = [max(1, course_count * weight // sum(weights)) for weight in weights]
+    sizes[0] += course_count - sum(sizes)
+    while sizes[0] < 1:  # Tiny catalogs: fewer levels
+        sizes.pop()
+        sizes[0] += 1
+
+    courses = []
+    levels: list[list[int]] = []  # level -> positions in courses
+    by_department: dict[tuple[int, int], list[int]] = {}  # (level, department) -> positions in courses
+    counters = [0] * department_count
+    for level, size in enumerate(sizes):
+        levels.append([])
+        for _ in range(size):
+            department = rng.randrange(department_count)
+            counters[department] += 1
+            number = f"{DEPARTMENTS[department]}{counters[department]:05d}"
+            name = f"{rng.choice(QUALIFIERS)} {rng.choice(SUBJECTS)}{rng.choice(SUFFIXES)}"
+            prerequisites = []
+            if level > 0:
+                same = by_department.get((level - 1, department))
+                for _ in range(rng.randint(1, max_prereqs)):
+                    pool = same if same and rng.random() < 0.7 else levels[level - 1]
+                    prerequisites.append(courses[rng.choice(pool)].number)
+            by_department.setdefault((level, department), []).append(len(courses))
+            levels[level].append(len(courses))
+            courses.append(Course(number, name, tuple(dict.fromkeys(prerequisites))))
+    return courses
+
+
+# Generate student_count students as (name, surname, email, password, role, completed courses) tuples.
+# Each student completed up to max_completed courses: random courses together with all their prerequisites,
+# listed prerequisites first like a real transcript. All the students share the same password.
+def generate_students(courses: list[Course], student_count: int, max_completed: int = 30, seed: int = 0,
+                      password: str = "benchmark") -> list[tuple]:
+    rng = random.Random(seed)
+    prerequisites = {course.number: course.prerequisites for course in courses}
+    numbers = list(prerequisites)
+    students = []
+    for i in range(student_count):
+        completed: list[str] = []
+        done: set[str] = set()
+        target = rng.randint(0, max_completed)
+        for _ in range(3 * target):  # Some courses need too many prerequisites and are skipped
+            if len(completed) >= target:
+                break
+            # Post-order visit: the prerequisites of a course are added before the course.
+            chain: list[str] = []
+            seen = set(done)
+            stack = [(rng.choice(numbers), False)]
+            while stack and len(completed) + len(chain) <= target:
+                number, expanded = stack.pop()
+                if expanded:
+                    chain.append(number)
+                elif number not in seen:
+                    seen.add(number)
+                    stack.append((number, True))
+                    stack.extend((prereq, False) for prereq in prerequisites.get(number, ()) if prereq not in seen)
+            if not stack and len(completed) + len(chain) <= target:
+                completed.extend(chain)
+                done.update(chain)
+        students.append((f"Student{i}", f"Surname{i}", f"student{i:07d}@abcu.edu", password, "student",
+                         completed))
+    return students
+
+
+# Write the courses as a CSV catalog: one "number,name,prerequisite,..." row per course.
+def write_catalog_csv(courses: list[Course], csv_path: str) -> None:
+    with open(csv_path, "w", newline="", encoding="utf-8") as csv_file:
+        csv.writer(csv_file).writerows([course.number, course.name, *course.prerequisites] for course in courses)
+
+
+# Write the courses as a JSON catalog with the "code", "title" and "prerequisites" keys.
+def write_catalog_json(courses: list[Course], json_path: str) -> None:
+    with open(json_path, "w", encoding="utf-8") as json_file, JsonArrayWriter(json_file) as writer:
+        for course in courses:
+            writer.write({"code": course.number, "title": course.name, "prerequisites": list(course.prerequisites)})
+
+
+# Write the completed courses of the students as "email,course number" rows.
+def write_completions_csv(students: list[tuple], csv_path: str) -> None:
+    with open(csv_path, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        for student in students:
+            writer.writerows((student[2], number) for number in student[5])
@@ -0,0 +1,220 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          load_test.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Load test of the database API: many concurrent student
+#               sessions run a mix of the menu actions on threads against a
+#               local storage backend, the throughput and the latency
+#               percentiles of each action are reported.
+#               Run it from the program folder:
+#                 python -m benchmarks.load_test --sessions 50 --duration 10
+# ============================================================================
+
+
+# Modules imports
+import argparse  # Command line arguments parsing
+import json  # Results file
+import math  # Rank of the percentiles
+import os  # OS tools
+import random  # Choice of the actions and of their arguments
+import tempfile  # Folder of the SQLite database
+import threading  # Concurrent sessions
+import time  # Timings
+from benchmarks.generator import generate_catalog, generate_students  # Synthetic data
+from models.user import User  # Import the User class definition
+from services import mdb_api  # Database API under test
+from services.backends.memory_backend import MemoryBackend  # In-memory storage backend
+from services.backends.sqlite_backend import SQLiteBackend  # SQLite storage backend
+from utils.password_hashing import hash_password  # Password hash shared by the generated users
+
+
+# Default weights of the actions run by each session, like a registration week: many lookups and
+# eligibility checks, fewer logins, completions and full listings.
+DEFAULT_MIX = "login=1,lookup=10,list=1,add_completion=2,eligibility=5"
+
+
+# Login: read the user and check the password (menu login).
+def _login(session: dict, rng: random.Random) -> None:
+    user = mdb_api.find_user_by_email(session["email"])
+    if user is None or not user.check_password(session["password"]):
+        raise RuntimeError(f"Login failed for {session['email']}")
+
+
+# Look up a random course (menu option 2).
+def _lookup(session: dict, rng: random.Random) -> None:
+    mdb_api.find_course_by_number(rng.choice(session["numbers"]))
+
+
+# Read the whole catalog sorted by number (menu option 1).
+def _list(session: dict, rng: random.Random) -> None:
+    mdb_api.list_courses_sorted()
+
+
+# Add a random completed course to the session user (menu option 3).
+def _add_completion(session: dict, rng: random.Random) -> None:
+    mdb_api.add_completed_course(session["email"], rng.choice(session["numbers"]))
+
+
+# Read the user and find the courses it can take now (menu option 13).
+def _eligibility(session: dict, rng: random.Random) -> None:
+    user = mdb_api.find_user_by_email(session["email"])
+    mdb_api.get_prerequisite_graph().eligible_courses(user.completed_courses)
+
+
+# Actions by name.
+ACTIONS = {"login": _login, "lookup": _lookup, "list": _list, "add_completion": _add_completion,
+           "eligibility": _eligibility}
+
+
+# Parse a "name=weight,..." mix of actions.
+def parse_mix(text: str) -> dict[str, float]:
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in ACTIONS:
+            raise ValueError(f"Unknown action '{name}', the actions are: {', '.join(ACTIONS)}.")
+        mix[name] = float(weight) if weight else 1.0
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("At least one action must have a weight greater than zero.")
+    return mix
+
+
+# Return the value below which the given fraction of the sorted values lies (nearest rank).
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+# Run one session: log in, then run actions chosen by weight until the deadline or the actions limit.
+# The latencies are appended to the session's own list, so the threads never wait for each other to record.
+def _run_session(session: dict, mix: dict[str, float], seed: int, start: threading.Barrier,
+                 deadline: list[float], actions_limit: int | None) -> None:
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = list(mix.values())
+    start.wait()
+    plan = ["login"]
+    done = 0
+    while (actions_limit is None or done < actions_limit) and time.perf_counter() < deadline[0]:
+        name = plan.pop() if plan else rng.choices(names, weights)[0]
+        begin = time.perf_counter()
+        try:
+            ACTIONS[name](session, rng)
+            error = False
+        except Exception:
+            error = True
+        session["samples"].append((name, time.perf_counter() - begin, error))
+        done += 1
+
+
+# Prepare the backend with a synthetic catalog and population and return the sessions.
+def prepare(arguments: argparse.Namespace, folder: str) -> list[dict]:
+    if arguments.backend == "sqlite":
+        mdb_api.use_backend(SQLiteBackend(os.path.join(folder, "load_test.db")))
+    else:
+        mdb_api.use_backend(MemoryBackend())
+    courses = generate_catalog(arguments.courses, seed=arguments.seed)
+    students = generate_students(courses, arguments.sessions, seed=arguments.seed)
+    mdb_api.insert_courses(courses)
+    # All the users share one hash to keep the setup short, the work factor is the configured one.
+    password_hash = hash_password(students[0][3]) if students else b""
+    mdb_api.insert_users([User(name, surname, email, password_hash, role, completed)
+                          for name, surname, email, _, role, completed in students])
+    mdb_api.get_prerequisite_graph()  # Built once before the sessions start, like in a running service
+    numbers = [course.number for course in courses]
+    return [{"email": student[2], "password": student[3], "numbers": numbers, "samples": []}
+            for student in students]
+
+
+# Run the load test and return the report with the statistics of each action.
+def run_load_test(arguments: argparse.Namespace) -> dict:
+    mix = parse_mix(arguments.mix)
+    with tempfile.TemporaryDirectory(prefix="abcu_load_test_") as folder:
+        sessions = prepare(arguments, folder)
+        barrier = threading.Barrier(len(sessions) + 1)
+        deadline = [float("inf")]  # Set when all the sessions are ready
+        threads = [threading.Thread(target=_run_session,
+                                    args=(session, mix, arguments.seed + i, barrier, deadline, arguments.actions),
+                                    daemon=True)
+                   for i, session in enumerate(sessions)]
+        for thread in threads:
+            thread.start()
+        began = time.perf_counter()
+        deadline[0] = began + arguments.duration
+        barrier.wait()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - began
+        mdb_api.use_backend(MemoryBackend())  # Release the SQLite file before the folder is deleted
+
+    by_action: dict[str, list[float]] = {}
+    errors: dict[str, int] = {}
+    for session in sessions:
+        for name, seconds, error in session["samples"]:
+            by_action.setdefault(name, []).append(seconds)
+            errors[name] = errors.get(name, 0) + error
+    total = sum(len(latencies) for latencies in by_action.values())
+    report = {"sessions": len(sessions), "courses": arguments.courses, "backend": arguments.backend,
+              "mix": mix, "wall_seconds": wall, "operations": total,
+              "throughput": total / wall if wall > 0 else 0.0, "actions": {}}
+    for name, latencies in sorted(by_action.items()):
+        latencies.sort()
+        report["actions"][name] = {
+            "count": len(latencies), "errors": errors[name],
+            "throughput": len(latencies) / wall if wall > 0 else 0.0,
+            "mean_seconds": sum(latencies) / len(latencies), "max_seconds": latencies[-1],
+            "p50_seconds": percentile(latencies, 0.50), "p95_seconds": percentile(latencies, 0.95),
+            "p99_seconds": percentile(latencies, 0.99)}
+    return report
+
+
+# Print the report as a table.
+def print_report(report: dict) -> None:
+    print(f"{report['sessions']} sessions, {report['courses']} courses, {report['backend']} backend: "
+          f"{report['operations']} operations in {report['wall_seconds']:.2f} s "
+          f"({report['throughput']:.1f} ops/s)")
+    print(f"{'action':<16} {'count':>8} {'errors':>6} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, values in report["actions"].items():
+        print(f"{name:<16} {values['count']:>8} {values['errors']:>6} {values['throughput']:>9.1f} "
+              f"{values['p50_seconds'] * 1000:>9.3f} {values['p95_seconds'] * 1000:>9.3f} "
+              f"{values['p99_seconds'] * 1000:>9.3f}")
+
+
+# Parse the command line arguments.
+def parse_arguments(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test of the course planner with concurrent sessions.")
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent student sessions (default: 20).")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of the test (default: 10).")
+    parser.add_argument("--actions", type=int, help="Stop each session after this many actions.")
+    parser.add_argument("--courses", type=int, default=10000, help="Courses of the catalog (default: 10000).")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Weights of the actions (default: {DEFAULT_MIX}).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the data and of the sessions (default: 0).")
+    parser.add_argument("--backend", choices=["memory", "sqlite"], default="memory",
+                        help="Storage backend used (default: memory).")
+    parser.add_argument("--output", help="JSON file where the report is written.")
+    arguments = parser.parse_args(argv)
+    if arguments.sessions < 1:
+        parser.error("--sessions must be greater than zero.")
+    try:
+        parse_mix(arguments.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    return arguments
+
+
+def main(argv=None) -> None:
+    arguments = parse_arguments(argv)
+    report = run_load_test(arguments)
+    print_report(report)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=4)
+        print(f"Report written to '{arguments.output}'")
+
+
+if __name__ == "__main__":
+    main()
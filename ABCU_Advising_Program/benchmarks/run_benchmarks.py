@@ -0,0 +1,208 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          run_benchmarks.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Benchmark suite of the course planner on synthetic catalogs,
+#               run against a local storage backend. The results are saved as
+#               JSON and can be compared with the results of another version.
+#               Run it from the program folder:
+#                 python -m benchmarks.run_benchmarks --sizes 1000 100000
+# ============================================================================
+
+
+# Modules imports
+import argparse  # Command line arguments parsing
+import contextlib  # Used to silence the messages printed by the loaders
+import io  # Buffer receiving the silenced messages
+import json  # Results file
+import os  # OS tools
+import platform  # Description of the machine running the benchmarks
+import random  # Seeded choice of the looked up courses
+import statistics  # Mean of the repeated runs
+import subprocess  # Used to read the current git commit
+import tempfile  # Folder of the generated files
+import time  # Timings
+from datetime import datetime, timezone  # Date of the run
+from benchmarks.generator import (generate_catalog, generate_students, write_catalog_csv,
+                                  write_catalog_json)  # Synthetic data
+from models.prereq_graph import PrerequisiteGraph  # Graph of the course prerequisites
+from models.user import User  # Import the User class definition
+from services import mdb_api  # Database API under test
+from services.backends.memory_backend import MemoryBackend  # In-memory storage backend
+from services.backends.sqlite_backend import SQLiteBackend  # SQLite storage backend
+from services.eligibility import eligibility_report  # Bulk eligibility report
+from utils.data_loader import (csv_to_json_courses, stream_courses_from_csv_file,
+                               stream_courses_from_json_file)  # Loaders and converter under test
+from utils.password_hashing import hash_password  # Password hash shared by the generated users
+
+
+# Queries timed by the search benchmark.
+SEARCH_QUERIES = ["programming", "intro", "advanced sec", "data structures ii", "m"]
+# A benchmark slower than the compared one by more than this ratio is reported as a regression.
+REGRESSION_RATIO = 1.2
+
+
+# Return the current git commit of the program or None when it is not available.
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Replace the storage of the API with an empty backend of the given kind.
+def _fresh_backend(kind: str, folder: str) -> None:
+    if kind == "sqlite":
+        path = os.path.join(folder, "benchmark.db")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        mdb_api.use_backend(SQLiteBackend(path))
+    else:
+        mdb_api.use_backend(MemoryBackend())
+
+
+# Run action repeat times and append its timings to results. setup (if given) runs before each repetition
+# and is not timed, its return value is passed to action. action returns the number of operations done.
+def _measure(results: list, name: str, size: int, repeat: int, action, setup=None) -> None:
+    times = []
+    operations = 0
+    for _ in range(repeat):
+        state = setup() if setup else None
+        # The messages printed by the loaders would make the timings depend on the terminal.
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            operations = action(state)
+            times.append(time.perf_counter() - start)
+    best = min(times)
+    results.append({"benchmark": name, "size": size, "operations": operations, "repeat": repeat,
+                    "best": best, "mean": statistics.mean(times),
+                    "ops_per_second": operations / best if best > 0 else None})
+    print(f"{name:<22} {size:>9} {operations:>9} ops  best {best:.6f} s  mean {statistics.mean(times):.6f} s")
+
+
+# Run all the benchmarks on a catalog of the given size, the data is loaded in a fresh backend.
+def run_size(size: int, arguments: argparse.Namespace, folder: str) -> list[dict]:
+    results: list[dict] = []
+    repeat = arguments.repeat
+    rng = random.Random(arguments.seed)
+    courses = generate_catalog(size, seed=arguments.seed)
+    students = generate_students(courses, arguments.students, seed=arguments.seed)
+    csv_path = os.path.join(folder, f"catalog_{size}.csv")
+    json_path = os.path.join(folder, f"catalog_{size}.json")
+    write_catalog_csv(courses, csv_path)
+    write_catalog_json(courses, json_path)
+    numbers = [course.number for course in courses]
+    lookups = rng.sample(numbers, min(size, arguments.lookups))
+
+    # Loading and conversion.
+    _measure(results, "csv_load", size, repeat,
+             lambda _: stream_courses_from_csv_file(csv_path, mdb_api.insert_courses,
+                                                    chunk_size=mdb_api.DEFAULT_BATCH_SIZE)["courses"],
+             setup=lambda: _fresh_backend(arguments.backend, folder))
+    _measure(results, "json_load", size, repeat,
+             lambda _: stream_courses_from_json_file(json_path, mdb_api.insert_courses,
+                                                     chunk_size=mdb_api.DEFAULT_BATCH_SIZE)["courses"],
+             setup=lambda: _fresh_backend(arguments.backend, folder))
+    converted_path = os.path.join(folder, f"converted_{size}.json")
+    _measure(results, "csv_to_json", size, repeat,
+             lambda _: csv_to_json_courses(csv_path, converted_path) or size)
+
+    # Lookups on the loaded catalog, the cache is emptied so every course is read from the storage once.
+    _measure(results, "lookup_single", size, repeat,
+             lambda _: sum(1 for number in lookups if mdb_api.find_course_by_number(number)),
+             setup=mdb_api.course_cache.clear)
+    _measure(results, "lookup_batch", size, repeat,
+             lambda _: len(mdb_api.find_courses_by_numbers(lookups)),
+             setup=mdb_api.course_cache.clear)
+    _measure(results, "sorted_listing", size, repeat,
+             lambda _: sum(1 for _ in mdb_api.iter_courses_sorted()))
+    mdb_api.get_search_index()  # Built once, only the queries are timed
+    _measure(results, "search", size, repeat,
+             lambda _: len([mdb_api.search_courses(query) for query in SEARCH_QUERIES]))
+
+    # Eligibility: the graph of the catalog, one student at a time and all the students at once.
+    _measure(results, "prerequisite_graph", size, repeat,
+             lambda _: len(PrerequisiteGraph(mdb_api.list_courses_sorted())))
+    graph = mdb_api.get_prerequisite_graph()
+    _measure(results, "eligibility_checks", size, repeat,
+             lambda _: len([graph.eligible_courses(student[5]) for student in students]))
+    _measure(results, "eligibility_report", size, repeat,
+             lambda _: eligibility_report(((student[2], student[5]) for student in students), graph)["students"])
+
+    # Logins: read the user and check the password. All the users share one hash to keep the setup short,
+    # the bcrypt work factor is the configured one (BCRYPT_ROUNDS).
+    password_hash = hash_password(students[0][3]) if students else b""
+    mdb_api.insert_users([User(name, surname, email, password_hash, role, completed)
+                          for name, surname, email, _, role, completed in students])
+    logins = [(student[2], student[3]) for student in students[:arguments.logins]]
+    _measure(results, "login", size, repeat,
+             lambda _: sum(1 for email, password in logins
+                           if (user := mdb_api.find_user_by_email(email)) and user.check_password(password)))
+    return results
+
+
+# Print the benchmarks of results slower than in the baseline by more than REGRESSION_RATIO.
+# Returns the number of regressions found.
+def compare(results: list[dict], baseline_path: str) -> int:
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = {(result["benchmark"], result["size"]): result for result in json.load(baseline_file)["results"]}
+    regressions = 0
+    print(f"\nComparison with {baseline_path}:")
+    for result in results:
+        previous = baseline.get((result["benchmark"], result["size"]))
+        if previous is None or previous["best"] <= 0:
+            continue
+        ratio = result["best"] / previous["best"]
+        flag = "REGRESSION" if ratio > REGRESSION_RATIO else ""
+        regressions += bool(flag)
+        print(f"{result['benchmark']:<22} {result['size']:>9}  {previous['best']:.6f} s -> {result['best']:.6f} s"
+              f"  x{ratio:.2f} {flag}")
+    return regressions
+
+
+# Parse the command line arguments.
+def parse_arguments(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarks of the course planner on synthetic catalogs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000],
+                        help="Number of courses of the catalogs (default: 1000 10000).")
+    parser.add_argument("--students", type=int, default=1000, help="Number of students (default: 1000).")
+    parser.add_argument("--lookups", type=int, default=1000, help="Courses looked up (default: 1000).")
+    parser.add_argument("--logins", type=int, default=5, help="Logins checked (default: 5).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of each benchmark, the best is kept (default: 3).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic data (default: 0).")
+    parser.add_argument("--backend", choices=["memory", "sqlite"], default="memory",
+                        help="Storage backend used (default: memory).")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON results file to write.")
+    parser.add_argument("--compare", help="JSON results file of another version to compare with.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    arguments = parse_arguments(argv)
+    results: list[dict] = []
+    with tempfile.TemporaryDirectory(prefix="abcu_benchmarks_") as folder:
+        for size in arguments.sizes:
+            results.extend(run_size(size, arguments, folder))
+        _fresh_backend("memory", folder)  # Release the SQLite file before the folder is deleted
+
+    report = {
+        "commit": _git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "config": {key: value for key, value in vars(arguments).items() if key not in ("output", "compare")},
+        "results": results
+    }
+    with open(arguments.output, "w", encoding="utf-8") as output_file:
+        json.dump(report, output_file, indent=4)
+    print(f"Results written to '{arguments.output}'")
+    return compare(results, arguments.compare) if arguments.compare else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(1 if main() else 0)
@@ -10,30 +10,92 @@
 
 
 # Modules imports
+# The database API connects to MongoDB (and imports pymongo) only when it is used for the first time,
+# so the commands that do not need the database do not pay for it. Check it with: python -X importtime main.py
+import argparse  # Command line arguments parsing
+import contextlib  # Used when the command is not profiled
+import os  # Credentials of the batch mode
+import sys  # Standard streams of the batch mode
 import time  # The time module is loaded to check the execution time
-from services.mdb_api import (insert_course,
+from dotenv import load_dotenv  # Import the environment variable loading tool
+# Load the .env file before importing the application modules, some of them read their settings when imported
+# (BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS, ABCU_METRICS, ASYNC_API_WORKERS).
+load_dotenv()
+from services.mdb_api import (DEFAULT_BATCH_SIZE,
+                              insert_courses,
                               find_course_by_number,
-                              list_courses_sorted,
+                              find_courses_by_numbers,
                               clear_courses,
                               insert_user,
                               find_user_by_email,
                               add_completed_course,
-                              get_users_list)  # Import the MongoDB access functions
-from utils.data_loader import (load_courses_from_csv_file,
+                              iter_users,
+                              find_duplicate_courses,
+                              find_duplicate_users,
+                              dedupe_courses,
+                              ensure_indexes,
+                              get_prerequisite_graph,
+                              sync_catalog,
+                              add_completed_courses_bulk,
+                              insert_users,
+                              update_password_hash,
+                              find_courses_by_prefix,
+                              find_courses_in_range,
+                              search_courses,
+                              find_course_details,
+                              iter_course_details_sorted,
+                              rebuild_course_details)  # Import the MongoDB access functions
+from utils.data_loader import (stream_courses_from_csv_file,
                                csv_to_json_courses,
-                               load_courses_from_json_file)  # Load the data loader function utility
+                               stream_courses_from_json_file,
+                               sync_catalog_from_file,
+                               import_completions_from_csv,
+                               load_user_rows_from_csv,
+                               csv_to_snapshot,
+                               json_to_snapshot,
+                               load_courses_from_snapshot)  # Load the data loader function utility
 from models.user import User  # Import the User class definition
+from models.prereq_graph import CyclicCatalogError  # Raised when the catalog contains a prerequisite cycle
+from services.eligibility import eligibility_report, iter_student_completions  # Bulk eligibility of the students
+from utils import metrics  # Timings of the database and loader calls
+from services.semester_planner import plan_semesters, DEFAULT_MAX_PER_TERM  # Term by term plan to a course
+from services.batch_commands import run_batch, DEFAULT_WORKERS  # Headless JSON-lines commands
 
-# Function to print the course given as a parameter
-def display_course(course):
+
+# Maximum number of courses printed by a search.
+SEARCH_RESULTS_LIMIT = 20
+
+
+# Function to print the course detail document given as a parameter (see find_course_details).
+# The prerequisite names, the unlocked courses and the depth are stored in the document, so nothing else is read.
+def display_course(detail):
     print("------------------------------------------------------")
-    print(f"{course.number}, {course.name}")
-    # Check if the course has prerequisites and print them
-    if course.prerequisites:
-        print("Prerequisites: " + ", ".join(course.prerequisites))
+    print(f"{detail['number']}, {detail['name']}")
+    if detail["prerequisites"]:
+        print("Prerequisites:")
+        for prereq in detail["prerequisites"]:
+            print(f"  {prereq['number']}, {prereq['name'] or '(not in the catalog)'}")
+    if detail["dependents"]:
+        print(f"Unlocks {len(detail['dependents'])} courses: {', '.join(detail['dependents'])}")
+    if detail["depth"] is None:
+        print("Prerequisite depth: unknown (prerequisite cycle)")
+    else:
+        print(f"Prerequisite depth: {detail['depth']}")
     print("------------------------------------------------------")
 
 
+# Function to print the summary of one or more bulk insert results returned by insert_courses.
+def display_insert_stats(stats_list):
+    inserted = sum(stats["inserted"] for stats in stats_list)
+    failed = sum(stats["failed"] for stats in stats_list)
+    batches = sum(stats["batches"] for stats in stats_list)
+    print(f"Courses inserted: {inserted}, failed: {failed}, batches: {batches}")
+    # Print the errors reported for each failed batch.
+    for stats in stats_list:
+        for error in stats["errors"]:
+            print(f"Batch {error['batch']} failed documents: {error['failed']}: {'; '.join(error['messages'])}")
+
+
 # Function to display the menu for the user
 def display_menu_student():
     print("\n  1. Print Course List.")
@@ -41,6 +103,9 @@ def display_menu_student():
     print("  3. Add completed course")
     print("  4. Print Completed Courses.")
     print("  5. Check if can take a course.")
+    print("  13. Show the courses I can take now.")
+    print("  19. Search courses.")
+    print("  23. Plan the semesters to reach a course.")
     print("  20. Exit\n")
 
 
@@ -57,13 +122,23 @@ def display_menu_admin():
     print("  9. Load Data from JSON file.")
     print("  10. Convert CSV data file to JSON data file.")
     print("  11. Empty the data structure (MongoDB Courses Collection).")
+    print("  12. Check for duplicated courses and users.")
+    print("  13. Show the courses I can take now.")
+    print("  14. Synchronize the catalog with a CSV or JSON file.")
+    print("  15. Import completed courses from a CSV file.")
+    print("  16. Create users from a CSV file.")
+    print("  17. Convert a CSV or JSON data file to a binary snapshot file.")
+    print("  18. Load Data from a binary snapshot file.")
+    print("  19. Search courses.")
+    print("  21. Eligibility report of all the students.")
+    print("  22. Show the performance metrics.")
+    print("  23. Plan the semesters to reach a course.")
+    print("  24. Rebuild the course details.")
     print("  20. Exit\n")
 
 
 # Program starting point
 def main():
-    courses: list = []  # Define an empty list to hold the data loaded
-
     # User login stage
     print("Welcome to the course planner. Please login...")
     # Request username/email and password to access the system.
@@ -77,13 +152,16 @@ def main():
     if not logged_user.check_password(password):  # If password wrong, give a message and exit the application.
         print("Wrong password!")
         return
+    # Upgrade the stored password hash if it was made with an outdated work factor.
+    if logged_user.rehash_if_needed(password):
+        update_password_hash(logged_user.email, logged_user._password_hash)
 
     # Set the admin flag if the user is an admin.
     is_admin = False
     if logged_user.role == "admin":
         is_admin = True
 
-    # Main loop that prints the menu for the user and exit only when option 9 is chosen.
+    # Main loop that prints the menu for the user and exit only when option 20 is chosen.
     while True:
         if is_admin:
             display_menu_admin()
@@ -98,10 +176,13 @@ def main():
 
             # 1. Print Course List.
             case '1':
-                # Traverse the database courses collection and print the courses in ascending order.
+                # Traverse the course details in ascending order and print each course with the number of its
+                # prerequisites and of the courses it unlocks. The details are read lazily in batches, so printing
+                # starts immediately.
                 print("------------------------------------------------------")
-                for course in list_courses_sorted():
-                    print(f"{course.number}, {course.name}")
+                for detail in iter_course_details_sorted():
+                    print(f"{detail['number']}, {detail['name']} (prerequisites: {len(detail['prerequisites'])}, "
+                          f"unlocks: {len(detail['dependents'])})")
                 print("------------------------------------------------------")
 
             # 2. Print Course.
@@ -112,11 +193,11 @@ def main():
                 course_number = input("What course do you want to know about? ").strip().upper()
                 # Save the current time to be used to measure the search time.
                 start = time.time()
-                course = find_course_by_number(course_number)
+                detail = find_course_details(course_number)
                 elapsed = time.time() - start
-                # If the course is found, print it with description and prerequisites
-                if course:
-                    display_course(course)
+                # If the course is found, print it with description, prerequisites and unlocked courses
+                if detail:
+                    display_course(detail)
                 else:
                     print(f"Course number {course_number} not found.")
                 print(f"time: {elapsed:.6f} seconds")  # print the search time
@@ -132,7 +213,8 @@ def main():
                 # If the course is found, add it to the student courses list.
                 if course:
                     add_completed_course(logged_user.email, course_number)  # Add the course to the user in the database
-                    logged_user.completed_courses.append(course_number)  # Align current logged user
+                    if course_number not in logged_user.completed_courses:
+                        logged_user.completed_courses.append(course_number)  # Align current logged user
                     print(f"Course number {course_number} added.")
                 else:
                     print(f"Course number {course_number} not found.")
@@ -142,10 +224,12 @@ def main():
                 # Print the list of user completed courses.
                 if not logged_user.completed_courses:  # Check if there are completed courses.
                     print("No completed courses yet!")
-                # Traverse the completed courses list and print each single course.
-                for course_no in logged_user.completed_courses:
-                    course = find_course_by_number(course_no)
-                    print(f"{course.number}: {course.name}")
+                # Load all the completed courses with a single query and print each single course.
+                for course_no, course in find_courses_by_numbers(logged_user.completed_courses).items():
+                    if course:
+                        print(f"{course.number}: {course.name}")
+                    else:  # The course has been removed from the catalog after being completed.
+                        print(f"{course_no}: (no longer in the catalog)")
 
             # 5. Check if can take a course.
             case '5':
@@ -154,14 +238,17 @@ def main():
                 course = find_course_by_number(course_number)
                 # If the course exist, perform the checking.
                 if course:
-                    # Extract the missing prerequisites list
-                    missing_prereqs = [prereq for prereq in course.prerequisites
-                                       if prereq not in logged_user.completed_courses]
+                    # Extract the missing prerequisites list using a set for the completed courses lookups
+                    completed = set(logged_user.completed_courses)
+                    missing_prereqs = [prereq for prereq in course.prerequisites if prereq not in completed]
                     # Check if there are missing prerequisites and give user feedback
                     if not missing_prereqs:
                         print(f"You can take {course_number}.")
                     else:
-                        print(f"You cannot take {course_number}.")
+                        print(f"You cannot take {course_number}. Missing prerequisites:")
+                        # Load the missing prerequisites with a single query to print their names.
+                        for prereq_number, prereq in find_courses_by_numbers(missing_prereqs).items():
+                            print(f"  {prereq_number}, {prereq.name if prereq else '(not in the catalog)'}")
                 else:
                     print(f"Course number {course_number} not found.")
 
@@ -184,8 +271,8 @@ def main():
                     # Check if the user already exist.
                     if find_user_by_email(email) is None:
                         # Insert new user in the database
-                        insert_user(user)
-                        print("User correctly added!")
+                        if insert_user(user):
+                            print("User correctly added!")
                     else:
                         print("User already exist!")
                 else:
@@ -195,7 +282,8 @@ def main():
             case '7':
                 if is_admin:
                     # List the user present int the database collection.
-                    users = get_users_list()
+                    # The users are read lazily without the password hash.
+                    users = iter_users(fields=["name", "surname", "email", "role"])
                     for user in users:
                         name = user.get("name", "")
                         surname = user.get("surname", "")
@@ -212,12 +300,12 @@ def main():
                     file_name = input("File name: ").strip()
                     # Save the current time to be used for loading time measurement.
                     start = time.time()
-                    # Call the data loading function saving the output in the courses list.
-                    courses = load_courses_from_csv_file(file_name)
-                    # Cycle through each courses rows and insert each course inside the
-                    # MongoDB database courses collection.
-                    for course in courses:
-                        insert_course(course)
+                    # Stream the file in chunks of courses inserted inside the MongoDB database courses collection
+                    # using batched inserts, so the whole file is never kept in memory.
+                    report = stream_courses_from_csv_file(file_name, insert_courses, chunk_size=DEFAULT_BATCH_SIZE)
+                    display_insert_stats(report["results"])
+                    if report["unresolved"]:
+                        print(f"{len(report['unresolved'])} prerequisites are not defined as courses.")
                     elapsed = time.time() - start
                     print(f"time: {elapsed:.6f} seconds")  # print the loading time
                 else:
@@ -230,8 +318,12 @@ def main():
                     file_name = input("File name: ").strip()
                     # Save the current time to be used for loading time measurement.
                     start = time.time()
-                    # Call the data loading function saving the data directly into the database courses collection.
-                    load_courses_from_json_file(file_name, insert_course)
+                    # Parse the file one course at a time saving the data directly into the database courses
+                    # collection in batches, so the first courses are inserted while the file is still being read.
+                    report = stream_courses_from_json_file(file_name, insert_courses, chunk_size=DEFAULT_BATCH_SIZE)
+                    display_insert_stats(report["results"])
+                    if report["unresolved"]:
+                        print(f"{len(report['unresolved'])} prerequisites are not defined as courses.")
                     elapsed = time.time() - start
                     print(f"time: {elapsed:.6f} seconds")  # print the loading time
                 else:
@@ -245,7 +337,7 @@ def main():
                     json_file_name = input("JSON File name: ").strip()
                     # Save the current time to be used for loading time measurement.
                     start = time.time()
-                    # Call the file conversion function.
+                    # Call the file conversion function, the CSV chunks are converted on all the cores.
                     csv_to_json_courses(csv_file_name, json_file_name)
                     elapsed = time.time() - start
                     print(f"time: {elapsed:.6f} seconds")  # print the loading time
@@ -260,6 +352,242 @@ def main():
                 else:
                     print("You need admin role to use this function!!")
 
+            # 12. Check for duplicated courses and users.
+            case '12':
+                if is_admin:
+                    # Report the duplicated documents that stop the creation of the unique indexes.
+                    duplicated_courses = find_duplicate_courses()
+                    duplicated_users = find_duplicate_users()
+                    for dup in duplicated_courses:
+                        print(f"Course {dup['value']} stored {dup['count']} times.")
+                    for dup in duplicated_users:
+                        print(f"User {dup['value']} stored {dup['count']} times.")
+                    if not duplicated_courses and not duplicated_users:
+                        print("No duplicates found.")
+                    # Duplicated courses can be safely removed, duplicated users must be checked manually.
+                    if duplicated_courses and input("Remove the duplicated courses? [y/n] ").strip().lower() == "y":
+                        print(f"{dedupe_courses()} duplicated courses deleted.")
+                        # Now the unique indexes can be created.
+                        if ensure_indexes():
+                            print("Indexes created.")
+                else:
+                    print("You need admin role to use this function!!")
+
+            # 13. Show the courses I can take now.
+            case '13':
+                # Use the prerequisite graph to find all the courses whose prerequisites are completed.
+                try:
+                    graph = get_prerequisite_graph()
+                except CyclicCatalogError as e:
+                    print(f"The catalog is not valid: {e}")
+                    continue
+                eligible = graph.eligible_courses(logged_user.completed_courses)
+                if not eligible:
+                    print("No courses available.")
+                print("------------------------------------------------------")
+                for course_no in eligible:
+                    print(f"{course_no}, {graph.names[graph.index[course_no]]}")
+                print("------------------------------------------------------")
+
+            # 14. Synchronize the catalog with a CSV or JSON file.
+            case '14':
+                if is_admin:
+                    file_name = input("File name: ").strip()
+                    dry_run = input("Only show the differences (dry run)? [y/n] ").strip().lower() == "y"
+                    start = time.time()
+                    # Compare the file with the stored catalog and write only the changed courses.
+                    report = sync_catalog_from_file(file_name, sync_catalog, dry_run=dry_run)
+                    elapsed = time.time() - start
+                    if report is not None:
+                        for label in ("added", "updated", "removed"):
+                            numbers = report[label]
+                            print(f"{label.capitalize()}: {len(numbers)} {', '.join(numbers[:20])}"
+                                  f"{' ...' if len(numbers) > 20 else ''}")
+                        print(f"Unchanged: {report['unchanged']}")
+                        if report["unresolved"]:
+                            print(f"{len(report['unresolved'])} prerequisites are not defined as courses.")
+                        if not dry_run:
+                            print(f"Documents written: {report['written']}")
+                    print(f"time: {elapsed:.6f} seconds")  # print the synchronization time
+                else:
+                    print("You need admin role to use this function!!")
+
+            # 15. Import completed courses from a CSV file.
+            case '15':
+                if is_admin:
+                    # The file contains one "email,course number" row for each completed course.
+                    file_name = input("File name: ").strip()
+                    start = time.time()
+                    report = import_completions_from_csv(file_name, add_completed_courses_bulk)
+                    elapsed = time.time() - start
+                    if report is not None:
+                        print(f"Completions: {report['completions']}, users: {report['users']}, "
+                              f"users updated: {report['modified']}")
+                        if report["unknown_users"]:
+                            print(f"Unknown users: {', '.join(report['unknown_users'])}")
+                        if report["unknown_courses"]:
+                            print(f"Unknown courses skipped: {', '.join(report['unknown_courses'])}")
+                    print(f"time: {elapsed:.6f} seconds")  # print the import time
+                else:
+                    print("You need admin role to use this function!!")
+
+            # 16. Create users from a CSV file.
+            case '16':
+                if is_admin:
+                    # The file contains one "name,surname,email,password,role" row for each user.
+                    file_name = input("File name: ").strip()
+                    start = time.time()
+                    # The passwords are hashed in parallel and the users inserted in batches.
+                    stats = insert_users(User.create_many(load_user_rows_from_csv(file_name)))
+                    elapsed = time.time() - start
+                    print(f"Users added: {stats['inserted']}")
+                    if stats["rejected"]:
+                        print(f"Users already existing: {', '.join(stats['rejected'])}")
+                    print(f"time: {elapsed:.6f} seconds")  # print the creation time
+                else:
+                    print("You need admin role to use this function!!")
+
+            # 17. Convert a CSV or JSON data file to a binary snapshot file.
+            case '17':
+                if is_admin:
+                    source_file_name = input("CSV or JSON File name: ").strip()
+                    snapshot_file_name = input("Snapshot File name: ").strip()
+                    start = time.time()
+                    if convert_to_snapshot(source_file_name, snapshot_file_name):
+                        print("Snapshot written.")
+                    elapsed = time.time() - start
+                    print(f"time: {elapsed:.6f} seconds")  # print the conversion time
+                else:
+                    print("You need admin role to use this function!!")
+
+            # 18. Load Data from a binary snapshot file.
+            case '18':
+                if is_admin:
+                    file_name = input("File name: ").strip()
+                    start = time.time()
+                    # The snapshot is read in place with mmap and inserted in batches.
+                    report = load_courses_from_snapshot(file_name, insert_courses, chunk_size=DEFAULT_BATCH_SIZE)
+                    display_insert_stats(report["results"])
+                    if report["unresolved"]:
+                        print(f"{len(report['unresolved'])} prerequisites are not defined as courses.")
+                    elapsed = time.time() - start
+                    print(f"time: {elapsed:.6f} seconds")  # print the loading time
+                else:
+                    print("You need admin role to use this function!!")
+
+            # 19. Search courses.
+            case '19':
+                print("  1. Course numbers starting with.")
+                print("  2. Course numbers between.")
+                print("  3. Words in the course name.")
+                search_type = input("How do you want to search? ").strip()
+                if search_type == '1':
+                    prefix = input("Course number prefix: ").strip().upper()
+                    start = time.perf_counter()
+                    results = find_courses_by_prefix(prefix, limit=SEARCH_RESULTS_LIMIT)
+                elif search_type == '2':
+                    low = input("From course number: ").strip().upper()
+                    high = input("To course number: ").strip().upper()
+                    start = time.perf_counter()
+                    results = find_courses_in_range(low, high, limit=SEARCH_RESULTS_LIMIT)
+                elif search_type == '3':
+                    query = input("Words to search: ").strip()
+                    start = time.perf_counter()
+                    results = search_courses(query, k=SEARCH_RESULTS_LIMIT)
+                else:
+                    print(f"{search_type} is not a valid option.")
+                    continue
+                elapsed = time.perf_counter() - start
+                if not results:
+                    print("No courses found.")
+                print("------------------------------------------------------")
+                for course_no, course_name in results:
+                    print(f"{course_no}, {course_name}")
+                print("------------------------------------------------------")
+                print(f"time: {elapsed * 1000:.3f} ms")  # print the search time (the first search builds the index)
+
+            # 21. Eligibility report of all the students.
+            case '21':
+                if is_admin:
+                    pairs_file_name = input("Eligible students CSV File name (empty to skip): ").strip()
+                    summary_file_name = input("Summary CSV File name (empty to print it): ").strip()
+                    try:
+                        graph = get_prerequisite_graph()
+                    except CyclicCatalogError as e:
+                        print(f"The catalog is not valid: {e}")
+                        continue
+                    start = time.time()
+                    # The students are evaluated in shards by a pool of processes, one per core.
+                    report = eligibility_report(iter_student_completions(), graph,
+                                                csv_path=pairs_file_name or None,
+                                                summary_path=summary_file_name or None, workers=0)
+                    elapsed = time.time() - start
+                    if not summary_file_name:
+                        print("------------------------------------------------------")
+                        for course_no, count in report["counts"].items():
+                            print(f"{course_no}, {graph.names[graph.index[course_no]]}: {count} students")
+                        print("------------------------------------------------------")
+                    print(f"Students: {report['students']}, eligible pairs: {report['pairs']}")
+                    print(f"time: {elapsed:.6f} seconds")  # print the report time
+                else:
+                    print("You need admin role to use this function!!")
+
+            # 22. Show the performance metrics.
+            case '22':
+                if is_admin:
+                    if not metrics.is_enabled():
+                        print("The metrics are not collected, start the program with --metrics FILE or ABCU_METRICS=1.")
+                        continue
+                    print("------------------------------------------------------")
+                    print(metrics.format_table())
+                    print("------------------------------------------------------")
+                else:
+                    print("You need admin role to use this function!!")
+
+            # 23. Plan the semesters to reach a course.
+            case '23':
+                targets = input("What courses do you want to reach (separated by commas)? ").upper().replace(",", " ")
+                max_per_term = input(f"Maximum courses per term [{DEFAULT_MAX_PER_TERM}]: ").strip()
+                if max_per_term and (not max_per_term.isdigit() or int(max_per_term) < 1):
+                    print(f"{max_per_term} is not a valid number of courses.")
+                    continue
+                try:
+                    graph = get_prerequisite_graph()
+                except CyclicCatalogError as e:
+                    print(f"The catalog is not valid: {e}")
+                    continue
+                start = time.time()
+                plan = plan_semesters(graph, logged_user.completed_courses, targets.split(),
+                                      int(max_per_term) if max_per_term else DEFAULT_MAX_PER_TERM)
+                elapsed = time.time() - start
+                for course_no in plan["unknown"]:
+                    print(f"Course {course_no} not found.")
+                for course_no in plan["completed"]:
+                    print(f"Course {course_no} already completed.")
+                for course_no, missing in plan["blocked"].items():
+                    print(f"Course {course_no} can not be planned, missing prerequisites: {', '.join(missing)}")
+                if plan["terms"]:
+                    print("------------------------------------------------------")
+                    for term_no, term in enumerate(plan["terms"], start=1):
+                        print(f"Term {term_no}:")
+                        for course_no in term:
+                            print(f"    {course_no}, {graph.names[graph.index[course_no]]}")
+                    print("------------------------------------------------------")
+                    print(f"Terms needed: {len(plan['terms'])}")
+                print(f"time: {elapsed:.6f} seconds")  # print the planning time
+
+            # 24. Rebuild the course details.
+            case '24':
+                if is_admin:
+                    # The details are kept up to date by the loaders, this rebuilds them after a failed load
+                    # or a change made directly on the database.
+                    start = time.time()
+                    written = rebuild_course_details()
+                    print(f"Course details written: {written}")
+                    print(f"time: {time.time() - start:.6f} seconds")
+                else:
+                    print("You need admin role to use this function!!")
+
             # 20. Exit
             case '20':
                 print("Thank you for using the course planner!")
@@ -270,5 +598,95 @@ def main():
                 print(f"{choice} is not a valid option.")
 
 
+# Convert a CSV or JSON data file (chosen by the file extension) to a binary snapshot file.
+def convert_to_snapshot(source_file_name: str, snapshot_file_name: str) -> bool:
+    if source_file_name.lower().endswith(".json"):
+        return json_to_snapshot(source_file_name, snapshot_file_name)
+    return csv_to_snapshot(source_file_name, snapshot_file_name)
+
+
+# Parse the command line arguments. Without a command the interactive course planner is started.
+def parse_arguments(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ABCU course planner.")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="Collect the timings of the database and loader calls and write them to FILE at the end "
+                             "(Prometheus text format for .prom files, JSON otherwise).")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="Profile the command with cProfile, save the statistics to FILE and print the slowest "
+                             "functions.")
+    commands = parser.add_subparsers(dest="command")
+    # Offline commands: they run without login and without connecting to the database.
+    convert = commands.add_parser("convert", help="Convert a CSV data file to a JSON data file.")
+    convert.add_argument("csv_file", help="CSV courses file to read.")
+    convert.add_argument("json_file", help="JSON courses file to write.")
+    convert.add_argument("--compact", action="store_true", help="Write the JSON without spaces and new lines.")
+    convert.add_argument("--workers", type=int, default=0,
+                         help="Maximum number of processes converting the CSV chunks (default: one per core, "
+                              "a small file is converted without processes).")
+    snapshot = commands.add_parser("snapshot", help="Convert a CSV or JSON data file to a binary snapshot file.")
+    snapshot.add_argument("source_file", help="CSV or JSON courses file to read.")
+    snapshot.add_argument("snapshot_file", help="Snapshot file to write.")
+    # Headless mode: the login credentials are read from the ABCU_EMAIL and ABCU_PASSWORD variables.
+    batch = commands.add_parser("batch", help="Run JSON-lines commands (lookup, list, add_completion, eligibility, "
+                                              "load, convert) without the menu, one JSON result line each.")
+    batch.add_argument("input_file", nargs="?", default="-", help="Commands file to read (default: - for stdin).")
+    batch.add_argument("--output", default="-", help="Results file to write (default: - for stdout).")
+    batch.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                       help=f"Threads running the read commands (default: {DEFAULT_WORKERS}).")
+    batch.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                       help=f"Consecutive commands grouped in one database call (default: {DEFAULT_BATCH_SIZE}).")
+    arguments = parser.parse_args(argv)
+    if arguments.command == "batch" and (arguments.workers < 1 or arguments.batch_size < 1):
+        batch.error("--workers and --batch-size must be greater than zero.")
+    return arguments
+
+
+# Run the JSON-lines commands of the batch mode as the user of the ABCU_EMAIL and ABCU_PASSWORD variables.
+# Only the results are written to the output, the messages go to stderr. Exits with 1 when the login fails.
+def run_batch_commands(arguments: argparse.Namespace) -> None:
+    email = os.getenv("ABCU_EMAIL", "").strip()
+    password = os.getenv("ABCU_PASSWORD", "")
+    logged_user = find_user_by_email(email) if email else None
+    if logged_user is None or not logged_user.check_password(password):
+        print("Login failed: set ABCU_EMAIL and ABCU_PASSWORD to the credentials of a user.", file=sys.stderr)
+        raise SystemExit(1)
+    if logged_user.rehash_if_needed(password):
+        update_password_hash(logged_user.email, logged_user._password_hash)
+    input_file = sys.stdin if arguments.input_file == "-" else open(arguments.input_file, encoding="utf-8")
+    output_file = sys.stdout if arguments.output == "-" else open(arguments.output, "w", encoding="utf-8")
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            summary = run_batch(input_file, output_file, logged_user, workers=arguments.workers,
+                                batch_size=arguments.batch_size)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+    print(f"{summary['commands']} commands ({summary['ok']} ok, {summary['errors']} errors) in {summary['groups']} "
+          f"groups, {summary['elapsed']:.3f} seconds", file=sys.stderr)
+
+
+# Run the command given on the command line, or the interactive course planner without a command.
+def run_command(arguments: argparse.Namespace) -> None:
+    if arguments.command == "convert":
+        csv_to_json_courses(arguments.csv_file, arguments.json_file, compact=arguments.compact,
+                            workers=arguments.workers)
+    elif arguments.command == "snapshot":
+        convert_to_snapshot(arguments.source_file, arguments.snapshot_file)
+    elif arguments.command == "batch":
+        run_batch_commands(arguments)
+    else:
+        main()
+
+
 if __name__ == "__main__":
-    main()
+    arguments = parse_arguments()
+    if arguments.metrics:
+        metrics.enable()
+    try:
+        with metrics.profile(arguments.profile) if arguments.profile else contextlib.nullcontext():
+            run_command(arguments)
+    finally:
+        if arguments.metrics:
+            metrics.write_metrics(arguments.metrics)
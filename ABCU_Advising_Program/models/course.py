@@ -10,15 +10,44 @@
 
 # Modules imports
 from dataclasses import dataclass  # Import dataclass decorator
-from dataclasses import field  # Import the field function
+import hashlib  # Used to compute the course content hash
+import json  # Used to serialize the course fields before hashing
+import sys  # Used to intern the course number strings
+
+
+# Return the interned copy of a string, so equal course numbers share the same object in memory.
+def intern_number(value):
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 # Class to define the Course data structure
 # The @dataclass decorator automatically adds boilerplate code like the constructor,
 # string representation, and equality comparison.
-@dataclass
+# The courses are frozen and use __slots__ instead of a per-instance __dict__, so a catalog with millions
+# of courses takes a fraction of the memory. A course is changed by creating a new one (dataclasses.replace).
+@dataclass(frozen=True, slots=True)
 class Course:
     number: str = ''  # Course number like: 'CS499'
     name: str = ''  # Course name like: 'Computer Science Capstone'
-    # Define a list of strings and ensure that a new empty value is still list.
-    prerequisites: list[str] = field(default_factory=list)
+    # Tuple of prerequisite course numbers, any iterable given to the constructor is converted to a tuple.
+    prerequisites: tuple[str, ...] = ()
+
+    def __post_init__(self):
+        # The course numbers are repeated in the prerequisites of many courses, interning them
+        # keeps a single copy of each one. The class is frozen, so object.__setattr__ is used.
+        object.__setattr__(self, "number", intern_number(self.number))
+        object.__setattr__(self, "prerequisites", tuple(intern_number(prereq) for prereq in self.prerequisites))
+
+    # Return the course as a dictionary with the prerequisites as a list, used to store it.
+    def to_dict(self) -> dict:
+        return {"number": self.number, "name": self.name, "prerequisites": list(self.prerequisites)}
+
+    @classmethod
+    # Create a course from a stored dictionary, the keys that are not course fields (like _id) are ignored.
+    def from_dict(cls, data: dict) -> "Course":
+        return cls(data["number"], data.get("name", ""), data.get("prerequisites", ()))
+
+    # Return a hash of the course content, used to find the courses that changed between two catalog versions.
+    def content_hash(self) -> str:
+        content = json.dumps([self.number, self.name, list(self.prerequisites)], separators=(",", ":"))
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
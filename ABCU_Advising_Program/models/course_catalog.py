@@ -0,0 +1,129 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          course_catalog.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Compact read-only course catalog for bulk in-memory work on
+#               very large catalogs. The courses are stored in columns of
+#               arrays and UTF-8 buffers instead of one object per course.
+# ============================================================================
+
+
+# Modules imports
+from array import array  # Compact arrays of machine integers
+from bisect import bisect_left  # Binary search on the sorted index
+from models.course import Course  # Import the Course class
+
+
+# List of strings stored as one UTF-8 buffer and the offsets of each string inside it.
+# A string costs its encoded length plus 8 bytes instead of a full Python object.
+class StringTable:
+
+    def __init__(self, strings=()):
+        self.data = bytearray()
+        self.offsets = array("q", [0])  # The string i is data[offsets[i]:offsets[i + 1]]
+        for string in strings:
+            self.append(string)
+
+    def append(self, string: str) -> None:
+        self.data += string.encode("utf-8")
+        self.offsets.append(len(self.data))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self.data[self.offsets[i]:self.offsets[i + 1]].decode("utf-8")
+
+
+# Read-only catalog of courses stored by columns.
+# Each course has a row number (its insertion order). The prerequisites of all the courses are kept in a single
+# array: the prerequisites of the course in row r are prereq_ids[prereq_start[r]:prereq_start[r + 1]].
+# A prerequisite id lower than the number of courses is the row of that course, the higher ids are the
+# prerequisites that are not defined as courses and their numbers are kept at the end of the numbers table.
+# The Course objects are created only when a course is read.
+class CourseCatalog:
+
+    def __init__(self, courses=()):
+        first_ids: dict[str, int] = {}  # Course number -> id in order of appearance, used only while building
+        first_numbers: list[str] = []  # id -> course number
+        id_rows: list[int] = []  # id -> row of the course or -1 when the number is only a prerequisite
+        row_ids = array("i")  # row -> id of the course number
+        raw_prereqs = array("i")  # Prerequisite ids, mapped to the final ids at the end
+        self.names = StringTable()  # row -> course name
+        self.prereq_start = array("q", [0])
+        self.duplicates = 0  # Courses skipped because their number was already in the catalog
+
+        # Return the id of a course number, adding it the first time it is seen.
+        def id_of(number: str) -> int:
+            number_id = first_ids.get(number)
+            if number_id is None:
+                number_id = first_ids[number] = len(first_numbers)
+                first_numbers.append(number)
+                id_rows.append(-1)
+            return number_id
+
+        for course in courses:
+            number_id = id_of(course.number)
+            if id_rows[number_id] >= 0:  # Only the first definition of a course is used
+                self.duplicates += 1
+                continue
+            id_rows[number_id] = len(row_ids)
+            row_ids.append(number_id)
+            self.names.append(course.name)
+            raw_prereqs.extend(id_of(prereq) for prereq in course.prerequisites)
+            self.prereq_start.append(len(raw_prereqs))
+
+        # Renumber the ids so the courses have the ids of their rows and the unknown prerequisites follow them.
+        size = len(row_ids)
+        final_ids = array("i", id_rows)
+        unresolved = [number_id for number_id, row in enumerate(id_rows) if row < 0]
+        for position, number_id in enumerate(unresolved):
+            final_ids[number_id] = size + position
+        self.prereq_ids = array("i", (final_ids[number_id] for number_id in raw_prereqs))
+        ordered_numbers = [first_numbers[number_id] for number_id in row_ids]
+        self.numbers = StringTable(ordered_numbers + [first_numbers[number_id] for number_id in unresolved])
+        # Rows sorted by course number, used to find a course with a binary search.
+        self.sorted_rows = array("i", sorted(range(size), key=ordered_numbers.__getitem__))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, course_number: str) -> bool:
+        return self.row_of(course_number) >= 0
+
+    # Iterate the courses in insertion order.
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self.course_at(row)
+
+    # Iterate the courses sorted by number.
+    def iter_sorted(self):
+        for row in self.sorted_rows:
+            yield self.course_at(row)
+
+    # Return the row of the course with the given number or -1 when it is not in the catalog.
+    def row_of(self, course_number: str) -> int:
+        position = bisect_left(self.sorted_rows, course_number, key=self.numbers.__getitem__)
+        if position < len(self.sorted_rows) and self.numbers[self.sorted_rows[position]] == course_number:
+            return self.sorted_rows[position]
+        return -1
+
+    # Return the prerequisite ids of the course in the given row without creating any object.
+    def prerequisite_ids(self, row: int) -> array:
+        return self.prereq_ids[self.prereq_start[row]:self.prereq_start[row + 1]]
+
+    # Return the course stored in the given row.
+    def course_at(self, row: int) -> Course:
+        return Course(self.numbers[row], self.names[row],
+                      tuple(self.numbers[p] for p in self.prerequisite_ids(row)))
+
+    # Return the course with the given number or None when it is not in the catalog.
+    def get(self, course_number: str) -> Course | None:
+        row = self.row_of(course_number)
+        return self.course_at(row) if row >= 0 else None
+
+    # Return the course numbers used as prerequisites that are not defined as courses.
+    def unresolved(self) -> list[str]:
+        return sorted(self.numbers[i] for i in range(len(self), len(self.numbers)))
@@ -0,0 +1,172 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          prereq_graph.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Prerequisite graph built once from the course catalog to answer
+#               eligibility, transitive prerequisites and unlocked courses
+#               queries without scanning the catalog.
+# ============================================================================
+
+
+# Modules imports
+from models.course import Course  # Import the Course class
+
+
+# Error raised when the catalog prerequisites contain a cycle, so no course of the cycle could ever be taken.
+class CyclicCatalogError(ValueError):
+    def __init__(self, cycle: list[str]):
+        self.cycle = cycle  # Course numbers of the cycle, the first one is repeated at the end
+        super().__init__("Prerequisite cycle found: " + " -> ".join(cycle))
+
+
+# Directed acyclic graph of the courses where each course points to its prerequisites.
+# Each course number is mapped to an integer index and the edges are stored as lists of indexes.
+class PrerequisiteGraph:
+
+    def __init__(self, courses: list[Course]):
+        self.numbers: list[str] = []  # index -> course number
+        self.names: list[str] = []  # index -> course name
+        self.index: dict[str, int] = {}  # course number -> index
+        raw_prereqs: list = []
+
+        for course in courses:
+            if course.number in self.index:  # Only the first definition of a course is used
+                continue
+            self.index[course.number] = len(self.numbers)
+            self.numbers.append(course.number)
+            self.names.append(course.name)
+            raw_prereqs.append(course.prerequisites)
+
+        # Direct prerequisites and direct dependents (the courses unlocked) of each course.
+        # Prerequisites that are not in the catalog are kept apart because they can not be part of the graph.
+        self.prereqs: list[tuple[int, ...]] = []
+        self.dependents: list[list[int]] = [[] for _ in self.numbers]
+        self.unknown_prereqs: dict[int, tuple[str, ...]] = {}
+        for i, prereqs in enumerate(raw_prereqs):
+            known = tuple(dict.fromkeys(self.index[p] for p in prereqs if p in self.index))
+            self.prereqs.append(known)
+            for p in known:
+                self.dependents[p].append(i)
+            unknown = tuple(p for p in prereqs if p not in self.index)
+            if unknown:
+                self.unknown_prereqs[i] = unknown
+
+        # Courses without prerequisites, always eligible unless already completed.
+        self.roots: list[int] = [i for i, prereqs in enumerate(self.prereqs) if not prereqs]
+        self._root_set: frozenset[int] = frozenset(self.roots)
+        # Position of each course in the sorted list of course numbers, used to sort the results quickly.
+        self._rank: list[int] = [0] * len(self.numbers)
+        for position, i in enumerate(sorted(range(len(self.numbers)), key=self.numbers.__getitem__)):
+            self._rank[i] = position
+
+        self.order: list[int] = self._topological_sort()  # Each course comes after all its prerequisites
+        # Length of the longest prerequisite chain before each course (0 for the roots).
+        self.depths: list[int] = [0] * len(self.numbers)
+        for i in self.order:
+            if self.prereqs[i]:
+                self.depths[i] = 1 + max(self.depths[p] for p in self.prereqs[i])
+
+        # Memoized transitive closures, filled on request.
+        self._ancestors: dict[int, frozenset[int]] = {}
+        self._descendants: dict[int, frozenset[int]] = {}
+
+    # Sort the courses with the Kahn algorithm raising CyclicCatalogError if a cycle is found.
+    def _topological_sort(self) -> list[int]:
+        missing = [len(prereqs) for prereqs in self.prereqs]  # Prerequisites not yet placed
+        order = list(self.roots)
+        for i in order:  # The list grows while it is traversed
+            for dep in self.dependents[i]:
+                missing[dep] -= 1
+                if missing[dep] == 0:
+                    order.append(dep)
+        if len(order) < len(self.numbers):
+            raise CyclicCatalogError(self._find_cycle(missing))
+        return order
+
+    # Return one of the cycles among the courses that the topological sort could not place.
+    def _find_cycle(self, missing: list[int]) -> list[str]:
+        # Every unplaced course has at least one unplaced prerequisite, so walking the unplaced
+        # prerequisites must eventually visit a course twice.
+        current = next(i for i, count in enumerate(missing) if count > 0)
+        visited: dict[int, int] = {}  # course index -> position in the path
+        path: list[int] = []
+        while current not in visited:
+            visited[current] = len(path)
+            path.append(current)
+            current = next(p for p in self.prereqs[current] if missing[p] > 0)
+        cycle = path[visited[current]:] + [current]
+        # The path follows the prerequisites, reverse it to show the course order.
+        return [self.numbers[i] for i in reversed(cycle)]
+
+    # Compute the closure of the given course following the edges lists, reusing the memoized closures.
+    @staticmethod
+    def _closure(start: int, edges, memo: dict) -> frozenset[int]:
+        if start in memo:
+            return memo[start]
+        # Iterative post-order visit so that very deep chains do not hit the recursion limit.
+        stack = [(start, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in memo:
+                continue
+            if expanded:
+                reached = set()
+                for nxt in edges[node]:
+                    reached.add(nxt)
+                    reached |= memo[nxt]
+                memo[node] = frozenset(reached)
+            else:
+                stack.append((node, True))
+                stack.extend((nxt, False) for nxt in edges[node] if nxt not in memo)
+        return memo[start]
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def __contains__(self, course_number: str) -> bool:
+        return course_number in self.index
+
+    # Return the course numbers in topological order (prerequisites first).
+    def topological_order(self) -> list[str]:
+        return [self.numbers[i] for i in self.order]
+
+    # Return the length of the longest prerequisite chain that leads to the course.
+    def depth(self, course_number: str) -> int:
+        return self.depths[self.index[course_number]]
+
+    # Return the prerequisites of the course, all the transitive ones when transitive is True.
+    def prerequisites_of(self, course_number: str, transitive: bool = True) -> set[str]:
+        i = self.index[course_number]
+        ids = self._closure(i, self.prereqs, self._ancestors) if transitive else self.prereqs[i]
+        return {self.numbers[p] for p in ids}
+
+    # Return the indexes of all the transitive prerequisites of the course with the given index (memoized).
+    def ancestor_ids(self, i: int) -> frozenset[int]:
+        return self._closure(i, self.prereqs, self._ancestors)
+
+    # Return the courses that have the given course as prerequisite, all the transitive ones when transitive is True.
+    def unlocks(self, course_number: str, transitive: bool = False) -> set[str]:
+        i = self.index[course_number]
+        ids = self._closure(i, self.dependents, self._descendants) if transitive else self.dependents[i]
+        return {self.numbers[d] for d in ids}
+
+    # Return the sorted course numbers that can be taken now: not completed and with all the prerequisites completed.
+    def eligible_courses(self, completed_courses) -> list[str]:
+        done = {self.index[number] for number in completed_courses if number in self.index}
+        eligible = list(self._root_set - done)
+        # Count how many prerequisites of each dependent course are completed.
+        satisfied: dict[int, int] = {}
+        for i in done:
+            for dep in self.dependents[i]:
+                satisfied[dep] = satisfied.get(dep, 0) + 1
+        eligible.extend(dep for dep, count in satisfied.items()
+                        if count == len(self.prereqs[dep]) and dep not in done)
+        # Prerequisites that are not in the catalog must have been completed anyway.
+        if self.unknown_prereqs:
+            completed = set(completed_courses)
+            eligible = [i for i in eligible
+                        if all(p in completed for p in self.unknown_prereqs.get(i, ()))]
+        eligible.sort(key=self._rank.__getitem__)
+        return [self.numbers[i] for i in eligible]
@@ -12,8 +12,13 @@
 # Modules imports
 from dataclasses import dataclass, field  # Import dataclass decorator
 from typing import Literal  # To restrict user role typing
-import bcrypt  # To hash the user password for safe storage in the database
+from utils.password_hashing import (hash_password,
+                                    hash_passwords,
+                                    submit_hash,
+                                    submit_verify,
+                                    needs_rehash)  # bcrypt hashing for safe storage of the password in the database
 from models.course import Course  # Import the Course class
+from utils.metrics import timed  # Timing registry of the password checks (collected when ABCU_METRICS=1)
 
 
 # User class definition with attributes and methods
@@ -31,17 +36,41 @@ class User:
 
     @classmethod
     # Create a new user object by filling the user data
+    @timed()
     def create(cls, name: str, surname: str, email: str, password: str, role: str = "student"):
         # Hash password using bcrypt
-        password_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt())
+        password_hash = hash_password(password)
         return cls(name, surname, email, password_hash, role)
 
+    @classmethod
+    # Create many user objects from (name, surname, email, password, role) rows hashing the passwords in parallel.
+    @timed(rows=len)
+    def create_many(cls, rows) -> list["User"]:
+        rows = list(rows)
+        password_hashes = hash_passwords(row[3] for row in rows)
+        return [cls(name, surname, email, password_hash, role)
+                for (name, surname, email, _, role), password_hash in zip(rows, password_hashes)]
+
     # Check user password for access
+    # The bcrypt work runs on the bounded password hashing pool (shared with services.async_api), so the
+    # interactive and batch logins never hash on the calling thread and are limited like the other checks.
+    @timed()
     def check_password(self, password: str) -> bool:
         # Verify if the given password of the current user object is valid by using hashing algorithm.
-        return bcrypt.checkpw(password.encode(), self._password_hash)
+        return submit_verify(password, self._password_hash).result()
+
+    # Replace the password hash when it was made with an outdated work factor. It must be called only after
+    # check_password succeeded with the same password. Returns True when the hash changed and must be saved.
+    @timed()
+    def rehash_if_needed(self, password: str) -> bool:
+        if not needs_rehash(self._password_hash):
+            return False
+        self._password_hash = submit_hash(password).result()
+        return True
 
     # Check if the given course can be taken by the student
     def can_take_course(self, course: Course) -> bool:
         # Return true if all the passed course prerequisite are present in the user completed courses list.
-        return all(prereq in self.completed_courses for prereq in course.prerequisites)
\ No newline at end of file
+        # The completed courses are converted to a set so each prerequisite check does not scan the list.
+        completed = set(self.completed_courses)
+        return all(prereq in completed for prereq in course.prerequisites)
\ No newline at end of file
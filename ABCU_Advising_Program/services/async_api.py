@@ -0,0 +1,222 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          async_api.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   asyncio version of the database API, used to serve many
+#               advising sessions concurrently from a single process.
+# ============================================================================
+
+
+# Modules imports
+import asyncio  # Event loop integration
+import functools  # Used to bind the arguments of the functions run in the thread pool
+import os  # OS tools
+from itertools import islice  # Used to read the generators one batch at a time
+from concurrent.futures import ThreadPoolExecutor  # Pool running the blocking calls
+from models.course import Course  # Import the Course class
+from models.user import User  # Import the User class definition
+from models.prereq_graph import PrerequisiteGraph  # Graph of the course prerequisites
+from services import mdb_api  # Blocking database API shared by the coroutines
+from utils.password_hashing import submit_hash, submit_verify  # bcrypt work on the password hashing pool
+
+
+# The storage calls block, so they run on a bounded pool of threads while the
+# event loop keeps serving the other sessions. ASYNC_API_WORKERS sets the number of threads.
+_executor = ThreadPoolExecutor(max_workers=int(os.getenv("ASYNC_API_WORKERS", "32")),
+                               thread_name_prefix="async_api")
+
+
+# Run a blocking function on the thread pool and wait for its result without blocking the event loop.
+async def _run(function, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(function, *args, **kwargs))
+
+
+# Use other collections, for example an in-memory stand-in like mongomock for tests.
+async def use_collections(courses_collection, users_collection) -> None:
+    await _run(mdb_api.use_collections, courses_collection, users_collection)
+
+
+# Use another storage backend, for example a MemoryBackend for tests.
+async def use_backend(backend) -> None:
+    await _run(mdb_api.use_backend, backend)
+
+
+# Courses coroutines: same arguments and results of the mdb_api functions with the same name.
+
+async def ensure_indexes() -> bool:
+    return await _run(mdb_api.ensure_indexes)
+
+
+async def find_duplicate_courses() -> list[dict]:
+    return await _run(mdb_api.find_duplicate_courses)
+
+
+async def find_duplicate_users() -> list[dict]:
+    return await _run(mdb_api.find_duplicate_users)
+
+
+async def dedupe_courses() -> int:
+    return await _run(mdb_api.dedupe_courses)
+
+
+async def insert_course(course: Course) -> bool:
+    return await _run(mdb_api.insert_course, course)
+
+
+# The courses iterable is consumed on the thread pool, so it can also be a generator reading a file.
+async def insert_courses(courses, batch_size: int = mdb_api.DEFAULT_BATCH_SIZE) -> dict:
+    return await _run(mdb_api.insert_courses, courses, batch_size)
+
+
+async def find_course_by_number(course_number: str) -> Course | None:
+    return await _run(mdb_api.find_course_by_number, course_number)
+
+
+async def find_courses_by_numbers(course_numbers) -> dict[str, Course | None]:
+    return await _run(mdb_api.find_courses_by_numbers, list(course_numbers))
+
+
+async def list_courses_sorted() -> list[Course]:
+    return await _run(mdb_api.list_courses_sorted)
+
+
+async def get_courses_page(page_size: int = mdb_api.DEFAULT_PAGE_SIZE, after: str | None = None,
+                           fields: list[str] | None = None) -> tuple[list, str | None]:
+    return await _run(mdb_api.get_courses_page, page_size, after, fields)
+
+
+# Asynchronous generator over the courses sorted by number, read one page at a time.
+async def iter_courses_sorted(after: str | None = None, fields: list[str] | None = None,
+                              page_size: int = mdb_api.DEFAULT_PAGE_SIZE):
+    while True:
+        page, after = await get_courses_page(page_size, after, fields)
+        for course in page:
+            yield course
+        if after is None:
+            return
+
+
+async def sync_catalog(courses, dry_run: bool = False) -> dict:
+    return await _run(mdb_api.sync_catalog, courses, dry_run)
+
+
+async def get_prerequisite_graph() -> PrerequisiteGraph:
+    return await _run(mdb_api.get_prerequisite_graph)
+
+
+async def clear_courses() -> None:
+    await _run(mdb_api.clear_courses)
+
+
+async def find_courses_by_prefix(prefix: str, limit: int | None = None) -> list[tuple[str, str]]:
+    return await _run(mdb_api.find_courses_by_prefix, prefix, limit)
+
+
+async def find_courses_in_range(low: str, high: str, limit: int | None = None) -> list[tuple[str, str]]:
+    return await _run(mdb_api.find_courses_in_range, low, high, limit)
+
+
+async def search_courses(query: str, k: int = 10) -> list[tuple[str, str]]:
+    return await _run(mdb_api.search_courses, query, k)
+
+
+async def find_course_details(course_number: str) -> dict | None:
+    return await _run(mdb_api.find_course_details, course_number)
+
+
+# Asynchronous generator over the detail documents of the courses sorted by number, each batch of batch_size
+# documents is read on the thread pool.
+async def iter_course_details_sorted(after: str | None = None, batch_size: int = mdb_api.DEFAULT_BATCH_SIZE):
+    details = mdb_api.iter_course_details_sorted(after, batch_size)
+    while True:
+        batch = await _run(list, islice(details, batch_size))
+        for detail in batch:
+            yield detail
+        if len(batch) < batch_size:
+            return
+
+
+async def rebuild_course_details() -> int:
+    return await _run(mdb_api.rebuild_course_details)
+
+
+def course_cache_stats() -> dict:
+    # Reading the counters does not block, so it is a normal function.
+    return mdb_api.course_cache_stats()
+
+
+# Users coroutines: same arguments and results of the mdb_api functions with the same name.
+
+async def insert_user(user: User) -> bool:
+    return await _run(mdb_api.insert_user, user)
+
+
+async def insert_users(users, batch_size: int = mdb_api.DEFAULT_BATCH_SIZE) -> dict:
+    return await _run(mdb_api.insert_users, users, batch_size)
+
+
+async def update_password_hash(email: str, password_hash: bytes) -> bool:
+    return await _run(mdb_api.update_password_hash, email, password_hash)
+
+
+async def find_user_by_email(email: str) -> User | None:
+    return await _run(mdb_api.find_user_by_email, email)
+
+
+async def find_users_by_emails(emails) -> dict[str, User | None]:
+    return await _run(mdb_api.find_users_by_emails, list(emails))
+
+
+async def add_completed_course(email: str, course_number: str) -> bool:
+    return await _run(mdb_api.add_completed_course, email, course_number)
+
+
+async def add_completed_courses_bulk(completions, validate_courses: bool = True) -> dict:
+    return await _run(mdb_api.add_completed_courses_bulk, completions, validate_courses)
+
+
+async def get_users_list() -> list[dict]:
+    return await _run(mdb_api.get_users_list)
+
+
+async def get_users_page(page_size: int = mdb_api.DEFAULT_PAGE_SIZE, after: str | None = None,
+                         fields: list[str] | None = None) -> tuple[list[dict], str | None]:
+    return await _run(mdb_api.get_users_page, page_size, after, fields)
+
+
+# Asynchronous generator over the users sorted by email, read one page at a time.
+async def iter_users(after: str | None = None, fields: list[str] | None = None,
+                     page_size: int = mdb_api.DEFAULT_PAGE_SIZE):
+    while True:
+        page, after = await get_users_page(page_size, after, fields)
+        for user in page:
+            yield user
+        if after is None:
+            return
+
+
+# Password coroutines: the bcrypt work runs on the pool of utils.password_hashing.
+
+# Create a new user object hashing the password on the password hashing pool.
+async def create_user(name: str, surname: str, email: str, password: str, role: str = "student") -> User:
+    password_hash = await asyncio.wrap_future(submit_hash(password))
+    return User(name, surname, email, password_hash, role)
+
+
+# Check the user password on the password hashing pool, bcrypt is slow on purpose and would stop the event loop.
+async def check_password(user: User, password: str) -> bool:
+    return await asyncio.wrap_future(submit_verify(password, user._password_hash))
+
+
+# Return the user with the given email when the password is correct, otherwise None.
+# A password hash made with an outdated work factor is upgraded and saved.
+async def login(email: str, password: str) -> User | None:
+    user = await find_user_by_email(email)
+    if user is None or not await check_password(user, password):
+        return None
+    if await _run(user.rehash_if_needed, password):
+        await _run(mdb_api.update_password_hash, user.email, user._password_hash)
+    return user
@@ -0,0 +1,150 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          base.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Storage backend interface used by the database API. Each
+#               backend stores the course and user documents in its own way.
+# ============================================================================
+
+
+# Modules imports
+from abc import ABC, abstractmethod  # The backends must implement every storage method
+
+
+# Fields of the documents stored for each course.
+COURSE_FIELDS = ("number", "name", "prerequisites", "content_hash")
+# Fields of the materialized detail documents of the courses, see services/course_details.py.
+COURSE_DETAIL_FIELDS = ("number", "name", "in_catalog", "prerequisites", "dependents", "depth", "content_hash")
+# Fields of the documents stored for each user.
+USER_FIELDS = ("name", "surname", "email", "_password_hash", "role", "completed_courses")
+
+
+# Return a copy of the document with only the given fields (and the key field) or all of them when fields is None.
+def project(document: dict, fields, key_field: str) -> dict:
+    if not fields:
+        return dict(document)
+    return {name: document[name] for name in (key_field, *fields) if name in document}
+
+
+# Base class of the storage backends.
+# The documents are dictionaries: the courses have the COURSE_FIELDS keys and the users the USER_FIELDS keys.
+# The course number and the user email are unique. The abstract methods must be implemented by every backend
+# (a backend missing one of them can not be created), the others have a default that does nothing.
+class StorageBackend(ABC):
+
+    # Name used in the configuration (STORAGE_BACKEND environment variable).
+    name = ""
+
+    # Prepare the indexes used by the queries. Returns True when all of them are in place.
+    def ensure_indexes(self) -> bool:
+        return True
+
+    # Return the duplicated course numbers as {"value", "count", "ids"} dictionaries.
+    def find_duplicate_courses(self) -> list[dict]:
+        return []
+
+    # Return the duplicated user emails as {"value", "count", "ids"} dictionaries.
+    def find_duplicate_users(self) -> list[dict]:
+        return []
+
+    # Remove the duplicated courses keeping the oldest one. Returns the number of deleted documents.
+    def dedupe_courses(self) -> int:
+        return 0
+
+    # Insert a course document. Returns False if the course number already exists.
+    @abstractmethod
+    def insert_course(self, document: dict) -> bool:
+        raise NotImplementedError
+
+    # Insert many course documents, going on after a failure.
+    # Returns the number of inserted documents and the error messages of the failed ones.
+    @abstractmethod
+    def insert_courses(self, documents: list[dict]) -> tuple[int, list[str]]:
+        raise NotImplementedError
+
+    # Return the course documents with the given numbers (only the given fields when fields is not None).
+    @abstractmethod
+    def find_courses(self, numbers: list[str], fields=None) -> list[dict]:
+        raise NotImplementedError
+
+    # Yield the course documents sorted by number, starting after the given number and stopping after limit
+    # documents when limit is not None. batch_size is the number of documents read in each round trip.
+    @abstractmethod
+    def iter_courses(self, after: str | None = None, fields=None, batch_size: int = 1000, limit: int | None = None):
+        raise NotImplementedError
+
+    # Return the stored content hash of each course number (None when not stored).
+    @abstractmethod
+    def course_hashes(self) -> dict[str, str | None]:
+        raise NotImplementedError
+
+    # Replace (or add) the given course documents and delete the removed course numbers in one operation.
+    # Returns the number of written documents.
+    @abstractmethod
+    def apply_catalog_changes(self, upserts: list[dict], removed: list[str]) -> int:
+        raise NotImplementedError
+
+    # Delete all the courses.
+    @abstractmethod
+    def clear_courses(self) -> None:
+        raise NotImplementedError
+
+    # Return the course detail documents with the given numbers.
+    @abstractmethod
+    def find_course_details(self, numbers: list[str]) -> list[dict]:
+        raise NotImplementedError
+
+    # Yield the course detail documents sorted by number, with the same arguments of iter_courses.
+    @abstractmethod
+    def iter_course_details(self, after: str | None = None, batch_size: int = 1000, limit: int | None = None):
+        raise NotImplementedError
+
+    # Replace (or add) the given course detail documents and delete the given numbers in one operation.
+    # Returns the number of written documents.
+    @abstractmethod
+    def write_course_details(self, upserts: list[dict], removed: list[str]) -> int:
+        raise NotImplementedError
+
+    # Delete all the course detail documents.
+    @abstractmethod
+    def clear_course_details(self) -> None:
+        raise NotImplementedError
+
+    # Insert a user document. Returns False if the email already exists.
+    @abstractmethod
+    def insert_user(self, document: dict) -> bool:
+        raise NotImplementedError
+
+    # Insert many user documents, going on after a failure.
+    # Returns the number of inserted documents and the rejected emails.
+    @abstractmethod
+    def insert_users(self, documents: list[dict]) -> tuple[int, list[str]]:
+        raise NotImplementedError
+
+    # Return the user document with the given email or None.
+    @abstractmethod
+    def find_user(self, email: str) -> dict | None:
+        raise NotImplementedError
+
+    # Return the user documents with the given emails.
+    @abstractmethod
+    def find_users(self, emails: list[str]) -> list[dict]:
+        raise NotImplementedError
+
+    # Set the given fields of the user. Returns False if the user does not exist.
+    @abstractmethod
+    def update_user(self, email: str, values: dict) -> bool:
+        raise NotImplementedError
+
+    # Add the course numbers to the completed courses of each user ({email: [course numbers]}) atomically,
+    # without duplicates. Returns the number of users found, the number of users changed and the unknown emails.
+    @abstractmethod
+    def add_completions(self, completions: dict[str, list[str]]) -> tuple[int, int, list[str]]:
+        raise NotImplementedError
+
+    # Yield the user documents sorted by email, with the same arguments of iter_courses.
+    @abstractmethod
+    def iter_users(self, after: str | None = None, fields=None, batch_size: int = 1000, limit: int | None = None):
+        raise NotImplementedError
@@ -0,0 +1,196 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          memory_backend.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   In-memory storage backend, used for tests, demos and
+#               benchmarks without a database server. The data is lost when
+#               the program ends.
+# ============================================================================
+
+
+# Modules imports
+import threading  # Lock protecting the data shared by the threads
+from bisect import bisect_right, insort  # Sorted lists of the keys used by the ordered listings
+from services.backends.base import StorageBackend, project  # Storage backend interface
+
+
+# Copy a document so the stored one is never shared with the caller. The values are strings or lists of
+# strings (or of small dictionaries for the course details), so copying the lists and their dictionaries is enough.
+def _copy(document: dict) -> dict:
+    copy = dict(document)
+    for key, value in copy.items():
+        if isinstance(value, list):
+            copy[key] = [dict(item) for item in value] if value and isinstance(value[0], dict) else list(value)
+    return copy
+
+
+# Storage backend keeping the documents in dictionaries indexed by course number and by email.
+# A sorted list of the keys of each dictionary answers the ordered listings without sorting every time.
+class MemoryBackend(StorageBackend):
+
+    name = "memory"
+
+    def __init__(self):
+        self._courses: dict[str, dict] = {}  # course number -> course document
+        self._course_keys: list[str] = []  # sorted course numbers
+        self._details: dict[str, dict] = {}  # course number -> course detail document
+        self._detail_keys: list[str] = []  # sorted course numbers of the details
+        self._users: dict[str, dict] = {}  # email -> user document
+        self._user_keys: list[str] = []  # sorted emails
+        self._lock = threading.RLock()
+
+    # Yield the documents of a dictionary in key order starting after the given key.
+    # The keys are copied batch_size at a time, so the lock is not held while the caller uses the documents.
+    def _iter_sorted(self, data: dict, keys: list, key_field: str, after, fields, batch_size: int, limit):
+        remaining = limit if limit is not None else -1
+        while remaining != 0:
+            with self._lock:
+                start = bisect_right(keys, after) if after is not None else 0
+                size = batch_size if remaining < 0 else min(batch_size, remaining)
+                batch = [project(_copy(data[key]), fields, key_field) for key in keys[start:start + size]]
+            if not batch:
+                return
+            yield from batch
+            after = batch[-1][key_field]
+            remaining -= len(batch)
+            if len(batch) < size:
+                return
+
+    def insert_course(self, document: dict) -> bool:
+        with self._lock:
+            if document["number"] in self._courses:
+                return False
+            self._courses[document["number"]] = _copy(document)
+            insort(self._course_keys, document["number"])
+        return True
+
+    def insert_courses(self, documents: list[dict]) -> tuple[int, list[str]]:
+        inserted = 0
+        messages = []
+        for document in documents:
+            if self.insert_course(document):
+                inserted += 1
+            else:
+                messages.append(f"duplicate key: number {document['number']}")
+        return inserted, messages
+
+    def find_courses(self, numbers: list[str], fields=None) -> list[dict]:
+        with self._lock:
+            return [project(_copy(self._courses[number]), fields, "number")
+                    for number in dict.fromkeys(numbers) if number in self._courses]
+
+    def iter_courses(self, after: str | None = None, fields=None, batch_size: int = 1000, limit: int | None = None):
+        return self._iter_sorted(self._courses, self._course_keys, "number", after, fields, batch_size, limit)
+
+    def course_hashes(self) -> dict[str, str | None]:
+        with self._lock:
+            return {number: document.get("content_hash") for number, document in self._courses.items()}
+
+    def apply_catalog_changes(self, upserts: list[dict], removed: list[str]) -> int:
+        written = 0
+        with self._lock:
+            for document in upserts:
+                if document["number"] not in self._courses:
+                    insort(self._course_keys, document["number"])
+                self._courses[document["number"]] = _copy(document)
+                written += 1
+            removed_set = {number for number in removed if number in self._courses}
+            for number in removed_set:
+                del self._courses[number]
+                written += 1
+            if removed_set:
+                self._course_keys = [number for number in self._course_keys if number not in removed_set]
+        return written
+
+    def clear_courses(self) -> None:
+        with self._lock:
+            self._courses.clear()
+            self._course_keys.clear()
+
+    def find_course_details(self, numbers: list[str]) -> list[dict]:
+        with self._lock:
+            return [_copy(self._details[number]) for number in dict.fromkeys(numbers) if number in self._details]
+
+    def iter_course_details(self, after: str | None = None, batch_size: int = 1000, limit: int | None = None):
+        return self._iter_sorted(self._details, self._detail_keys, "number", after, None, batch_size, limit)
+
+    def write_course_details(self, upserts: list[dict], removed: list[str]) -> int:
+        with self._lock:
+            new_keys = [document["number"] for document in upserts if document["number"] not in self._details]
+            for document in upserts:
+                self._details[document["number"]] = _copy(document)
+            # Many new keys are merged with one sort (linear on the two sorted runs) instead of one insort each.
+            if len(new_keys) > 16:
+                self._detail_keys = sorted(self._detail_keys + new_keys)
+            else:
+                for number in new_keys:
+                    insort(self._detail_keys, number)
+            removed_set = {number for number in removed if number in self._details}
+            for number in removed_set:
+                del self._details[number]
+            if removed_set:
+                self._detail_keys = [number for number in self._detail_keys if number not in removed_set]
+        return len(upserts) + len(removed_set)
+
+    def clear_course_details(self) -> None:
+        with self._lock:
+            self._details.clear()
+            self._detail_keys.clear()
+
+    def insert_user(self, document: dict) -> bool:
+        with self._lock:
+            if document["email"] in self._users:
+                return False
+            self._users[document["email"]] = _copy(document)
+            insort(self._user_keys, document["email"])
+        return True
+
+    def insert_users(self, documents: list[dict]) -> tuple[int, list[str]]:
+        inserted = 0
+        rejected = []
+        for document in documents:
+            if self.insert_user(document):
+                inserted += 1
+            else:
+                rejected.append(document["email"])
+        return inserted, rejected
+
+    def find_user(self, email: str) -> dict | None:
+        with self._lock:
+            document = self._users.get(email)
+            return _copy(document) if document is not None else None
+
+    def find_users(self, emails: list[str]) -> list[dict]:
+        with self._lock:
+            return [_copy(self._users[email]) for email in dict.fromkeys(emails) if email in self._users]
+
+    def update_user(self, email: str, values: dict) -> bool:
+        with self._lock:
+            if email not in self._users:
+                return False
+            self._users[email].update(_copy(values))
+        return True
+
+    def add_completions(self, completions: dict[str, list[str]]) -> tuple[int, int, list[str]]:
+        matched = modified = 0
+        unknown = []
+        with self._lock:
+            for email, courses in completions.items():
+                document = self._users.get(email)
+                if document is None:
+                    unknown.append(email)
+                    continue
+                matched += 1
+                completed = document.setdefault("completed_courses", [])
+                # Same behavior of $addToSet: only the courses not already present are appended.
+                present = set(completed)
+                new_courses = [number for number in dict.fromkeys(courses) if number not in present]
+                if new_courses:
+                    completed.extend(new_courses)
+                    modified += 1
+        return matched, modified, sorted(unknown)
+
+    def iter_users(self, after: str | None = None, fields=None, batch_size: int = 1000, limit: int | None = None):
+        return self._iter_sorted(self._users, self._user_keys, "email", after, fields, batch_size, limit)
@@ -0,0 +1,266 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          mongo_backend.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   MongoDB storage backend. pymongo is imported and the client
+#               created only when the database is used for the first time.
+# ============================================================================
+
+
+# Modules imports
+import os  # OS tools
+import threading  # Lock used to create the database connection only once
+from services.backends.base import StorageBackend  # Storage backend interface
+
+
+# Sort direction used in the queries, same value of pymongo.ASCENDING.
+ASCENDING = 1
+
+
+# Return the projection that reads only the given fields (and the key field), or all the fields except _id.
+def _projection(fields, key_field: str) -> dict:
+    if not fields:
+        return {"_id": 0}
+    return {"_id": 0, key_field: 1, **{name: 1 for name in fields}}
+
+
+# Storage backend keeping the courses and the users in two MongoDB collections.
+class MongoBackend(StorageBackend):
+
+    name = "mongodb"
+
+    # The collections can be given directly, for example an in-memory stand-in like mongomock for tests.
+    # Otherwise they are created on first use with the client configured by the environment variables:
+    #   MONGODB_URI                          connection string with user and password
+    #   MONGODB_DATABASE                     database name (default abcu_advising)
+    #   MONGODB_MAX_POOL_SIZE                maximum number of connections kept by the client (default 100)
+    #   MONGODB_SERVER_SELECTION_TIMEOUT_MS  time to find an available server before failing (default 30000)
+    #   MONGODB_CONNECT_TIMEOUT_MS           time to open a connection before failing (default 20000)
+    # The course details collection is taken from the database of the courses collection when not given.
+    def __init__(self, courses_collection=None, users_collection=None, details_collection=None):
+        self.client = None
+        self.courses_coll = courses_collection
+        self.users_coll = users_collection
+        self.details_coll = details_collection
+        self._connect_lock = threading.Lock()
+
+    # Create the client and the collections the first time.
+    def _connect(self) -> None:
+        with self._connect_lock:
+            if self.courses_coll is not None:
+                return
+            from pymongo import MongoClient  # Import the Phyton MongoDB client
+            self.client = MongoClient(
+                os.getenv("MONGODB_URI", "mongodb://localhost:27017/"),
+                maxPoolSize=int(os.getenv("MONGODB_MAX_POOL_SIZE", "100")),
+                serverSelectionTimeoutMS=int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "30000")),
+                connectTimeoutMS=int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "20000"))
+            )
+            db = self.client[os.getenv("MONGODB_DATABASE", "abcu_advising")]
+            self.users_coll = db["users"]
+            self.details_coll = db["course_details"]
+            self.courses_coll = db["courses"]
+
+    # Return the courses collection connecting to the database on first use.
+    def courses(self):
+        if self.courses_coll is None:
+            self._connect()
+        return self.courses_coll
+
+    # Return the users collection connecting to the database on first use.
+    def users(self):
+        if self.courses_coll is None:
+            self._connect()
+        return self.users_coll
+
+    # Return the course details collection connecting to the database on first use.
+    def details(self):
+        if self.courses_coll is None:
+            self._connect()
+        if self.details_coll is None:
+            self.details_coll = self.courses_coll.database["course_details"]
+        return self.details_coll
+
+    # Return the list of duplicated values of a field inside a collection.
+    # Each element has the duplicated value, how many times it is present and the _id of the documents.
+    @staticmethod
+    def _find_duplicates(collection, field_name: str) -> list[dict]:
+        pipeline = [
+            {"$group": {"_id": f"${field_name}", "count": {"$sum": 1}, "ids": {"$push": "$_id"}}},
+            {"$match": {"count": {"$gt": 1}}},
+            {"$sort": {"_id": ASCENDING}}
+        ]
+        return [{"value": dup["_id"], "count": dup["count"], "ids": dup["ids"]}
+                for dup in collection.aggregate(pipeline, allowDiskUse=True)]
+
+    def find_duplicate_courses(self) -> list[dict]:
+        return self._find_duplicates(self.courses(), "number")
+
+    def find_duplicate_users(self) -> list[dict]:
+        return self._find_duplicates(self.users(), "email")
+
+    def dedupe_courses(self) -> int:
+        deleted = 0
+        for dup in self.find_duplicate_courses():
+            # The ObjectId grows with the insertion time, so the smallest one is the oldest document.
+            extra_ids = sorted(dup["ids"])[1:]
+            deleted += self.courses().delete_many({"_id": {"$in": extra_ids}}).deleted_count
+        return deleted
+
+    # The unique indexes stop the creation of duplicated courses and users, while the compound index
+    # on number and name lets the sorted course listing be answered from the index only.
+    # If a collection already contains duplicates the unique index cannot be built, so the duplicates are
+    # reported and the index is created again after running dedupe_courses().
+    def ensure_indexes(self) -> bool:
+        from pymongo.errors import DuplicateKeyError, OperationFailure  # Index creation errors
+        all_created = True
+        try:
+            self.courses().create_index([("number", ASCENDING)], unique=True, name="number_unique")
+        except (DuplicateKeyError, OperationFailure):
+            all_created = False
+            duplicates = self.find_duplicate_courses()
+            print(f"WARNING: {len(duplicates)} course numbers are duplicated, unique index not created: "
+                  f"{[dup['value'] for dup in duplicates[:10]]}")
+        try:
+            self.users().create_index([("email", ASCENDING)], unique=True, name="email_unique")
+        except (DuplicateKeyError, OperationFailure):
+            all_created = False
+            duplicates = self.find_duplicate_users()
+            print(f"WARNING: {len(duplicates)} user emails are duplicated, unique index not created: "
+                  f"{[dup['value'] for dup in duplicates[:10]]}")
+        # Index used by the sorted listing that prints only the number and the name of each course.
+        self.courses().create_index([("number", ASCENDING), ("name", ASCENDING)], name="number_name")
+        # The course details are always read by number, one document per course.
+        self.details().create_index([("number", ASCENDING)], unique=True, name="number_unique")
+        return all_created
+
+    def insert_course(self, document: dict) -> bool:
+        from pymongo.errors import DuplicateKeyError  # Raised when the course number already exists
+        try:
+            # Copy the document so the caller data is not modified when the database adds the _id field.
+            self.courses().insert_one(dict(document))
+        except DuplicateKeyError:
+            return False
+        return True
+
+    def insert_courses(self, documents: list[dict]) -> tuple[int, list[str]]:
+        from pymongo.errors import BulkWriteError  # Raised when some documents of a bulk insert fail
+        try:
+            # Unordered insert: the server keeps inserting the remaining documents after a failure.
+            result = self.courses().insert_many([dict(document) for document in documents], ordered=False)
+            return len(result.inserted_ids), []
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            return e.details.get("nInserted", 0), [err.get("errmsg", "") for err in write_errors]
+
+    def find_courses(self, numbers: list[str], fields=None) -> list[dict]:
+        if len(numbers) == 1:
+            document = self.courses().find_one({"number": numbers[0]}, _projection(fields, "number"))
+            return [document] if document else []
+        return list(self.courses().find({"number": {"$in": numbers}}, _projection(fields, "number")))
+
+    def iter_courses(self, after: str | None = None, fields=None, batch_size: int = 1000, limit: int | None = None):
+        query = {"number": {"$gt": after}} if after is not None else {}
+        cursor = self.courses().find(query, _projection(fields, "number")).sort("number", ASCENDING)
+        if limit is not None:
+            if limit == 0:  # MongoDB reads a zero limit as no limit
+                return
+            cursor = cursor.limit(limit)
+        yield from cursor.batch_size(batch_size)
+
+    def course_hashes(self) -> dict[str, str | None]:
+        return {doc["number"]: doc.get("content_hash")
+                for doc in self.courses().find({}, {"_id": 0, "number": 1, "content_hash": 1})}
+
+    def apply_catalog_changes(self, upserts: list[dict], removed: list[str]) -> int:
+        from pymongo import ReplaceOne, DeleteMany  # Bulk write operations
+        operations = [ReplaceOne({"number": document["number"]}, dict(document), upsert=True) for document in upserts]
+        if removed:
+            operations.append(DeleteMany({"number": {"$in": removed}}))
+        if not operations:
+            return 0
+        # A single unordered bulk_write, the collection is never emptied while it runs.
+        result = self.courses().bulk_write(operations, ordered=False)
+        return result.upserted_count + result.modified_count + result.deleted_count
+
+    def clear_courses(self) -> None:
+        # Using an empty filter, delete all the documents in the collection.
+        self.courses().delete_many({})
+
+    def find_course_details(self, numbers: list[str]) -> list[dict]:
+        return list(self.details().find({"number": {"$in": numbers}}, {"_id": 0}))
+
+    def iter_course_details(self, after: str | None = None, batch_size: int = 1000, limit: int | None = None):
+        query = {"number": {"$gt": after}} if after is not None else {}
+        cursor = self.details().find(query, {"_id": 0}).sort("number", ASCENDING)
+        if limit is not None:
+            if limit == 0:  # MongoDB reads a zero limit as no limit
+                return
+            cursor = cursor.limit(limit)
+        yield from cursor.batch_size(batch_size)
+
+    def write_course_details(self, upserts: list[dict], removed: list[str]) -> int:
+        from pymongo import ReplaceOne, DeleteMany  # Bulk write operations
+        operations = [ReplaceOne({"number": document["number"]}, dict(document), upsert=True) for document in upserts]
+        if removed:
+            operations.append(DeleteMany({"number": {"$in": removed}}))
+        if not operations:
+            return 0
+        result = self.details().bulk_write(operations, ordered=False)
+        return result.upserted_count + result.modified_count + result.deleted_count
+
+    def clear_course_details(self) -> None:
+        self.details().delete_many({})
+
+    def insert_user(self, document: dict) -> bool:
+        from pymongo.errors import DuplicateKeyError  # Raised when the email already exists
+        try:
+            self.users().insert_one(dict(document))
+        except DuplicateKeyError:
+            return False
+        return True
+
+    def insert_users(self, documents: list[dict]) -> tuple[int, list[str]]:
+        from pymongo.errors import BulkWriteError  # Raised when some documents of a bulk insert fail
+        try:
+            return len(self.users().insert_many([dict(document) for document in documents],
+                                                ordered=False).inserted_ids), []
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            return e.details.get("nInserted", 0), [documents[err["index"]]["email"] for err in write_errors]
+
+    def find_user(self, email: str) -> dict | None:
+        return self.users().find_one({"email": email}, {"_id": 0})
+
+    def find_users(self, emails: list[str]) -> list[dict]:
+        return list(self.users().find({"email": {"$in": list(emails)}}, {"_id": 0}))
+
+    def update_user(self, email: str, values: dict) -> bool:
+        return self.users().update_one({"email": email}, {"$set": values}).matched_count > 0
+
+    def add_completions(self, completions: dict[str, list[str]]) -> tuple[int, int, list[str]]:
+        from pymongo import UpdateOne  # Bulk write operation
+        if not completions:
+            return 0, 0, []
+        # One atomic $addToSet update for each user, all sent with a single unordered bulk_write.
+        operations = [UpdateOne({"email": email}, {"$addToSet": {"completed_courses": {"$each": courses}}})
+                      for email, courses in completions.items()]
+        result = self.users().bulk_write(operations, ordered=False)
+        unknown = []
+        # Some emails did not match any user, find which ones with a single query.
+        if result.matched_count < len(operations):
+            existing = {user["email"] for user in self.users().find({"email": {"$in": list(completions)}},
+                                                                    {"_id": 0, "email": 1})}
+            unknown = sorted(email for email in completions if email not in existing)
+        return result.matched_count, result.modified_count, unknown
+
+    def iter_users(self, after: str | None = None, fields=None, batch_size: int = 1000, limit: int | None = None):
+        query = {"email": {"$gt": after}} if after is not None else {}
+        cursor = self.users().find(query, _projection(fields, "email")).sort("email", ASCENDING)
+        if limit is not None:
+            if limit == 0:  # MongoDB reads a zero limit as no limit
+                return
+            cursor = cursor.limit(limit)
+        yield from cursor.batch_size(batch_size)
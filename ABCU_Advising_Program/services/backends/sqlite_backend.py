@@ -0,0 +1,273 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          sqlite_backend.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   SQLite storage backend, keeps the catalog and the users in a
+#               single local file without a database server.
+# ============================================================================
+
+
+# Modules imports
+import json  # The prerequisites are stored as a JSON array
+import sqlite3  # Python SQLite driver
+import threading  # Lock serializing the use of the shared connection
+from services.backends.base import StorageBackend, project  # Storage backend interface
+
+
+# Tables of the database. The course details are read and written whole, so they are stored as JSON documents.
+# The completed courses have their own table so that adding a course is a single
+# INSERT OR IGNORE, atomic and without duplicates like the MongoDB $addToSet.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS courses (
+    number        TEXT PRIMARY KEY,
+    name          TEXT NOT NULL,
+    prerequisites TEXT NOT NULL,
+    content_hash  TEXT
+);
+CREATE TABLE IF NOT EXISTS course_details (
+    number    TEXT PRIMARY KEY,
+    document  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS users (
+    email          TEXT PRIMARY KEY,
+    name           TEXT NOT NULL,
+    surname        TEXT NOT NULL,
+    password_hash  TEXT NOT NULL,
+    role           TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS user_courses (
+    email         TEXT NOT NULL REFERENCES users(email),
+    course_number TEXT NOT NULL,
+    PRIMARY KEY (email, course_number)
+);
+"""
+
+# Number of SQL variables used in a single IN (...) clause, below the SQLite limit.
+_MAX_VARIABLES = 900
+
+
+# Storage backend keeping the courses and the users in a SQLite database file.
+class SQLiteBackend(StorageBackend):
+
+    name = "sqlite"
+
+    # path is the database file, ":memory:" keeps the database in memory.
+    def __init__(self, path: str = "abcu_advising.db"):
+        self.path = path
+        # One connection shared by all the threads, the lock makes sure only one of them uses it at a time.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        with self._lock, self._connection:
+            # Write-ahead logging lets the readers go on while a batch is written.
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+
+    # Convert a courses row to a course document.
+    @staticmethod
+    def _course_document(row) -> dict:
+        return {"number": row[0], "name": row[1], "prerequisites": json.loads(row[2]), "content_hash": row[3]}
+
+    # Convert a course document to a courses row.
+    @staticmethod
+    def _course_row(document: dict) -> tuple:
+        return (document["number"], document["name"], json.dumps(list(document["prerequisites"])),
+                document.get("content_hash"))
+
+    # Return the completed courses of the given emails in insertion order.
+    def _completed_courses(self, emails: list[str]) -> dict[str, list[str]]:
+        completed: dict[str, list[str]] = {email: [] for email in emails}
+        for start in range(0, len(emails), _MAX_VARIABLES):
+            chunk = emails[start:start + _MAX_VARIABLES]
+            rows = self._connection.execute(
+                f"SELECT email, course_number FROM user_courses WHERE email IN ({','.join('?' * len(chunk))})"
+                " ORDER BY rowid", chunk)
+            for email, course_number in rows:
+                completed[email].append(course_number)
+        return completed
+
+    # Convert users rows to user documents, reading the completed courses with one query.
+    def _user_documents(self, rows) -> list[dict]:
+        completed = self._completed_courses([row[0] for row in rows])
+        return [{"name": row[1], "surname": row[2], "email": row[0], "_password_hash": row[3], "role": row[4],
+                 "completed_courses": completed[row[0]]} for row in rows]
+
+    # Write one user with its completed courses, returns False if the email already exists.
+    def _insert_user(self, document: dict) -> bool:
+        try:
+            self._connection.execute(
+                "INSERT INTO users (email, name, surname, password_hash, role) VALUES (?, ?, ?, ?, ?)",
+                (document["email"], document["name"], document["surname"], document["_password_hash"],
+                 document["role"]))
+        except sqlite3.IntegrityError:
+            return False
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO user_courses (email, course_number) VALUES (?, ?)",
+            [(document["email"], number) for number in document.get("completed_courses", [])])
+        return True
+
+    # Yield the documents of a table sorted by its primary key with keyset pagination, used by the iter_* methods.
+    # query selects the rows with the key (the first column) greater than a value, sorted and limited to a size;
+    # convert turns the rows of a batch into documents. Each batch is a short query so the lock is not held
+    # while the caller uses the documents.
+    def _iter_sorted(self, query: str, convert, after, batch_size: int, limit):
+        remaining = limit if limit is not None else -1
+        while remaining != 0:
+            size = batch_size if remaining < 0 else min(batch_size, remaining)
+            with self._lock:
+                rows = self._connection.execute(query, (after if after is not None else "", size)).fetchall()
+                documents = convert(rows)
+            yield from documents
+            if len(rows) < size:
+                return
+            after = rows[-1][0]
+            remaining -= len(rows)
+
+    def insert_course(self, document: dict) -> bool:
+        with self._lock:
+            try:
+                with self._connection:
+                    self._connection.execute("INSERT INTO courses VALUES (?, ?, ?, ?)", self._course_row(document))
+            except sqlite3.IntegrityError:
+                return False
+        return True
+
+    def insert_courses(self, documents: list[dict]) -> tuple[int, list[str]]:
+        # INSERT OR IGNORE skips the existing course numbers, the whole batch is a single transaction.
+        with self._lock, self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany("INSERT OR IGNORE INTO courses VALUES (?, ?, ?, ?)",
+                                         [self._course_row(document) for document in documents])
+            inserted = self._connection.total_changes - before
+        failed = len(documents) - inserted
+        return inserted, [f"{failed} duplicate course numbers ignored"] if failed else []
+
+    def find_courses(self, numbers: list[str], fields=None) -> list[dict]:
+        numbers = list(dict.fromkeys(numbers))
+        documents = []
+        with self._lock:
+            for start in range(0, len(numbers), _MAX_VARIABLES):
+                chunk = numbers[start:start + _MAX_VARIABLES]
+                rows = self._connection.execute(
+                    f"SELECT number, name, prerequisites, content_hash FROM courses"
+                    f" WHERE number IN ({','.join('?' * len(chunk))})", chunk)
+                documents.extend(project(self._course_document(row), fields, "number") for row in rows)
+        return documents
+
+    def iter_courses(self, after: str | None = None, fields=None, batch_size: int = 1000, limit: int | None = None):
+        return self._iter_sorted(
+            "SELECT number, name, prerequisites, content_hash FROM courses WHERE number > ? ORDER BY number LIMIT ?",
+            lambda rows: [project(self._course_document(row), fields, "number") for row in rows],
+            after, batch_size, limit)
+
+    def course_hashes(self) -> dict[str, str | None]:
+        with self._lock:
+            return dict(self._connection.execute("SELECT number, content_hash FROM courses"))
+
+    def apply_catalog_changes(self, upserts: list[dict], removed: list[str]) -> int:
+        # A single transaction, the readers see the old catalog or the new one.
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO courses VALUES (?, ?, ?, ?)",
+                                         [self._course_row(document) for document in upserts])
+            self._connection.executemany("DELETE FROM courses WHERE number = ?", [(number,) for number in removed])
+        return len(upserts) + len(removed)
+
+    def clear_courses(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM courses")
+
+    def find_course_details(self, numbers: list[str]) -> list[dict]:
+        numbers = list(dict.fromkeys(numbers))
+        documents = []
+        with self._lock:
+            for start in range(0, len(numbers), _MAX_VARIABLES):
+                chunk = numbers[start:start + _MAX_VARIABLES]
+                rows = self._connection.execute(
+                    f"SELECT document FROM course_details WHERE number IN ({','.join('?' * len(chunk))})", chunk)
+                documents.extend(json.loads(row[0]) for row in rows)
+        return documents
+
+    def iter_course_details(self, after: str | None = None, batch_size: int = 1000, limit: int | None = None):
+        return self._iter_sorted(
+            "SELECT number, document FROM course_details WHERE number > ? ORDER BY number LIMIT ?",
+            lambda rows: [json.loads(row[1]) for row in rows], after, batch_size, limit)
+
+    def write_course_details(self, upserts: list[dict], removed: list[str]) -> int:
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO course_details VALUES (?, ?)",
+                                         [(document["number"], json.dumps(document)) for document in upserts])
+            self._connection.executemany("DELETE FROM course_details WHERE number = ?",
+                                         [(number,) for number in removed])
+        return len(upserts) + len(removed)
+
+    def clear_course_details(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM course_details")
+
+    def insert_user(self, document: dict) -> bool:
+        with self._lock, self._connection:
+            return self._insert_user(document)
+
+    def insert_users(self, documents: list[dict]) -> tuple[int, list[str]]:
+        inserted = 0
+        rejected = []
+        with self._lock, self._connection:
+            for document in documents:
+                if self._insert_user(document):
+                    inserted += 1
+                else:
+                    rejected.append(document["email"])
+        return inserted, rejected
+
+    def find_user(self, email: str) -> dict | None:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT email, name, surname, password_hash, role FROM users WHERE email = ?", (email,)).fetchall()
+            return self._user_documents(rows)[0] if rows else None
+
+    def find_users(self, emails: list[str]) -> list[dict]:
+        emails = list(dict.fromkeys(emails))
+        documents = []
+        with self._lock:
+            for start in range(0, len(emails), _MAX_VARIABLES):
+                chunk = emails[start:start + _MAX_VARIABLES]
+                rows = self._connection.execute(
+                    "SELECT email, name, surname, password_hash, role FROM users"
+                    f" WHERE email IN ({','.join('?' * len(chunk))})", chunk).fetchall()
+                documents.extend(self._user_documents(rows))
+        return documents
+
+    def update_user(self, email: str, values: dict) -> bool:
+        # Only the columns of the users table can be set, the completed courses have their own functions.
+        columns = {"name": "name", "surname": "surname", "_password_hash": "password_hash", "role": "role"}
+        assignments = ", ".join(f"{columns[field]} = ?" for field in values)
+        with self._lock, self._connection:
+            cursor = self._connection.execute(f"UPDATE users SET {assignments} WHERE email = ?",
+                                              (*values.values(), email))
+            return cursor.rowcount > 0
+
+    def add_completions(self, completions: dict[str, list[str]]) -> tuple[int, int, list[str]]:
+        emails = list(completions)
+        with self._lock, self._connection:
+            existing = set()
+            for start in range(0, len(emails), _MAX_VARIABLES):
+                chunk = emails[start:start + _MAX_VARIABLES]
+                existing.update(row[0] for row in self._connection.execute(
+                    f"SELECT email FROM users WHERE email IN ({','.join('?' * len(chunk))})", chunk))
+            modified = 0
+            for email in emails:
+                if email not in existing:
+                    continue
+                before = self._connection.total_changes
+                self._connection.executemany("INSERT OR IGNORE INTO user_courses (email, course_number) VALUES (?, ?)",
+                                             [(email, number) for number in completions[email]])
+                if self._connection.total_changes > before:
+                    modified += 1
+        return len(existing), modified, sorted(email for email in emails if email not in existing)
+
+    def iter_users(self, after: str | None = None, fields=None, batch_size: int = 1000, limit: int | None = None):
+        return self._iter_sorted(
+            "SELECT email, name, surname, password_hash, role FROM users WHERE email > ? ORDER BY email LIMIT ?",
+            lambda rows: [project(document, fields, "email") for document in self._user_documents(rows)],
+            after, batch_size, limit)
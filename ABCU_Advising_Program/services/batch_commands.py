@@ -0,0 +1,287 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          batch_commands.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Headless batch mode: JSON-lines commands are read from a file
+#               or stdin, grouped into batched database calls, run on a pool
+#               of threads and answered with one JSON line each.
+# ============================================================================
+
+
+# Modules imports
+import json  # Commands and results are JSON lines
+import os  # OS tools
+import time  # Used to measure the batch timings
+from collections import deque  # Groups waiting for their results
+from concurrent.futures import ThreadPoolExecutor  # Pool running the read groups
+from models.prereq_graph import CyclicCatalogError  # Raised when the catalog contains a prerequisite cycle
+from models.user import User  # Import the User class definition
+from services import mdb_api  # Database API used by the commands
+from utils.data_loader import (csv_to_json_courses, stream_courses_from_csv_file, stream_courses_from_json_file,
+                               load_courses_from_snapshot)  # Loaders and converter
+
+
+# Default number of threads running the read groups.
+DEFAULT_WORKERS = 4
+# Commands that write: they run alone after all the previous commands, so the later commands see their changes.
+# The groups of the other commands only read and run in parallel on the pool.
+WRITE_COMMANDS = {"add_completion", "load", "convert"}
+# Commands whose consecutive occurrences are run with a single batched call.
+GROUPED_COMMANDS = {"lookup", "eligibility", "add_completion"}
+# Commands allowed only to the admin users.
+ADMIN_COMMANDS = {"load", "convert"}
+
+
+# Error of a single command, reported in its result line.
+class CommandError(ValueError):
+    pass
+
+
+# Return the value of a required string field of a command.
+def _field(command: dict, name: str) -> str:
+    value = command.get(name)
+    if not isinstance(value, str) or not value.strip():
+        raise CommandError(f"Missing '{name}'.")
+    return value.strip()
+
+
+# Return the email the command refers to (the logged user by default) checking the user can use it.
+def _email(command: dict, user: User) -> str:
+    email = command.get("email") or user.email
+    if email != user.email and user.role != "admin":
+        raise CommandError("You need admin role to use another user.")
+    return email
+
+
+# Return the result line of a command.
+def _result(command: dict, result=None, error: str | None = None) -> dict:
+    line = {"line": command["line"]}
+    if "id" in command:
+        line["id"] = command["id"]
+    line["command"] = command.get("command")
+    if error is None:
+        line["ok"] = True
+        line["result"] = result
+    else:
+        line["ok"] = False
+        line["error"] = error
+    return line
+
+
+# Find the courses of consecutive lookup commands with one batched query.
+def _run_lookups(commands: list[dict], user: User) -> list[dict]:
+    numbers = {}
+    for command in commands:
+        try:
+            numbers[command["line"]] = _field(command, "course").upper()
+        except CommandError as e:
+            command["error"] = str(e)
+    found = mdb_api.find_courses_by_numbers(numbers.values())
+    results = []
+    for command in commands:
+        if "error" in command:
+            results.append(_result(command, error=command["error"]))
+        elif found[numbers[command["line"]]] is None:
+            results.append(_result(command, error=f"Course number {numbers[command['line']]} not found."))
+        else:
+            results.append(_result(command, found[numbers[command["line"]]].to_dict()))
+    return results
+
+
+# Return a page of the courses sorted by number.
+def _run_list(commands: list[dict], user: User) -> list[dict]:
+    command = commands[0]
+    limit = command.get("limit", mdb_api.DEFAULT_PAGE_SIZE)
+    if not isinstance(limit, int) or limit < 1:
+        raise CommandError("'limit' must be a number greater than zero.")
+    page, next_key = mdb_api.get_courses_page(limit, command.get("after"))
+    return [_result(command, {"courses": [course.to_dict() for course in page], "next": next_key})]
+
+
+# Find the courses that each user (or each given list of completed courses) can take now.
+# The users of the commands are read with one batched query.
+def _run_eligibility(commands: list[dict], user: User) -> list[dict]:
+    try:
+        graph = mdb_api.get_prerequisite_graph()
+    except CyclicCatalogError as e:
+        return [_result(command, error=f"The catalog is not valid: {e}") for command in commands]
+    emails = {}
+    for command in commands:
+        try:
+            if "completed" in command:  # What-if query on a given list of completed courses
+                if not isinstance(command["completed"], list):
+                    raise CommandError("'completed' must be a list of course numbers.")
+            else:
+                emails[command["line"]] = _email(command, user)
+        except CommandError as e:
+            command["error"] = str(e)
+    found = mdb_api.find_users_by_emails(emails.values())
+    results = []
+    for command in commands:
+        if "error" in command:
+            results.append(_result(command, error=command["error"]))
+        elif "completed" in command:
+            completed = [str(number).strip().upper() for number in command["completed"]]
+            results.append(_result(command, {"eligible": graph.eligible_courses(completed)}))
+        elif found[emails[command["line"]]] is None:
+            results.append(_result(command, error=f"User {emails[command['line']]} not found."))
+        else:
+            email = emails[command["line"]]
+            results.append(_result(command, {"email": email,
+                                             "eligible": graph.eligible_courses(found[email].completed_courses)}))
+    return results
+
+
+# Add the completed courses of consecutive add_completion commands with one bulk write.
+def _run_completions(commands: list[dict], user: User) -> list[dict]:
+    pairs = {}
+    for command in commands:
+        try:
+            pairs[command["line"]] = (_email(command, user), _field(command, "course").upper())
+        except CommandError as e:
+            command["error"] = str(e)
+    report = mdb_api.add_completed_courses_bulk(pairs.values())
+    unknown_courses = set(report["unknown_courses"])
+    unknown_users = set(report["unknown_users"])
+    results = []
+    for command in commands:
+        if "error" in command:
+            results.append(_result(command, error=command["error"]))
+            continue
+        email, course_number = pairs[command["line"]]
+        if course_number in unknown_courses:
+            results.append(_result(command, error=f"Course number {course_number} not found."))
+        elif email in unknown_users:
+            results.append(_result(command, error=f"User {email} not found."))
+        else:
+            results.append(_result(command, {"email": email, "course": course_number}))
+    return results
+
+
+# Load a CSV, JSON or snapshot catalog file, chosen by "format" or by the file extension.
+def _run_load(commands: list[dict], user: User) -> list[dict]:
+    command = commands[0]
+    file_name = _field(command, "file")
+    file_format = command.get("format") or ("json" if file_name.lower().endswith(".json") else "csv")
+    loaders = {"csv": stream_courses_from_csv_file, "json": stream_courses_from_json_file,
+               "snapshot": load_courses_from_snapshot}
+    if file_format not in loaders:
+        raise CommandError(f"Unknown format '{file_format}', the formats are: {', '.join(loaders)}.")
+    if not os.path.exists(file_name):
+        raise CommandError(f"File not found: {file_name}")
+    report = loaders[file_format](file_name, mdb_api.insert_courses, chunk_size=mdb_api.DEFAULT_BATCH_SIZE)
+    if report.get("cycle"):
+        # The chunks read before the one closing the cycle are already stored.
+        raise CommandError(f"{CyclicCatalogError(report['cycle'])} ({report['courses']} courses loaded before it)")
+    return [_result(command, {"courses": report["courses"],
+                              "inserted": sum(stats["inserted"] for stats in report["results"]),
+                              "failed": sum(stats["failed"] for stats in report["results"]),
+                              "unresolved": sorted(report["unresolved"])})]
+
+
+# Convert a CSV catalog to a JSON catalog.
+def _run_convert(commands: list[dict], user: User) -> list[dict]:
+    command = commands[0]
+    csv_file = _field(command, "csv_file")
+    json_file = _field(command, "json_file")
+    if not os.path.exists(csv_file):
+        raise CommandError(f"File not found: {csv_file}")
+    csv_to_json_courses(csv_file, json_file, compact=bool(command.get("compact")))
+    return [_result(command, {"json_file": json_file})]
+
+
+# Handler of each command.
+HANDLERS = {"lookup": _run_lookups, "list": _run_list, "eligibility": _run_eligibility,
+            "add_completion": _run_completions, "load": _run_load, "convert": _run_convert}
+
+
+# Run a group of commands of the same kind, an error of the whole group is reported on each of its commands.
+def _run_group(commands: list[dict], user: User) -> list[dict]:
+    name = commands[0].get("command")
+    if "error" in commands[0]:  # Line that could not be parsed
+        return [_result(commands[0], error=commands[0]["error"])]
+    if name in ADMIN_COMMANDS and user.role != "admin":
+        return [_result(command, error="You need admin role to use this function!!") for command in commands]
+    try:
+        return HANDLERS[name](commands, user)
+    except CommandError as e:
+        return [_result(command, error=str(e)) for command in commands]
+    except Exception as e:
+        # Any other failure (storage error, unreadable file, ...) fails only the commands of this group.
+        return [_result(command, error=f"{type(e).__name__}: {e}") for command in commands]
+
+
+# Generator of the commands of the JSON lines, the invalid lines are given with an "error".
+def _parse_lines(lines):
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            command = json.loads(line)
+        except ValueError as e:
+            yield {"line": line_number, "error": f"Invalid JSON: {e}"}
+            continue
+        if not isinstance(command, dict):
+            yield {"line": line_number, "error": "A command must be a JSON object."}
+            continue
+        command["line"] = line_number
+        if command.get("command") not in HANDLERS:
+            command["error"] = f"Unknown command '{command.get('command')}', the commands are: {', '.join(HANDLERS)}."
+        yield command
+
+
+# Generator of the groups of commands: consecutive commands of a grouped kind are put together up to
+# batch_size commands, the other commands (and the invalid lines) are groups of one.
+def _groups(commands, batch_size: int):
+    group: list[dict] = []
+    for command in commands:
+        name = command.get("command") if "error" not in command else None
+        if group and (name not in GROUPED_COMMANDS or group[0]["command"] != name or len(group) >= batch_size):
+            yield group
+            group = []
+        if name in GROUPED_COMMANDS:
+            group.append(command)
+        else:
+            yield [command]
+    if group:
+        yield group
+
+
+# Run the JSON-lines commands of lines as the given user and write one JSON result line for each command
+# to output, in the order of the commands. The read groups run in parallel on a pool of workers threads,
+# each write group waits for the previous commands and runs alone.
+# Returns a summary with the number of commands, successes, errors and groups.
+def run_batch(lines, output, user: User, workers: int = DEFAULT_WORKERS,
+              batch_size: int = mdb_api.DEFAULT_BATCH_SIZE) -> dict:
+    if batch_size < 1:
+        raise ValueError("batch_size must be greater than zero.")
+    start = time.perf_counter()
+    summary = {"commands": 0, "ok": 0, "errors": 0, "groups": 0, "elapsed": 0.0}
+
+    # Write the results of a group.
+    def write(results: list[dict]) -> None:
+        for result in results:
+            output.write(json.dumps(result) + "\n")
+            summary["commands"] += 1
+            summary["ok" if result["ok"] else "errors"] += 1
+
+    pending = deque()  # Futures of the read groups in the order of the commands
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="batch") as pool:
+        for group in _groups(_parse_lines(lines), batch_size):
+            summary["groups"] += 1
+            if group[0].get("command") in WRITE_COMMANDS and "error" not in group[0]:
+                while pending:
+                    write(pending.popleft().result())
+                write(_run_group(group, user))
+            else:
+                pending.append(pool.submit(_run_group, group, user))
+                # At most two groups per worker wait, so the results are written while the input is read.
+                while len(pending) > 2 * workers or (pending and pending[0].done()):
+                    write(pending.popleft().result())
+        while pending:
+            write(pending.popleft().result())
+    output.flush()
+    summary["elapsed"] = time.perf_counter() - start
+    return summary
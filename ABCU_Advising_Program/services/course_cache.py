@@ -0,0 +1,110 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          course_cache.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   In-process read-through cache used by the database API to
+#               avoid a MongoDB round trip for every course lookup.
+# ============================================================================
+
+
+# Modules imports
+import time  # Monotonic clock used for the entries expiration
+import threading  # Lock to share the cache between threads
+from collections import OrderedDict  # Ordered dictionary used to keep the LRU order
+
+
+# Value stored for the course numbers that are not present in the database (negative caching).
+MISSING = object()
+
+
+# Default number of seconds an unknown course number stays cached, so a course inserted by another process
+# is found after a short time even when the cached courses never expire.
+DEFAULT_MISSING_TTL = 30.0
+
+
+# Bounded LRU cache with an optional time to live for the entries.
+# The cache stores course objects (or MISSING for unknown course numbers) by course number.
+# Every invalidation increases the cache generation: a reader takes the generation before reading the database
+# and passes it to put, so a value read before a concurrent write and invalidation is not stored after it.
+class CourseCache:
+
+    def __init__(self, max_size: int = 10000, ttl: float | None = None,
+                 missing_ttl: float | None = DEFAULT_MISSING_TTL):
+        self.max_size = max_size  # Maximum number of entries, 0 disables the cache
+        self.ttl = ttl  # Seconds an entry stays valid, None means no expiration
+        self.missing_ttl = missing_ttl  # Seconds a MISSING entry stays valid (also limited by ttl)
+        self.generation = 0  # Increased by every invalidation
+        self._entries: OrderedDict = OrderedDict()  # course number -> (value, store time)
+        self._lock = threading.Lock()  # Protects the entries when the cache is used by many threads
+        # Counters to check the cache efficiency.
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # Return the cached value for the course number, MISSING for a cached unknown course
+    # or None when the course number is not in the cache.
+    def get(self, course_number: str):
+        with self._lock:
+            entry = self._entries.get(course_number)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, stored_at = entry
+            # Drop the entry if it is too old and count it as a miss.
+            ttl = self.ttl
+            if value is MISSING and self.missing_ttl is not None:
+                ttl = self.missing_ttl if ttl is None else min(ttl, self.missing_ttl)
+            if ttl is not None and time.monotonic() - stored_at > ttl:
+                del self._entries[course_number]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            # Mark the entry as the most recently used.
+            self._entries.move_to_end(course_number)
+            self.hits += 1
+            return value
+
+    # Store a course (or MISSING) in the cache removing the least recently used entries when full.
+    # When generation is given the value is stored only if no invalidation happened since it was taken.
+    def put(self, course_number: str, value, generation: int | None = None) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[course_number] = (value, time.monotonic())
+            self._entries.move_to_end(course_number)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    # Remove the given course numbers from the cache.
+    def invalidate(self, course_numbers) -> None:
+        with self._lock:
+            self.generation += 1
+            for course_number in course_numbers:
+                self._entries.pop(course_number, None)
+
+    # Remove all the entries from the cache.
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    # Return the cache counters.
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "missing_ttl": self.missing_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
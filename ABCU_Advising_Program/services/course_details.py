@@ -0,0 +1,194 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          course_details.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Materialized course-detail documents: prerequisite names,
+#               direct dependents and prerequisite depth of each course,
+#               kept by the storage backend and recomputed only for the
+#               courses affected by a catalog change.
+# ============================================================================
+
+
+# Modules imports
+import hashlib  # Hash of the detail documents
+from bisect import bisect_left, insort  # Sorted lists of the dependents
+from services.backends.base import StorageBackend  # Storage backend interface
+
+
+# A detail document has:
+#   number         course number
+#   name           course name (None when the course is not in the catalog)
+#   in_catalog     False for the placeholder of a prerequisite missing from the catalog: it keeps the courses
+#                  that need it, so they are found when the course is added
+#   prerequisites  list of {"number", "name"} of the direct prerequisites, name None when not in the catalog
+#   dependents     sorted numbers of the courses that have this course as direct prerequisite
+#   depth          length of the longest prerequisite chain before the course (None inside a prerequisite cycle)
+#   content_hash   hash of the other fields, changes whenever the rendered course changes
+def _placeholder(number: str) -> dict:
+    return {"number": number, "name": None, "in_catalog": False, "prerequisites": [], "dependents": [],
+            "depth": 0}
+
+
+# Return the hash of a detail document. The fields are strings, numbers and lists of them, so their repr is a
+# stable serialization (faster than JSON, which counts when a whole catalog is hashed).
+def detail_hash(detail: dict) -> str:
+    content = repr((detail["number"], detail["name"], detail["in_catalog"],
+                    [(prereq["number"], prereq["name"]) for prereq in detail["prerequisites"]],
+                    detail["dependents"], detail["depth"]))
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+# Return the given course numbers ordered so that each course comes after its prerequisites in the set
+# (Kahn algorithm on the set only) and the courses that could not be placed: they are on a prerequisite cycle
+# of the set or after one, and are put at the end of the order.
+def _prerequisites_first(numbers: set[str], details: dict[str, dict]) -> tuple[list[str], set[str]]:
+    missing = {number: sum(1 for prereq in details[number]["prerequisites"] if prereq["number"] in numbers)
+               for number in numbers}
+    order = [number for number, count in missing.items() if count == 0]
+    for number in order:  # The list grows while it is traversed
+        for dep in details[number]["dependents"]:
+            if dep in missing:
+                missing[dep] -= 1
+                if missing[dep] == 0:
+                    order.append(dep)
+    unplaced = set()
+    if len(order) < len(numbers):
+        unplaced = set(numbers).difference(order)
+        order.extend(unplaced)
+    return order, unplaced
+
+
+# Update the stored details after the given course documents (number, name, prerequisites) were written and
+# the removed course numbers deleted. Only the details of the changed courses, of their old and new
+# prerequisites and of the courses whose prerequisite names or depth change are read and written: each round
+# reads the details it needs with one query and all the changes are written at the end with one call.
+# Returns the number of written and deleted details.
+def refresh_course_details(backend: StorageBackend, courses, removed=()) -> int:
+    changed: dict[str, dict] = {}
+    for course in courses:
+        # Only the first definition of a course is used, the missing fields have the defaults of Course.from_dict.
+        if course["number"] not in changed:
+            changed[course["number"]] = {"name": course.get("name", ""),
+                                         "prerequisites": list(course.get("prerequisites", ()))}
+    removed = [number for number in dict.fromkeys(removed) if number not in changed]
+    details: dict[str, dict] = {}  # Details read or created, by course number
+    stored_hashes: dict[str, str] = {}  # Hash of the details as stored
+
+    # Read the details of the given numbers that are not read yet.
+    def load(numbers) -> None:
+        missing = [number for number in dict.fromkeys(numbers) if number not in details]
+        if missing:
+            for detail in backend.find_course_details(missing):
+                details[detail["number"]] = detail
+                stored_hashes[detail["number"]] = detail.get("content_hash")
+
+    def get(number: str) -> dict:
+        if number not in details:
+            details[number] = _placeholder(number)
+        return details[number]
+
+    load([*changed, *removed])
+    old_prereqs = {number: [prereq["number"] for prereq in details[number]["prerequisites"]]
+                   for number in [*changed, *removed] if number in details}
+    load([prereq for course in changed.values() for prereq in course["prerequisites"]] +
+         [prereq for prereqs in old_prereqs.values() for prereq in prereqs])
+
+    # Move the course between the dependents of its old and new prerequisites.
+    def unlink(number: str, prereqs) -> None:
+        for prereq in prereqs:
+            dependents = details[prereq]["dependents"] if prereq in details else []
+            position = bisect_left(dependents, number)
+            if position < len(dependents) and dependents[position] == number:
+                del dependents[position]
+
+    renamed = set()  # Courses whose name or presence in the catalog changed
+    dirty = set()  # Courses whose prerequisite names and depth must be computed again
+    linked = set()  # Courses with a new prerequisite, every new prerequisite cycle goes through one of them
+    for number, course in changed.items():
+        detail = get(number)
+        new_prereqs = list(dict.fromkeys(course["prerequisites"]))
+        old = set(old_prereqs.get(number, ()))
+        if old:
+            unlink(number, old.difference(new_prereqs))
+        for prereq in new_prereqs:
+            if prereq not in old:
+                insort(get(prereq)["dependents"], number)
+                linked.add(number)
+        if detail["name"] != course["name"] or not detail["in_catalog"]:
+            renamed.add(number)
+        detail.update(name=course["name"], in_catalog=True,
+                      prerequisites=[{"number": prereq, "name": None} for prereq in new_prereqs])
+        dirty.add(number)
+    for number in removed:
+        if number not in details:
+            continue
+        unlink(number, old_prereqs[number])
+        details[number].update(name=None, in_catalog=False, prerequisites=[], depth=0)
+        renamed.add(number)
+    # The courses that list a renamed course show its name.
+    for number in renamed:
+        dirty.update(details[number]["dependents"])
+
+    # A new cycle contains a course with a new prerequisite and every course of the cycle comes after it, so the
+    # Kahn algorithm on those courses and the courses after them finds the courses on a new cycle or after one.
+    # They get depth None. The stored details already have depth None on the cycles that were not changed.
+    reached = set(linked)
+    frontier = list(linked)
+    while frontier:
+        load(frontier)
+        frontier = list(dict.fromkeys(dep for number in frontier if number in details
+                                      for dep in details[number]["dependents"] if dep not in reached))
+        reached.update(frontier)
+    cyclic = _prerequisites_first(reached.intersection(details), details)[1] if reached else set()
+    dirty.update(cyclic)
+
+    # Compute the prerequisite names and the depth of the dirty courses. Each round visits its courses after their
+    # prerequisites of the same round, so a course whose depth changes makes dirty for the next round only the
+    # dependents that were not visited yet. The depth of the cyclic courses is None, so it stops changing.
+    while dirty:
+        load(dirty)
+        load(prereq["number"] for number in dirty if number in details
+             for prereq in details[number]["prerequisites"])
+        remaining = {number for number in dirty if number in details and details[number]["in_catalog"]}
+        next_dirty = set()
+        for number in _prerequisites_first(remaining, details)[0]:
+            remaining.discard(number)
+            detail = details[number]
+            prereqs = [details.get(prereq["number"]) for prereq in detail["prerequisites"]]
+            detail["prerequisites"] = [{"number": prereq["number"],
+                                        "name": found["name"] if found is not None else None}
+                                       for prereq, found in zip(detail["prerequisites"], prereqs)]
+            depths = [found["depth"] for found in prereqs if found is not None and found["in_catalog"]]
+            if number in cyclic or None in depths:
+                depth = None
+            else:
+                depth = 1 + max(depths) if depths else 0
+            if depth != detail["depth"]:
+                detail["depth"] = depth
+                next_dirty.update(dep for dep in detail["dependents"] if dep not in remaining)
+        dirty = next_dirty
+
+    upserts = []
+    deleted = []
+    for number, detail in details.items():
+        if not detail["in_catalog"] and not detail["dependents"]:
+            # Placeholder no longer needed by any course.
+            if number in stored_hashes:
+                deleted.append(number)
+            continue
+        detail["content_hash"] = detail_hash(detail)
+        if stored_hashes.get(number) != detail["content_hash"]:
+            upserts.append(detail)
+    if not upserts and not deleted:
+        return 0
+    return backend.write_course_details(upserts, deleted)
+
+
+# Build the details of the whole catalog again from the stored courses, replacing the stored details.
+# Returns the number of details written.
+def rebuild_course_details(backend: StorageBackend, batch_size: int = 1000) -> int:
+    backend.clear_course_details()
+    courses = list(backend.iter_courses(fields=["name", "prerequisites"], batch_size=batch_size))
+    return refresh_course_details(backend, courses)
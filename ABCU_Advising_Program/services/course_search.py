@@ -0,0 +1,186 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          course_search.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   In-memory search index of the catalog: prefix and range
+#               queries on the sorted course numbers (like the binary search
+#               tree of the original program) and word search on the names.
+# ============================================================================
+
+
+# Modules imports
+import heapq  # Selection of the best results
+import re  # Used to split the names into words
+import threading  # Lock to share the index between threads
+from bisect import bisect_left, bisect_right, insort  # Sorted lists of course numbers and words
+
+
+# Words are sequences of letters and digits, compared in lower case.
+_WORD = re.compile(r"[^\W_]+")
+
+
+# Return the distinct lower case words of a text.
+def tokenize(text: str) -> list[str]:
+    return list(dict.fromkeys(_WORD.findall(text.lower())))
+
+
+# Search index of the course numbers and names.
+# The course numbers are kept in a sorted list, so prefix and range queries are two binary searches.
+# Each word of the names (and each course number) points to the set of courses that contain it.
+class CourseSearchIndex:
+
+    def __init__(self, courses=()):
+        self.names: dict[str, str] = {}  # course number -> course name
+        self.numbers: list[str] = []  # sorted course numbers
+        self.postings: dict[str, set[str]] = {}  # word -> course numbers that contain it
+        self.words: list[str] = []  # sorted words, used to complete the last word of a query
+        self._ranked_postings: dict[str, list[str]] = {}  # word -> its courses sorted by rank, built on use
+        self._lock = threading.Lock()  # Protects the index when it is used by many threads
+        # Bulk build: the lists are sorted once at the end instead of inserting each course in order.
+        for number, name in courses:
+            if number not in self.names:
+                self.names[number] = name
+                self._add_words(number, name)
+        self.numbers = sorted(self.names)
+        self.words = sorted(self.postings)
+
+    # Add the words of a course to the postings, returns the words that are new to the index.
+    def _add_words(self, number: str, name: str) -> list[str]:
+        new_words = []
+        for word in tokenize(f"{number} {name}"):
+            courses = self.postings.get(word)
+            if courses is None:
+                courses = self.postings[word] = set()
+                new_words.append(word)
+            courses.add(number)
+            self._ranked_postings.pop(word, None)
+        return new_words
+
+    # Remove a course from the index, the caller holds the lock.
+    def _remove(self, number: str) -> None:
+        name = self.names.pop(number)
+        del self.numbers[bisect_left(self.numbers, number)]
+        for word in tokenize(f"{number} {name}"):
+            courses = self.postings[word]
+            courses.discard(number)
+            self._ranked_postings.pop(word, None)
+            if not courses:
+                del self.postings[word]
+                del self.words[bisect_left(self.words, word)]
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    # Add a course or replace the name of a course already in the index.
+    def add(self, number: str, name: str) -> None:
+        with self._lock:
+            if number in self.names:
+                self._remove(number)
+            self.names[number] = name
+            insort(self.numbers, number)
+            for word in self._add_words(number, name):
+                insort(self.words, word)
+
+    # Remove a course, nothing happens if it is not in the index.
+    def remove(self, number: str) -> None:
+        with self._lock:
+            if number in self.names:
+                self._remove(number)
+
+    # Remove all the courses.
+    def clear(self) -> None:
+        with self._lock:
+            self.names.clear()
+            self.numbers.clear()
+            self.postings.clear()
+            self.words.clear()
+            self._ranked_postings.clear()
+
+    # Return the (number, name) of the courses whose number starts with prefix, sorted by number.
+    def prefix(self, prefix: str, limit: int | None = None) -> list[tuple[str, str]]:
+        with self._lock:
+            start = bisect_left(self.numbers, prefix)
+            results = []
+            for number in self.numbers[start:start + limit if limit is not None else None]:
+                if not number.startswith(prefix):
+                    break
+                results.append((number, self.names[number]))
+            return results
+
+    # Return the (number, name) of the courses with low <= number <= high, sorted by number.
+    def range(self, low: str, high: str, limit: int | None = None) -> list[tuple[str, str]]:
+        with self._lock:
+            start = bisect_left(self.numbers, low)
+            end = bisect_right(self.numbers, high)
+            if limit is not None:
+                end = min(end, start + limit)
+            return [(number, self.names[number]) for number in self.numbers[start:end]]
+
+    # Rank of a course in the search results: shorter names first, then by number.
+    def _rank(self, number: str) -> tuple:
+        return len(self.names[number]), number
+
+    # Return the courses containing the word sorted by rank. The sorted lists are built on first use and
+    # dropped when a course with the word is added or removed.
+    def _ranked(self, word: str) -> list[str]:
+        ranked = self._ranked_postings.get(word)
+        if ranked is None:
+            ranked = self._ranked_postings[word] = sorted(self.postings[word], key=self._rank)
+        return ranked
+
+    # Return the words that start with the given text (the text itself included when it is a word).
+    def _completions(self, text: str) -> list[str]:
+        start = bisect_left(self.words, text)
+        end = bisect_left(self.words, text + "\U0010ffff")
+        return self.words[start:end]
+
+    # Return the k best (number, name) for the words of the query. A course matches when its number and
+    # name contain all the words, the last word can also be the start of a word (search while typing).
+    # The courses containing the last word exactly come first, then the ones with a word starting with it;
+    # inside each group the shortest names come first.
+    def search(self, query: str, k: int = 10) -> list[tuple[str, str]]:
+        words = tokenize(query)
+        if not words or k <= 0:
+            return []
+        *required_words, last = words
+        with self._lock:
+            required = []  # Courses of the words that must be present exactly
+            for word in required_words:
+                if word not in self.postings:
+                    return []
+                required.append(self.postings[word])
+            required.sort(key=len)  # The smallest sets reject the most courses
+            completions = self._completions(last)
+            exact = last in self.postings
+            partial = [word for word in completions if word != last]
+
+            # When a required word is rare, rank its few courses directly.
+            if required and len(required[0]) <= 4 * k + sum(len(self.postings[word]) for word in completions) // 8:
+                def group(number: str) -> int | None:
+                    if exact and number in self.postings[last]:
+                        return 0
+                    if any(number in self.postings[word] for word in partial):
+                        return 1
+                    return None
+                candidates = [(group(number), number) for number in required[0]
+                              if all(number in courses for courses in required[1:])]
+                best = heapq.nsmallest(k, ((g, *self._rank(n)) for g, n in candidates if g is not None))
+                return [(number, self.names[number]) for _, _, number in best]
+
+            # Otherwise walk the ranked courses of the last word (and of its completions) and keep the ones
+            # that contain the required words, stopping after k results.
+            results = []
+            seen: set[str] = set()
+            groups = ([self._ranked(last)] if exact else [], [self._ranked(word) for word in partial])
+            for lists in groups:
+                for number in heapq.merge(*lists, key=self._rank):
+                    if number in seen:
+                        continue
+                    seen.add(number)
+                    if all(number in courses for courses in required):
+                        results.append((number, self.names[number]))
+                        if len(results) == k:
+                            return results
+            return results
@@ -0,0 +1,191 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          eligibility.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Bulk eligibility engine: computes the courses that every student
+#               can take now with bitsets, sharding the students across
+#               processes, and exports the result as CSV.
+# ============================================================================
+
+
+# Modules imports
+import csv  # Writing of the exported files
+import os  # OS tools
+import time  # Used to measure the report timings
+from collections import deque  # Shards waiting for their results
+from concurrent.futures import ProcessPoolExecutor  # Pool of processes evaluating the shards
+from itertools import chain, islice  # Used to split the students into shards
+from models.prereq_graph import PrerequisiteGraph  # Graph of the course prerequisites
+from services import mdb_api  # Database API, used to read the students
+
+
+# Default number of students evaluated together in a shard.
+DEFAULT_SHARD_SIZE = 20000
+
+
+# Return the positions of the bits set in a bitset in increasing order.
+def _bit_positions(bitset: int) -> list[int]:
+    # The binary text is reversed so the position in the text is the bit position, str.find skips the zeros in C.
+    text = bin(bitset)[:1:-1]
+    positions = []
+    position = text.find("1")
+    while position >= 0:
+        positions.append(position)
+        position = text.find("1", position + 1)
+    return positions
+
+
+# Return the bitset with the given bit positions set.
+def _bitset(positions: list[int], size: int) -> int:
+    data = bytearray((size + 7) // 8)
+    for position in positions:
+        data[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(data, "little")
+
+
+# Eligibility of many students at once.
+# The students of a shard are numbered and each course becomes a bitset with a bit for every student that
+# completed it. The students that can take a course are then computed for the whole shard with a few integer
+# operations: those who did not complete the course AND completed each of its prerequisites.
+class EligibilityEngine:
+
+    def __init__(self, graph: PrerequisiteGraph):
+        # Columns: the catalog courses sorted by number, then the prerequisites that are not in the catalog
+        # (they are not reported but they must have been completed like any other prerequisite).
+        self.numbers: list[str] = sorted(graph.numbers)
+        self.names: list[str] = [graph.names[graph.index[number]] for number in self.numbers]
+        self.columns: dict[str, int] = {number: column for column, number in enumerate(self.numbers)}
+        self.requirements: list[tuple[int, ...]] = []  # column -> prerequisite columns
+        for number in self.numbers:
+            i = graph.index[number]
+            prereqs = [graph.numbers[p] for p in graph.prereqs[i]] + list(graph.unknown_prereqs.get(i, ()))
+            for prereq in prereqs:
+                self.columns.setdefault(prereq, len(self.columns))
+            self.requirements.append(tuple(self.columns[prereq] for prereq in prereqs))
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    # Evaluate a shard of completed courses lists, one for each student.
+    # Returns the number of eligible students of each course and, when with_courses is True, the eligible
+    # course columns of each student in course number order (None otherwise).
+    def evaluate(self, completed_lists: list, with_courses: bool = True) -> tuple[list[int], list | None]:
+        size = len(completed_lists)
+        takers: dict[int, list[int]] = {}  # column -> students that completed it
+        for student, completed in enumerate(completed_lists):
+            for number in completed:
+                column = self.columns.get(number)
+                if column is not None:
+                    takers.setdefault(column, []).append(student)
+        done = {column: _bitset(students, size) for column, students in takers.items()}
+
+        everyone = (1 << size) - 1
+        counts = []
+        courses = [[] for _ in range(size)] if with_courses else None
+        for column, requirements in enumerate(self.requirements):
+            eligible = everyone ^ done.get(column, 0)
+            for prereq in requirements:
+                if not eligible:
+                    break
+                eligible &= done.get(prereq, 0)
+            counts.append(eligible.bit_count())
+            if with_courses and eligible:
+                for student in _bit_positions(eligible):
+                    courses[student].append(column)
+        return counts, courses
+
+
+# Engine of the worker process, set once by the pool initializer so it is not sent with every shard.
+_engine: EligibilityEngine | None = None
+
+
+def _set_engine(engine: EligibilityEngine) -> None:
+    global _engine
+    _engine = engine
+
+
+# Evaluate a shard in a worker process.
+def _evaluate_shard(completed_lists: list, with_courses: bool) -> tuple[list[int], list | None]:
+    return _engine.evaluate(completed_lists, with_courses)
+
+
+# Compute the eligibility of all the students given as (email, completed courses) pairs.
+# The students are evaluated in shards of shard_size; when there is more than one shard they are evaluated
+# in parallel by a pool of at most workers processes (0 or None means one per core).
+# With csv_path the eligible pairs are written as "email,course number" rows (the format read by the completed
+# courses import), with summary_path the "course number,course name,eligible students" rows.
+# Returns a report with the number of eligible students of each course.
+def eligibility_report(students, graph: PrerequisiteGraph, csv_path: str | None = None,
+                       summary_path: str | None = None, workers: int | None = 1,
+                       shard_size: int = DEFAULT_SHARD_SIZE) -> dict:
+    if shard_size < 1:
+        raise ValueError("shard_size must be greater than zero.")
+    start = time.perf_counter()
+    engine = EligibilityEngine(graph)
+    with_courses = csv_path is not None
+    report = {"students": 0, "pairs": 0, "shards": 0, "counts": {}, "elapsed": 0.0}
+    totals = [0] * len(engine)  # Eligible students of each course
+
+    # Take shard_size students at a time until the iterable is exhausted.
+    iterator = iter(students)
+    shards = iter(lambda: list(islice(iterator, shard_size)), [])
+    # The first two shards are read ahead: with a single shard no pool is started.
+    first_shards = list(islice(shards, 2))
+    shards = chain(first_shards, shards)
+
+    workers = workers or os.cpu_count() or 1
+    pool = None
+    if workers > 1 and len(first_shards) > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_set_engine, initargs=(engine,))
+    pairs_file = open(csv_path, "w", newline="", encoding="utf-8") if with_courses else None
+    try:
+        writer = csv.writer(pairs_file) if with_courses else None
+
+        # Record the result of a shard, the shards are recorded in the order of the students.
+        def record(emails: list[str], counts: list[int], courses) -> None:
+            report["students"] += len(emails)
+            report["shards"] += 1
+            for column, count in enumerate(counts):
+                totals[column] += count
+            if with_courses:
+                for email, columns in zip(emails, courses):
+                    writer.writerows((email, engine.numbers[column]) for column in columns)
+
+        if pool is None:
+            for shard in shards:
+                record([email for email, _ in shard],
+                       *engine.evaluate([completed for _, completed in shard], with_courses))
+        else:
+            # At most two shards per worker are pending, so the students read ahead stay few.
+            pending = deque()
+            for shard in shards:
+                pending.append(([email for email, _ in shard],
+                                pool.submit(_evaluate_shard, [completed for _, completed in shard], with_courses)))
+                if len(pending) >= 2 * workers:
+                    emails, future = pending.popleft()
+                    record(emails, *future.result())
+            while pending:
+                emails, future = pending.popleft()
+                record(emails, *future.result())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if pairs_file is not None:
+            pairs_file.close()
+
+    report["counts"] = dict(zip(engine.numbers, totals))
+    report["pairs"] = sum(totals)
+    if summary_path is not None:
+        with open(summary_path, "w", newline="", encoding="utf-8") as summary_file:
+            csv.writer(summary_file).writerows(zip(engine.numbers, engine.names, totals))
+    report["elapsed"] = time.perf_counter() - start
+    return report
+
+
+# Generator of the (email, completed courses) pairs of the students stored in the database, sorted by email.
+def iter_student_completions():
+    for user in mdb_api.iter_users(fields=["role", "completed_courses"]):
+        if user.get("role", "student") == "student":
+            yield user["email"], user.get("completed_courses", [])
@@ -5,118 +5,688 @@
 # Version       1.0
 # Date          June 7, 2025
 # Description   Database integration API to move the data from the original
-#               binary search tree structure to a MongoDB database.
+#               binary search tree structure to a MongoDB database. The data
+#               is stored by a pluggable backend (MongoDB, SQLite or memory).
 # ============================================================================
 
 
 # Modules imports
-from pymongo import MongoClient, ASCENDING  # Import the Phyton MongoDB client
+# The storage backend (and with it pymongo and dotenv) is loaded only when the data is used for the first time,
+# so the commands that do not need the database (like the CSV to JSON conversion) start quickly.
 from models.course import Course  # Import the Course class
-from dotenv import load_dotenv  # Import the environment variable loading tool
 import os  # OS tools
+import threading  # Lock used to create the storage backend only once
+import time  # Used to measure the bulk loading timings
+from itertools import islice  # Used to split an iterable into batches
 from models.user import User  # Import the User class definition
+from services.backends.base import StorageBackend  # Storage backend interface
+from services.course_cache import CourseCache, MISSING, DEFAULT_MISSING_TTL  # In-process cache for the course lookups
+from models.prereq_graph import PrerequisiteGraph  # Graph of the course prerequisites
+from services.course_search import CourseSearchIndex  # Prefix, range and word search on the catalog
+from services import course_details  # Materialized course-detail documents
+from utils.metrics import timed  # Timing registry of the API calls (collected when ABCU_METRICS=1)
 
 
-# MongoDB object to connect to the local database
-load_dotenv()  # Load environment variables
-# Create database connection using the MONGODB_URI environment variable for safe connection with user and password
-mongo_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
-client_mdb = MongoClient(mongo_uri)
+# Storage backend used by the API, created on first use by get_backend().
+_backend: StorageBackend | None = None
+_backend_lock = threading.Lock()
 
-# Create or prepare the access to a database named "abcu_advising"
-db = client_mdb["abcu_advising"]
 
-# Create or prepare the access to the "courses" and "users" collection in the database.
-courses_coll = db["courses"]
-users_coll = db["users"]
+# Create the storage backend selected by the environment variables (also read from the .env file):
+#   STORAGE_BACKEND  mongodb (default), sqlite or memory
+#   SQLITE_PATH      database file of the sqlite backend (default abcu_advising.db)
+# The MongoDB connection settings are described in services/backends/mongo_backend.py.
+def _create_backend() -> StorageBackend:
+    kind = os.getenv("STORAGE_BACKEND", "mongodb").lower()
+    if kind == "mongodb":
+        from services.backends.mongo_backend import MongoBackend
+        return MongoBackend()
+    if kind == "sqlite":
+        from services.backends.sqlite_backend import SQLiteBackend
+        return SQLiteBackend(os.getenv("SQLITE_PATH", "abcu_advising.db"))
+    if kind == "memory":
+        from services.backends.memory_backend import MemoryBackend
+        return MemoryBackend()
+    raise ValueError(f"Unknown STORAGE_BACKEND {kind!r}, expected mongodb, sqlite or memory.")
+
+
+# Return the storage backend creating it the first time.
+# The backend is published only after its indexes are in place, so no thread can insert before the unique
+# indexes exist. The lock is held only on the first call.
+def get_backend() -> StorageBackend:
+    global _backend
+    backend = _backend
+    if backend is not None:
+        return backend
+    with _backend_lock:
+        if _backend is None:
+            from dotenv import load_dotenv  # Import the environment variable loading tool
+            load_dotenv()  # Load environment variables
+            _configure_course_cache()  # The .env file can also contain the cache settings
+            backend = _create_backend()
+            # Prepare the indexes when the service layer is initialized.
+            # Creating an index that already exists does nothing, so the call is cheap after the first run.
+            backend.ensure_indexes()
+            _backend = backend
+        return _backend
+
+
+# Cache in front of the course lookups. The catalog is read almost only, so most lookups are served from memory.
+# COURSE_CACHE_SIZE sets the maximum number of cached courses (0 disables the cache),
+# COURSE_CACHE_TTL the number of seconds a cached course stays valid (empty means forever) and
+# COURSE_CACHE_MISSING_TTL the number of seconds an unknown course number stays cached (empty means forever).
+course_cache = CourseCache()
+# Cache in front of the course detail lookups (menu option 2), with the same settings. A course write can change
+# the details of many other courses (their dependents, prerequisite names and depths), so every write of the
+# details empties it instead of invalidating single entries.
+course_detail_cache = CourseCache()
+
+
+# Apply the cache settings of the environment, called again when the .env file is loaded.
+def _configure_course_cache() -> None:
+    missing_ttl = os.getenv("COURSE_CACHE_MISSING_TTL", str(DEFAULT_MISSING_TTL))
+    for cache in (course_cache, course_detail_cache):
+        cache.max_size = int(os.getenv("COURSE_CACHE_SIZE", "10000"))
+        cache.ttl = float(os.getenv("COURSE_CACHE_TTL")) if os.getenv("COURSE_CACHE_TTL") else None
+        cache.missing_ttl = float(missing_ttl) if missing_ttl else None
+
+
+_configure_course_cache()
+
+# Prerequisite graph of the whole catalog, built on first use and dropped when the catalog changes.
+_prerequisite_graph: PrerequisiteGraph | None = None
+# Search index of the catalog, built on first use and kept up to date by the functions writing the courses.
+_search_index: CourseSearchIndex | None = None
+_search_index_lock = threading.Lock()
+# The course details are updated by the functions writing the courses. The first update (or read) of each backend
+# builds them from the whole catalog when they are missing, for example in a database loaded by an older version.
+_course_details_checked = False
+_course_details_lock = threading.RLock()
+
+
+# Return the course numbers that are stored more than once in the courses collection.
+@timed(rows=len)
+def find_duplicate_courses() -> list[dict]:
+    return get_backend().find_duplicate_courses()
+
+
+# Return the emails that are stored more than once in the users collection.
+@timed(rows=len)
+def find_duplicate_users() -> list[dict]:
+    return get_backend().find_duplicate_users()
+
+
+# Remove the duplicated courses keeping only the first inserted document of each course number.
+# Returns the number of deleted documents.
+@timed(rows=int)
+def dedupe_courses() -> int:
+    deleted = get_backend().dedupe_courses()
+    if deleted:
+        # The cached courses could come from one of the deleted documents.
+        course_cache.clear()
+        _catalog_changed()
+        _drop_search_index()
+        rebuild_course_details()
+    return deleted
+
+
+# Create the indexes used by the application queries (unique course number and email, sorted listing).
+# If the stored data already contains duplicates the unique indexes cannot be built, so the duplicates are
+# reported and the indexes are created again after running dedupe_courses().
+# Returns True when all the indexes are in place.
+@timed()
+def ensure_indexes() -> bool:
+    return get_backend().ensure_indexes()
+
+
+# Drop the data derived from the whole catalog so it is rebuilt on the next use.
+def _catalog_changed():
+    global _prerequisite_graph
+    _prerequisite_graph = None
+
+
+# Replace the storage backend used by the API, for example with a MemoryBackend for tests.
+def use_backend(backend: StorageBackend) -> None:
+    global _backend, _course_details_checked
+    with _backend_lock:
+        backend.ensure_indexes()
+        _backend = backend
+    _course_details_checked = False
+    # The cached data belongs to the previous backend.
+    course_cache.clear()
+    course_detail_cache.clear()
+    _catalog_changed()
+    _drop_search_index()
+
+
+# Replace the collections used by the API, for example with an in-memory stand-in (like mongomock) for tests.
+def use_collections(courses_collection, users_collection) -> None:
+    from services.backends.mongo_backend import MongoBackend
+    use_backend(MongoBackend(courses_collection, users_collection))
 
 
 # Function to insert a course inside the courses collection.
-def insert_course(course: Course):
+@timed()
+def insert_course(course: Course) -> bool:
     # Insert the course by first converting it from a dataclass to a dictionary.
-    courses_coll.insert_one(course.__dict__)
+    document = _course_to_document(course)
+    try:
+        if not get_backend().insert_course(document):
+            # The unique course number rejects a course that is already present.
+            print(f"Course number {course.number} already exists.")
+            return False
+    finally:
+        # The course may be cached as missing, so drop it from the cache.
+        course_cache.invalidate([course.number])
+    _catalog_changed()
+    _update_search_index(added=[course])
+    _refresh_course_details([document])
+    return True
+
+
+# Default number of courses sent to the database in a single bulk insert.
+DEFAULT_BATCH_SIZE = 1000
+# Default number of documents in a page returned by the paginated listings.
+DEFAULT_PAGE_SIZE = 100
+
+
+# Fields read from the storage to build the course objects (the number is always read).
+COURSE_READ_FIELDS = ["name", "prerequisites"]
+
+
+# Convert a course object to the dictionary stored in the courses collection.
+def _course_to_document(course: Course) -> dict:
+    # Copy the data so the course object is not modified by the storage.
+    # The content hash is stored to find the changed courses when the catalog is synchronized.
+    return {**course.to_dict(), "content_hash": course.content_hash()}
+
+
+# Function to insert many courses inside the courses collection using unordered bulk inserts.
+# The courses are sent in batches of batch_size documents, so one round trip is done per batch
+# instead of one per course. A failing batch is reported but does not stop the loading.
+# Returns a dictionary with the loading counters and timings.
+@timed(rows=lambda stats: stats["inserted"])
+def insert_courses(courses, batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+    if batch_size < 1:
+        raise ValueError("batch_size must be greater than zero.")
+
+    backend = get_backend()
+    stats = {"inserted": 0, "failed": 0, "batches": 0, "errors": [], "batch_times": [], "elapsed": 0.0}
+    start = time.perf_counter()
+    iterator = iter(courses)
+
+    # Take batch_size courses at a time until the iterable is exhausted.
+    while batch := [_course_to_document(course) for course in islice(iterator, batch_size)]:
+        stats["batches"] += 1
+        batch_start = time.perf_counter()
+        try:
+            # Unordered insert: the remaining documents are inserted after a failure.
+            inserted, messages = backend.insert_courses(batch)
+            stats["inserted"] += inserted
+            if inserted == len(batch):
+                _update_search_index(added=batch)
+                _refresh_course_details(batch)
+            else:
+                # The search index cannot tell which courses were written, it is built again on the next search.
+                _drop_search_index()
+                # The rejected courses are already stored, the details use the stored version of the batch.
+                _refresh_course_details(backend.find_courses([doc["number"] for doc in batch], COURSE_READ_FIELDS))
+                # Count what was written and keep a short report of the failed documents.
+                stats["failed"] += len(batch) - inserted
+                stats["errors"].append({
+                    "batch": stats["batches"],
+                    "failed": len(batch) - inserted,
+                    "messages": messages[:5]
+                })
+        except Exception as e:
+            # Any other failure (connection lost, timeout, ...) loses the whole batch only.
+            # The details of the courses written before the failure are added by rebuild_course_details().
+            stats["failed"] += len(batch)
+            stats["errors"].append({"batch": stats["batches"], "failed": len(batch), "messages": [str(e)]})
+            _drop_search_index()
+        # The inserted courses may be cached as missing, so drop them from the cache.
+        course_cache.invalidate(doc["number"] for doc in batch)
+        stats["batch_times"].append(time.perf_counter() - batch_start)
+
+    _catalog_changed()
+    stats["elapsed"] = time.perf_counter() - start
+    return stats
+
+
+# Convert a stored course document to a course object.
+def _document_to_course(course_data: dict) -> Course:
+    return Course.from_dict(course_data)
 
 
 # Function to find and return a course finding it by its number.
+@timed()
 def find_course_by_number(course_number: str) -> Course | None:
+    # Look in the cache first, a cached MISSING value means that the course is known to not exist.
+    cached = course_cache.get(course_number)
+    if cached is not None:
+        return None if cached is MISSING else cached
+
+    return _load_course(course_number)
+
+
+# Read a course from the database and store it in the cache, also when it does not exist.
+def _load_course(course_number: str) -> Course | None:
+    # The cache generation is taken before the query: if the course is written (and invalidated) meanwhile,
+    # the value read is not cached.
+    generation = course_cache.generation
     # Query the database to find the specified course number.
-    course_data = courses_coll.find_one({"number": course_number})
+    found = get_backend().find_courses([course_number], COURSE_READ_FIELDS)
 
-    # If course not found, return None
-    if course_data is None:
+    # If course not found, remember it in the cache and return None
+    if not found:
+        course_cache.put(course_number, MISSING, generation)
         return None
 
-    course_data.pop('_id', None)  # Remove the _id field that it is not necessary for the application.
-    return Course(**course_data) # Convert course_data to a course object using unpacking (**).
+    course = _document_to_course(found[0])
+    course_cache.put(course_number, course, generation)
+    return course
+
+
+# Function to find many courses with a single query.
+# Returns a dictionary with an entry for each requested course number, in the requested order:
+# the course object when found or None when the course does not exist.
+@timed(rows=len)
+def find_courses_by_numbers(course_numbers) -> dict[str, Course | None]:
+    found: dict[str, Course | None] = {}
+    to_query = []  # Course numbers that are not in the cache
+
+    # Serve the cached courses and collect the others.
+    for course_number in course_numbers:
+        if course_number in found:
+            continue
+        cached = course_cache.get(course_number)
+        if cached is None:
+            to_query.append(course_number)
+            found[course_number] = None  # Keep the requested order, filled after the query
+        else:
+            found[course_number] = None if cached is MISSING else cached
+
+    if to_query:
+        generation = course_cache.generation  # Taken before the query, like _load_course does
+        # Single round trip for all the missing course numbers.
+        for course_data in get_backend().find_courses(to_query, COURSE_READ_FIELDS):
+            course = _document_to_course(course_data)
+            found[course.number] = course
+            course_cache.put(course.number, course, generation)
+        # Remember the course numbers that do not exist.
+        for course_number in to_query:
+            if found[course_number] is None:
+                course_cache.put(course_number, MISSING, generation)
+
+    return found
+
+
+# Return the course cache counters (hits, misses, evictions, ...).
+def course_cache_stats() -> dict:
+    return course_cache.stats()
+
+
+# Return the course detail cache counters.
+def course_detail_cache_stats() -> dict:
+    return course_detail_cache.stats()
 
 
 # Function to return a sorted list of all the course present in the courses' collection.
+@timed(rows=len)
 def list_courses_sorted() -> list[Course]:
-    # Temporary list to load the courses
-    course_list = []
-
     # Scan the database courses collection in ascending order to populate the course list.
-    for course_data in courses_coll.find().sort("number", ASCENDING):
-        course_data.pop('_id', None)  # Remove the _id field that it is not necessary for the application.
-        # Append the course to the list converting it back to a course object using unpacking (**)
-        course_list.append(Course(**course_data))
+    return list(iter_courses_sorted())
+
+
+# Generator over the courses sorted by number, without loading all of them in memory.
+# after:      resume key, the courses are read starting after this course number
+# fields:     list of fields to read; when given, the courses are yielded as dictionaries with only
+#             these fields (and the number), otherwise as course objects
+# batch_size: number of documents read from the database in each round trip
+@timed()
+def iter_courses_sorted(after: str | None = None, fields: list[str] | None = None,
+                        batch_size: int = DEFAULT_BATCH_SIZE):
+    for course_data in get_backend().iter_courses(after, fields or COURSE_READ_FIELDS, batch_size):
+        # Convert course_data back to a course object when all the fields are read.
+        yield course_data if fields else _document_to_course(course_data)
+
+
+# Return a page of at most page_size courses sorted by number and the resume key of the next page
+# (None when there are no more courses). The arguments are the same of iter_courses_sorted.
+@timed(rows=lambda page: len(page[0]))
+def get_courses_page(page_size: int = DEFAULT_PAGE_SIZE, after: str | None = None,
+                     fields: list[str] | None = None) -> tuple[list, str | None]:
+    page = list(get_backend().iter_courses(after, fields or COURSE_READ_FIELDS, page_size, limit=page_size))
+    next_key = page[-1]["number"] if len(page) == page_size else None
+    return (page if fields else [_document_to_course(course_data) for course_data in page]), next_key
+
+
+# Synchronize the courses collection with the given catalog writing only the differences.
+# Each incoming course hash is compared with the stored one: new and changed courses are upserted and the
+# stored courses missing from the catalog are deleted, all inside one write operation. The collection is
+# never emptied, so the readers always see a complete catalog. With dry_run True nothing is written.
+# Returns a report with the added, updated and removed course numbers.
+@timed(rows=lambda report: report["written"])
+def sync_catalog(courses, dry_run: bool = False) -> dict:
+    backend = get_backend()
+    start = time.perf_counter()
+    # Stored hashes by course number. Courses written before the hashes were stored have None and are rewritten.
+    stored = backend.course_hashes()
 
-    return course_list # Return the list
+    report = {"added": [], "updated": [], "removed": [], "unchanged": 0, "duplicates": [],
+              "dry_run": dry_run, "written": 0, "elapsed": 0.0}
+    incoming: set[str] = set()  # Course numbers of the new catalog
+    upserts = []
+    for course in courses:
+        if course.number in incoming:  # Only the first definition of a course is used
+            report["duplicates"].append(course.number)
+            continue
+        incoming.add(course.number)
+        document = _course_to_document(course)
+        if course.number not in stored:
+            report["added"].append(course.number)
+        elif stored[course.number] != document["content_hash"]:
+            report["updated"].append(course.number)
+        else:
+            report["unchanged"] += 1
+            continue
+        upserts.append(document)
+
+    report["removed"] = sorted(number for number in stored if number not in incoming)
+
+    if (upserts or report["removed"]) and not dry_run:
+        report["written"] = backend.apply_catalog_changes(upserts, report["removed"])
+        # Drop the changed courses from the cache and the data derived from the catalog.
+        course_cache.invalidate(report["added"] + report["updated"] + report["removed"])
+        _catalog_changed()
+        _update_search_index(added=upserts, removed=report["removed"])
+        _refresh_course_details(upserts, report["removed"])
+
+    report["elapsed"] = time.perf_counter() - start
+    return report
+
+
+# Return the prerequisite graph of the whole catalog building it the first time.
+# Raises CyclicCatalogError if the stored courses contain a prerequisite cycle.
+@timed()
+def get_prerequisite_graph() -> PrerequisiteGraph:
+    global _prerequisite_graph
+    if _prerequisite_graph is None:
+        _prerequisite_graph = PrerequisiteGraph(list_courses_sorted())
+    return _prerequisite_graph
 
 
 # This function empties the courses collection by deleting all the elements inside.
+@timed()
 def clear_courses():
-    # Using an empty filter, delete all the documents in the collection.
-    courses_coll.delete_many({})
+    get_backend().clear_courses()
+    get_backend().clear_course_details()
+    course_cache.clear()
+    course_detail_cache.clear()
+    _catalog_changed()
+    with _search_index_lock:
+        if _search_index is not None:
+            _search_index.clear()
 
 
-# Insert a new user inside the "users" database collection.
-def insert_user(user: User):
-    # Retrieve the user data and convert to dictionary before storing to the database collection.
+# Return the search index of the catalog building it the first time from the stored course names.
+@timed(rows=len)
+def get_search_index() -> CourseSearchIndex:
+    global _search_index
+    with _search_index_lock:
+        if _search_index is None:
+            _search_index = CourseSearchIndex((course["number"], course["name"])
+                                              for course in iter_courses_sorted(fields=["name"]))
+        return _search_index
+
+
+# Drop the search index so it is built again on the next search.
+def _drop_search_index() -> None:
+    global _search_index
+    with _search_index_lock:
+        _search_index = None
+
+
+# Apply the written courses (objects or documents) and the removed course numbers to the search index.
+# Nothing is done when the index was not built yet, it will read the stored catalog.
+def _update_search_index(added=(), removed=()) -> None:
+    with _search_index_lock:
+        if _search_index is None:
+            return
+        for course in added:
+            if isinstance(course, dict):
+                _search_index.add(course["number"], course["name"])
+            else:
+                _search_index.add(course.number, course.name)
+        for number in removed:
+            _search_index.remove(number)
+
+
+# Return the (number, name) of the courses whose number starts with prefix, sorted by number.
+@timed(rows=len)
+def find_courses_by_prefix(prefix: str, limit: int | None = None) -> list[tuple[str, str]]:
+    return get_search_index().prefix(prefix, limit)
+
+
+# Return the (number, name) of the courses with low <= number <= high, sorted by number.
+@timed(rows=len)
+def find_courses_in_range(low: str, high: str, limit: int | None = None) -> list[tuple[str, str]]:
+    return get_search_index().range(low, high, limit)
+
+
+# Return the k best (number, name) of the courses whose number and name contain the words of the query.
+# The last word can be incomplete, "data str" finds "Data Structures".
+@timed(rows=len)
+def search_courses(query: str, k: int = 10) -> list[tuple[str, str]]:
+    return get_search_index().search(query, k)
+
+
+# Build the course details from the whole catalog if the backend has courses but no details yet.
+# Returns True when they were built by this call.
+def _ensure_course_details() -> bool:
+    global _course_details_checked
+    if _course_details_checked:
+        return False
+    with _course_details_lock:
+        if _course_details_checked:
+            return False
+        backend = get_backend()
+        rebuilt = (next(backend.iter_course_details(limit=1), None) is None
+                   and next(backend.iter_courses(fields=["number"], limit=1), None) is not None)
+        if rebuilt:
+            course_details.rebuild_course_details(backend, DEFAULT_BATCH_SIZE)
+            course_detail_cache.clear()
+        _course_details_checked = True
+        return rebuilt
+
+
+# Update the details of the courses affected by the written course documents and the removed course numbers.
+def _refresh_course_details(documents, removed=()) -> None:
+    with _course_details_lock:
+        # The changes are already stored, so a full build made now includes them.
+        if not _ensure_course_details():
+            course_details.refresh_course_details(get_backend(), documents, removed)
+            # Emptied after the write, so a lookup that read the old details does not cache them (see CourseCache).
+            course_detail_cache.clear()
+
+
+# Return the detail document of a course with a single read, None when the course does not exist.
+# It has the course number and name, the number and name of its prerequisites, the sorted numbers of the
+# courses it unlocks (dependents), its prerequisite depth and a content hash (see services/course_details.py).
+# The documents are cached like the courses, so the returned document is shared and must not be modified.
+@timed()
+def find_course_details(course_number: str) -> dict | None:
+    cached = course_detail_cache.get(course_number)
+    if cached is not None:
+        return None if cached is MISSING else cached
+
+    _ensure_course_details()
+    generation = course_detail_cache.generation  # Taken before the query, like _load_course does
+    found = get_backend().find_course_details([course_number])
+    detail = found[0] if found and found[0]["in_catalog"] else None
+    course_detail_cache.put(course_number, MISSING if detail is None else detail, generation)
+    return detail
+
+
+# Generator over the detail documents of the courses sorted by number, with the arguments of iter_courses_sorted.
+@timed()
+def iter_course_details_sorted(after: str | None = None, batch_size: int = DEFAULT_BATCH_SIZE):
+    _ensure_course_details()
+    for detail in get_backend().iter_course_details(after, batch_size):
+        if detail["in_catalog"]:  # Skip the placeholders of the prerequisites missing from the catalog
+            yield detail
+
+
+# Build the details of all the courses again from the stored catalog. Returns the number of details written.
+@timed(rows=int)
+def rebuild_course_details() -> int:
+    global _course_details_checked
+    with _course_details_lock:
+        written = course_details.rebuild_course_details(get_backend(), DEFAULT_BATCH_SIZE)
+        course_detail_cache.clear()
+        _course_details_checked = True
+    return written
+
+
+# Convert a user object to the dictionary stored in the users collection.
+def _user_to_document(user: User) -> dict:
+    # Retrieve the user data and convert to dictionary before storing it.
     user_data = user.__dict__.copy()
     # The password hash is stored as a string, so it has to be converted to UTF-8.
     user_data["_password_hash"] = user_data["_password_hash"].decode('utf-8')
-    users_coll.insert_one(user_data)
+    return user_data
+
+
+# Insert a new user inside the "users" database collection.
+@timed()
+def insert_user(user: User) -> bool:
+    if not get_backend().insert_user(_user_to_document(user)):
+        # The unique email rejects a user that is already registered.
+        print(f"User {user.email} already exists.")
+        return False
+    return True
+
+
+# Insert many users with unordered bulk inserts of batch_size users.
+# The users already registered are rejected by the unique email and reported without stopping the insert.
+# Returns a dictionary with the counters and the rejected emails.
+@timed(rows=lambda stats: stats["inserted"])
+def insert_users(users, batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+    backend = get_backend()
+    stats = {"inserted": 0, "failed": 0, "rejected": [], "elapsed": 0.0}
+    start = time.perf_counter()
+    iterator = iter(users)
+    while batch := [_user_to_document(user) for user in islice(iterator, batch_size)]:
+        inserted, rejected = backend.insert_users(batch)
+        stats["inserted"] += inserted
+        stats["failed"] += len(rejected)
+        stats["rejected"].extend(rejected)
+    stats["elapsed"] = time.perf_counter() - start
+    return stats
+
+
+# Store a new password hash for the user, used when the hash is upgraded to the current work factor.
+@timed()
+def update_password_hash(email: str, password_hash: bytes) -> bool:
+    return get_backend().update_user(email, {"_password_hash": password_hash.decode('utf-8')})
+
+
+# Convert a stored user document to a user object.
+def _document_to_user(user_data: dict) -> User:
+    user_data["_password_hash"] = user_data["_password_hash"].encode('utf-8')  # Revert the hashed password to bytes
+    return User(**user_data)
 
 
 # Retrieve user data using the login string (email). It is used to check also if a user is already present.
+@timed()
 def find_user_by_email(email: str) -> User | None:
-    user_data = users_coll.find_one({"email": email})  # Query the database to find the user
+    user_data = get_backend().find_user(email)  # Query the database to find the user
     if not user_data:  # If user not found return None.
         return None
-    user_data["_password_hash"] = user_data["_password_hash"].encode('utf-8')  # Revert the hashed password to bytes
-    user_data.pop('_id', None)  # Remove the _id field before storing the data in the user object.
-    return User(**user_data)
+    return _document_to_user(user_data)
+
+
+# Function to find many users with a single query.
+# Returns a dictionary with an entry for each requested email, in the requested order:
+# the user object when found or None when the user does not exist.
+@timed(rows=len)
+def find_users_by_emails(emails) -> dict[str, User | None]:
+    found: dict[str, User | None] = dict.fromkeys(emails)
+    if found:
+        for user_data in get_backend().find_users(list(found)):
+            found[user_data["email"]] = _document_to_user(user_data)
+    return found
 
 
 # Adds a completed course to a specific user identified by its email.
+# The course is added with a single atomic update, so two sessions of the same student
+# can not overwrite each other and a course already present is not added twice.
+@timed()
 def add_completed_course(email: str, course_number: str) -> bool:
-    # Retrieve current user data
-    user_data = users_coll.find_one({"email": email})
+    matched, _, _ = get_backend().add_completions({email: [course_number]})
 
     # Calling this function is normally done by the logged user,
     # however we check the user existence in the case this module is used differently.
-    if not user_data:
+    if matched == 0:
         print("User not found.")
         return False
 
-    # Be sure that the course we are adding dows not already exist
-    completed = user_data.get("completed_courses", [])  # Load the completed courses list.
-    if course_number in completed:
-        return True  # We return "gracefully" in the case the course is already present.
+    return True  # Also when the course was already present, like before.
+
+
+# Adds many completed courses, given as (email, course number) pairs, with a single bulk write.
+# The courses of the same user are grouped in one update. When validate_courses is True the
+# course numbers not present in the catalog are skipped and reported.
+# Returns a report with the counters, the unknown users and the unknown courses.
+@timed(rows=lambda report: report["completions"])
+def add_completed_courses_bulk(completions, validate_courses: bool = True) -> dict:
+    start = time.perf_counter()
+    grouped: dict[str, dict[str, None]] = {}  # email -> course numbers (dictionary used as ordered set)
+    total = 0
+    for email, course_number in completions:
+        grouped.setdefault(email, {})[course_number] = None
+        total += 1
 
-    # Add course to the list and update the record.
-    completed.append(course_number)  # Add the new course to the completed list.
-    # Launch the database query to write the updated courses list.
-    result = users_coll.update_one(
-        {"email": email},
-        {"$set": {"completed_courses": completed}}
-    )
+    report = {"completions": total, "users": len(grouped), "matched": 0, "modified": 0,
+              "unknown_users": [], "unknown_courses": [], "elapsed": 0.0}
 
-    return result.modified_count > 0  # When modified count is greater than zero, return True.
+    # Remove the courses that do not exist using a single batch lookup.
+    if validate_courses:
+        found = find_courses_by_numbers(number for courses in grouped.values() for number in courses)
+        report["unknown_courses"] = sorted(number for number, course in found.items() if course is None)
+        if report["unknown_courses"]:
+            for email, courses in grouped.items():
+                grouped[email] = {number: None for number in courses if found[number] is not None}
+
+    updates = {email: list(courses) for email, courses in grouped.items() if courses}
+    if updates:
+        report["matched"], report["modified"], report["unknown_users"] = get_backend().add_completions(updates)
+
+    report["elapsed"] = time.perf_counter() - start
+    return report
 
 
 # Function to retrieve the list of all the user.
+@timed(rows=len)
 def get_users_list() -> list[dict]:
     # Query the database with an empty parameter to get all the users.
-    return list(users_coll.find({}, {"_id": 0}))
\ No newline at end of file
+    return list(iter_users())
+
+
+# Generator over the users sorted by email, without loading all of them in memory.
+# after:      resume key, the users are read starting after this email
+# fields:     list of fields to read, all the fields when None
+# batch_size: number of documents read from the database in each round trip
+@timed()
+def iter_users(after: str | None = None, fields: list[str] | None = None, batch_size: int = DEFAULT_BATCH_SIZE):
+    yield from get_backend().iter_users(after, fields, batch_size)
+
+
+# Return a page of at most page_size users sorted by email and the resume key of the next page
+# (None when there are no more users). The arguments are the same of iter_users.
+@timed(rows=lambda page: len(page[0]))
+def get_users_page(page_size: int = DEFAULT_PAGE_SIZE, after: str | None = None,
+                   fields: list[str] | None = None) -> tuple[list[dict], str | None]:
+    page = list(get_backend().iter_users(after, fields, page_size, limit=page_size))
+    next_key = page[-1]["email"] if len(page) == page_size else None
+    return page, next_key
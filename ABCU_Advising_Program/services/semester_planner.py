@@ -0,0 +1,99 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          semester_planner.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Semester planner: term by term schedule of the courses a
+#               student still needs to reach one or more target courses,
+#               with a maximum number of courses per term.
+# ============================================================================
+
+
+# Modules imports
+import heapq  # Queue of the courses ready to be scheduled
+from models.prereq_graph import PrerequisiteGraph  # Graph of the course prerequisites
+
+
+# Default maximum number of courses taken in a term.
+DEFAULT_MAX_PER_TERM = 3
+
+
+# Return the indexes of the courses still needed to take the target: the target and the prerequisites
+# reached without passing through a completed course (a completed course covers its own prerequisites).
+def _needed_courses(graph: PrerequisiteGraph, target: int, done: set[int]) -> set[int]:
+    ancestors = graph.ancestor_ids(target)  # Memoized by the graph, shared by all the queries
+    if ancestors.isdisjoint(done):
+        return {target, *ancestors}
+    needed = {target}
+    stack = [target]
+    while stack:
+        for prereq in graph.prereqs[stack.pop()]:
+            if prereq not in done and prereq not in needed:
+                needed.add(prereq)
+                stack.append(prereq)
+    return needed
+
+
+# Plan the terms needed to reach the target courses starting from the completed courses.
+# Every term has at most max_per_term courses and a course is planned only after all its prerequisites.
+# The courses that lead to the longest remaining chain are planned first (critical path scheduling), so the
+# number of terms is the length of the longest chain whenever the course load allows it.
+# Returns a report with:
+#   terms          list of the terms, each a sorted list of course numbers
+#   targets        targets that are planned
+#   completed      targets already completed
+#   unknown        targets that are not in the catalog
+#   blocked        targets that can not be planned -> prerequisites missing from the catalog and not completed
+#   minimum_terms  lower bound of the number of terms (longest chain or course load)
+def plan_semesters(graph: PrerequisiteGraph, completed_courses, targets,
+                   max_per_term: int = DEFAULT_MAX_PER_TERM) -> dict:
+    if max_per_term < 1:
+        raise ValueError("max_per_term must be greater than zero.")
+    completed = set(completed_courses)
+    done = {graph.index[number] for number in completed if number in graph.index}
+    report = {"terms": [], "targets": [], "completed": [], "unknown": [], "blocked": {}, "minimum_terms": 0}
+
+    required: set[int] = set()
+    for number in dict.fromkeys(targets):
+        target = graph.index.get(number)
+        if target is None:
+            report["unknown"].append(number)
+            continue
+        if target in done:
+            report["completed"].append(number)
+            continue
+        needed = _needed_courses(graph, target, done)
+        # Prerequisites that are not in the catalog can not be planned, they must be completed already.
+        missing = sorted({prereq for i in needed for prereq in graph.unknown_prereqs.get(i, ())
+                          if prereq not in completed})
+        if missing:
+            report["blocked"][number] = missing
+            continue
+        report["targets"].append(number)
+        required |= needed
+    if not required:
+        return report
+
+    # Remaining chain length of each required course: 1 for the courses no other required course needs.
+    # The dependents are deeper than the course, so they are computed first going from the deepest courses.
+    height: dict[int, int] = {}
+    for i in sorted(required, key=graph.depths.__getitem__, reverse=True):
+        height[i] = 1 + max((height[d] for d in graph.dependents[i] if d in required), default=0)
+    report["minimum_terms"] = max(max(height.values()), -(-len(required) // max_per_term))
+
+    # Required prerequisites not planned yet for each course, the courses without them are ready.
+    waiting = {i: sum(1 for p in graph.prereqs[i] if p in required) for i in required}
+    ready = [(-height[i], graph.numbers[i], i) for i, count in waiting.items() if count == 0]
+    heapq.heapify(ready)
+    while ready:
+        term = [heapq.heappop(ready) for _ in range(min(max_per_term, len(ready)))]
+        # The courses unlocked by this term can be taken from the next term.
+        for _, _, i in term:
+            for dep in graph.dependents[i]:
+                if dep in waiting:
+                    waiting[dep] -= 1
+                    if waiting[dep] == 0:
+                        heapq.heappush(ready, (-height[dep], graph.numbers[dep], dep))
+        report["terms"].append(sorted(number for _, number, _ in term))
+    return report
@@ -0,0 +1,25 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          conftest.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Shared pytest fixtures: the service layer is pointed to an
+#               in-memory MemoryBackend or SQLiteBackend for each test.
+# ============================================================================
+
+
+# Modules imports
+import pytest  # Test framework
+from services import mdb_api  # Database API under test
+from services.backends.memory_backend import MemoryBackend  # Backend kept in process memory
+from services.backends.sqlite_backend import SQLiteBackend  # Backend on an SQLite database
+
+
+# Storage backend used by mdb_api during the test, each test runs once with each backend.
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request):
+    backend = MemoryBackend() if request.param == "memory" else SQLiteBackend(":memory:")
+    mdb_api.use_backend(backend)
+    yield backend
+    mdb_api.use_backend(MemoryBackend())
@@ -0,0 +1,65 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_async_api.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the asyncio version of the database API.
+# ============================================================================
+
+
+# Modules imports
+import asyncio  # Event loop running the coroutines
+from models.course import Course  # Import the Course class
+from models.user import User  # Import the User class
+from services import async_api, mdb_api  # APIs under test
+
+
+CATALOG = [Course(f"CS{index:03d}", f"Course {index}", ("MAT100",) if index % 2 else ()) for index in range(25)]
+
+
+def test_find_course_by_number_uses_the_cache(backend):
+    mdb_api.insert_courses(CATALOG)
+    mdb_api.course_cache.clear()
+    before = mdb_api.course_cache_stats()
+
+    async def lookups():
+        return [await async_api.find_course_by_number("CS001"), await async_api.find_course_by_number("CS001"),
+                await async_api.find_course_by_number("XX999")]
+
+    assert asyncio.run(lookups()) == [CATALOG[1], CATALOG[1], None]
+    stats = mdb_api.course_cache_stats()
+    assert stats["hits"] - before["hits"] == 1 and stats["misses"] - before["misses"] == 2
+
+
+def test_iter_course_details_sorted(backend):
+    mdb_api.insert_courses(CATALOG)
+
+    async def numbers(after=None):
+        return [detail["number"] async for detail in async_api.iter_course_details_sorted(after, batch_size=10)]
+
+    # The placeholder of MAT100, missing from the catalog, is not listed.
+    assert asyncio.run(numbers()) == [course.number for course in CATALOG]
+    assert asyncio.run(numbers("CS019")) == ["CS020", "CS021", "CS022", "CS023", "CS024"]
+
+
+USERS = [User("User", str(index), f"user{index:02d}@example.com", b"hash", "student", [f"CS{index:03d}"])
+         for index in range(12)]
+
+
+def test_find_users_by_emails(backend):
+    mdb_api.insert_users(USERS)
+    emails = (email for email in ["user03@example.com", "eve@example.com", "user00@example.com"])
+    found = asyncio.run(async_api.find_users_by_emails(emails))
+    assert list(found) == ["user03@example.com", "eve@example.com", "user00@example.com"]
+    assert found["user03@example.com"] == USERS[3] and found["eve@example.com"] is None
+
+
+def test_iter_users(backend):
+    mdb_api.insert_users(reversed(USERS))
+
+    async def emails(after=None):
+        return [user["email"] async for user in async_api.iter_users(after, ["role"], page_size=5)]
+
+    assert asyncio.run(emails()) == [user.email for user in USERS]
+    assert asyncio.run(emails("user09@example.com")) == ["user10@example.com", "user11@example.com"]
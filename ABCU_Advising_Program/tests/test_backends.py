@@ -0,0 +1,152 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_backends.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the storage backend creation by the database API and
+#               contract tests run with every storage backend.
+# ============================================================================
+
+
+# Modules imports
+import threading  # Threads asking for the backend at the same time
+import time  # Used to slow down the index creation
+import pytest  # Test framework
+from services import mdb_api  # Database API creating the backend
+from services.backends.memory_backend import MemoryBackend  # Backend kept in process memory
+from services.backends.mongo_backend import MongoBackend  # Backend on MongoDB collections
+from services.backends.sqlite_backend import SQLiteBackend  # Backend on an SQLite database
+
+
+# Memory backend whose index creation is slow, to catch the threads that use it before the indexes exist.
+class SlowIndexBackend(MemoryBackend):
+
+    def __init__(self):
+        super().__init__()
+        self.indexed = False
+
+    def ensure_indexes(self) -> bool:
+        time.sleep(0.05)
+        self.indexed = True
+        return True
+
+
+def test_backend_is_published_after_its_indexes(monkeypatch):
+    created = []
+    monkeypatch.setattr(mdb_api, "_backend", None)
+    monkeypatch.setattr(mdb_api, "_create_backend", lambda: created.append(SlowIndexBackend()) or created[-1])
+    seen = []
+
+    # Record whether the backend returned to the thread had its indexes.
+    def use():
+        seen.append(mdb_api.get_backend().indexed)
+
+    threads = [threading.Thread(target=use) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(created) == 1
+    assert seen == [True] * 8
+
+
+# Each contract test runs once with each storage backend, MongoDB is replaced by mongomock.
+@pytest.fixture(params=["memory", "sqlite", "mongomock"])
+def storage(request):
+    if request.param == "memory":
+        backend = MemoryBackend()
+    elif request.param == "sqlite":
+        backend = SQLiteBackend(":memory:")
+    else:
+        mongomock = pytest.importorskip("mongomock")  # In-memory stand-in of the MongoDB collections
+        db = mongomock.MongoClient().db
+        backend = MongoBackend(db["courses"], db["users"], db["course_details"])
+    assert backend.ensure_indexes()
+    return backend
+
+
+# Return a course document like the ones written by the database API.
+def course(number: str, name: str = "Course", prerequisites=(), content_hash: str = "h") -> dict:
+    return {"number": number, "name": name, "prerequisites": list(prerequisites), "content_hash": content_hash}
+
+
+# Return a user document like the ones written by the database API.
+def user(email: str, completed=()) -> dict:
+    return {"name": "Ada", "surname": "Lovelace", "email": email, "_password_hash": b"hash", "role": "student",
+            "completed_courses": list(completed)}
+
+
+def test_insert_and_duplicate_courses(storage):
+    assert storage.insert_course(course("CS200", prerequisites=["CS100"]))
+    assert not storage.insert_course(course("CS200", name="Other"))
+    inserted, messages = storage.insert_courses([course("CS100"), course("CS200"), course("CS300")])
+    assert inserted == 2 and messages
+    assert storage.find_courses(["CS200"]) == [course("CS200", prerequisites=["CS100"])]
+
+
+def test_insert_and_duplicate_users(storage):
+    assert storage.insert_user(user("ada@example.com"))
+    assert not storage.insert_user(user("ada@example.com"))
+    inserted, rejected = storage.insert_users([user("bob@example.com"), user("ada@example.com")])
+    assert inserted == 1 and rejected == ["ada@example.com"]
+    assert storage.find_user("bob@example.com")["email"] == "bob@example.com"
+    assert storage.find_user("eve@example.com") is None
+    assert sorted(found["email"] for found in storage.find_users(["ada@example.com", "eve@example.com",
+                                                                  "bob@example.com"])) == ["ada@example.com",
+                                                                                            "bob@example.com"]
+
+
+def test_find_courses(storage):
+    storage.insert_courses([course("CS100"), course("CS200", prerequisites=["CS100"])])
+    found = storage.find_courses(["CS200", "XX999", "CS100", "CS200"], ["name"])
+    assert sorted(found, key=lambda document: document["number"]) == [{"number": "CS100", "name": "Course"},
+                                                                      {"number": "CS200", "name": "Course"}]
+    assert storage.find_courses(["XX999"]) == []
+
+
+def test_course_pagination_with_after_and_limit(storage):
+    storage.insert_courses([course(f"CS{index:03d}") for index in reversed(range(25))])
+    numbers = [document["number"] for document in storage.iter_courses(fields=["name"], batch_size=4)]
+    assert numbers == [f"CS{index:03d}" for index in range(25)]
+    page = [document["number"] for document in storage.iter_courses(after="CS009", batch_size=4, limit=6)]
+    assert page == [f"CS{index:03d}" for index in range(10, 16)]
+    assert list(storage.iter_courses(after="CS024")) == []
+    assert list(storage.iter_courses(limit=0)) == []
+
+
+def test_user_pagination_with_after_and_limit(storage):
+    storage.insert_users([user(f"user{index:02d}@example.com") for index in range(12)])
+    emails = [document["email"] for document in storage.iter_users(after="user03@example.com", fields=["role"],
+                                                                    batch_size=2, limit=5)]
+    assert emails == [f"user{index:02d}@example.com" for index in range(4, 9)]
+
+
+def test_course_detail_pagination(storage):
+    storage.write_course_details([{"number": f"CS{index:03d}", "depth": 0} for index in range(7)], [])
+    details = list(storage.iter_course_details(after="CS002", batch_size=2, limit=3))
+    assert [detail["number"] for detail in details] == ["CS003", "CS004", "CS005"]
+    storage.write_course_details([], ["CS003"])
+    assert storage.find_course_details(["CS003", "CS004"]) == [{"number": "CS004", "depth": 0}]
+
+
+def test_add_completions_is_idempotent(storage):
+    storage.insert_users([user("ada@example.com", ["CS100"]), user("bob@example.com")])
+    completions = {"ada@example.com": ["CS100", "CS200"], "bob@example.com": ["CS100"], "eve@example.com": ["CS100"]}
+    assert storage.add_completions(completions) == (2, 2, ["eve@example.com"])
+    # Adding the same courses again changes nothing.
+    assert storage.add_completions(completions) == (2, 0, ["eve@example.com"])
+    assert storage.find_user("ada@example.com")["completed_courses"] == ["CS100", "CS200"]
+    assert storage.find_user("bob@example.com")["completed_courses"] == ["CS100"]
+
+
+def test_apply_catalog_changes(storage):
+    storage.insert_courses([course("CS100"), course("CS200"), course("CS300")])
+    written = storage.apply_catalog_changes([course("CS200", name="Data Structures", content_hash="new"),
+                                             course("CS400", content_hash="new")], ["CS300"])
+    assert written == 3
+    assert storage.course_hashes() == {"CS100": "h", "CS200": "new", "CS400": "new"}
+    assert [document["number"] for document in storage.iter_courses()] == ["CS100", "CS200", "CS400"]
+    assert storage.find_courses(["CS200"], ["name"]) == [{"number": "CS200", "name": "Data Structures"}]
+    storage.clear_courses()
+    assert list(storage.iter_courses()) == []
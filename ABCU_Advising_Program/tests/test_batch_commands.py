@@ -0,0 +1,60 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_batch_commands.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the headless JSON-lines batch mode.
+# ============================================================================
+
+
+# Modules imports
+import io  # Output of the batch results
+import json  # Commands and results are JSON lines
+from models.course import Course  # Import the Course class
+from models.user import User  # Import the User class definition
+from services import mdb_api  # Database API used by the commands
+from services.batch_commands import run_batch  # Batch mode under test
+
+
+# Run the commands as the given user and return the result lines.
+def run(commands: list[dict], user: User) -> list[dict]:
+    output = io.StringIO()
+    run_batch([json.dumps(command) for command in commands], output, user, workers=2)
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+# Fail the test if the single user lookup is used instead of the batched one.
+def single_user_lookup(email: str):
+    raise AssertionError(f"find_user called for {email}")
+
+
+def test_eligibility_reads_the_users_once(backend, monkeypatch):
+    mdb_api.insert_courses([Course("CS100", "Intro"), Course("CS200", "Data Structures", ("CS100",)),
+                            Course("MAT100", "Discrete Math")])
+    admin = User("Ada", "Admin", "admin@example.com", b"", "admin")
+    mdb_api.insert_users([User("Stu", "Dent", "stu@example.com", b"", "student", ["CS100"]), admin])
+    reads = []
+    original = backend.find_users
+    monkeypatch.setattr(backend, "find_users", lambda emails: reads.append(emails) or original(emails))
+    monkeypatch.setattr(backend, "find_user", single_user_lookup)
+    results = run([{"command": "eligibility", "email": "stu@example.com"},
+                   {"command": "eligibility"},
+                   {"command": "eligibility", "email": "nobody@example.com"},
+                   {"command": "eligibility", "completed": ["cs100", "MAT100"]},
+                   {"command": "eligibility", "completed": "CS100"}], admin)
+    assert [result["ok"] for result in results] == [True, True, False, True, False]
+    assert results[0]["result"] == {"email": "stu@example.com", "eligible": ["CS200", "MAT100"]}
+    assert results[1]["result"]["eligible"] == ["CS100", "MAT100"]
+    assert results[2]["error"] == "User nobody@example.com not found."
+    assert results[3]["result"] == {"eligible": ["CS200"]}
+    assert len(reads) == 1
+
+
+def test_student_can_not_query_other_users(backend):
+    student = User("Stu", "Dent", "stu@example.com", b"", "student")
+    mdb_api.insert_user(student)
+    results = run([{"command": "eligibility", "email": "other@example.com"},
+                   {"command": "load", "file": "catalog.csv"}], student)
+    assert results[0]["error"] == "You need admin role to use another user."
+    assert results[1]["error"] == "You need admin role to use this function!!"
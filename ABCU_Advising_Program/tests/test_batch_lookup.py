@@ -0,0 +1,58 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_batch_lookup.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the batch lookups of courses and users: requested
+#               order, unknown keys and one storage query per call.
+# ============================================================================
+
+
+# Modules imports
+from models.course import Course  # Import the Course class
+from models.user import User  # Import the User class
+from services import mdb_api  # Database API under test
+
+
+COURSES = [Course("CS100", "Intro"), Course("CS200", "Data Structures", ("CS100",)), Course("CS300", "Algorithms")]
+
+
+# Count the course lookups that reach the backend.
+def count_queries(monkeypatch, backend) -> list:
+    queries = []
+    find_courses = backend.find_courses
+    monkeypatch.setattr(backend, "find_courses", lambda numbers, fields=None: queries.append(list(numbers))
+                        or find_courses(numbers, fields))
+    return queries
+
+
+def test_courses_are_returned_in_the_requested_order(backend):
+    mdb_api.insert_courses(COURSES)
+    found = mdb_api.find_courses_by_numbers(["CS300", "XX999", "CS100", "CS300"])
+    assert list(found) == ["CS300", "XX999", "CS100"]
+    assert found == {"CS300": COURSES[2], "XX999": None, "CS100": COURSES[0]}
+    assert mdb_api.find_courses_by_numbers([]) == {}
+
+
+def test_one_query_for_the_courses_not_cached(backend, monkeypatch):
+    mdb_api.insert_courses(COURSES)
+    mdb_api.course_cache.clear()
+    queries = count_queries(monkeypatch, backend)
+    mdb_api.find_course_by_number("CS200")
+    assert mdb_api.find_courses_by_numbers(n for n in ["CS100", "CS200", "CS300", "XX999"])["CS200"] == COURSES[1]
+    assert queries == [["CS200"], ["CS100", "CS300", "XX999"]]
+    # Everything, the unknown course included, is now served by the cache.
+    mdb_api.find_courses_by_numbers(["CS300", "XX999", "CS100"])
+    assert len(queries) == 2
+
+
+def test_users_are_returned_in_the_requested_order(backend):
+    mdb_api.insert_users([User("Ada", "Lovelace", "ada@example.com", b"hash", "student", ["CS100"]),
+                          User("Bob", "Builder", "bob@example.com", b"hash")])
+    found = mdb_api.find_users_by_emails(["bob@example.com", "eve@example.com", "ada@example.com"])
+    assert list(found) == ["bob@example.com", "eve@example.com", "ada@example.com"]
+    assert found["eve@example.com"] is None
+    assert found["ada@example.com"].completed_courses == ["CS100"]
+    assert found["bob@example.com"]._password_hash == b"hash"
+    assert mdb_api.find_users_by_emails([]) == {}
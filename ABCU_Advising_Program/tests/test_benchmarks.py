@@ -0,0 +1,86 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_benchmarks.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the synthetic data generator and a short run of the
+#               benchmark suite with its comparison of the results.
+# ============================================================================
+
+
+# Modules imports
+import json  # Results file of the benchmarks
+from benchmarks import run_benchmarks  # Benchmark suite
+from benchmarks.generator import (generate_catalog, generate_students, write_catalog_csv, write_catalog_json,
+                                  write_completions_csv)  # Generator under test
+from models.prereq_graph import PrerequisiteGraph  # Graph of the course prerequisites
+from utils.data_loader import iter_courses_from_file  # Reader of the generated files
+from utils.password_hashing import hash_password  # Fast password hash of the generated users
+
+
+def test_catalog_is_a_seeded_dag_of_levels():
+    courses = generate_catalog(2000, max_depth=5, max_prereqs=3, seed=7)
+    assert len(courses) == 2000
+    assert len({course.number for course in courses}) == 2000
+    assert courses == generate_catalog(2000, max_depth=5, max_prereqs=3, seed=7)
+    assert courses != generate_catalog(2000, max_depth=5, max_prereqs=3, seed=8)
+    # Every prerequisite is a catalog course and the chains are at most max_depth courses long.
+    graph = PrerequisiteGraph(courses)
+    assert all(prereq in graph for course in courses for prereq in course.prerequisites)
+    assert all(len(course.prerequisites) <= 3 for course in courses)
+    assert max(graph.depth(course.number) for course in courses) == 5
+
+
+def test_tiny_catalogs():
+    assert generate_catalog(0) == []
+    assert len(generate_catalog(1)) == 1
+    assert len(generate_catalog(3, max_depth=8)) == 3
+
+
+def test_students_complete_courses_after_their_prerequisites():
+    courses = generate_catalog(500, seed=1)
+    prerequisites = {course.number: course.prerequisites for course in courses}
+    students = generate_students(courses, 50, max_completed=20, seed=1)
+    assert len(students) == 50 and students == generate_students(courses, 50, max_completed=20, seed=1)
+    assert len({student[2] for student in students}) == 50
+    for _, _, _, password, role, completed in students:
+        assert password == "benchmark" and role == "student"
+        assert len(completed) <= 20 and len(set(completed)) == len(completed)
+        position = {number: index for index, number in enumerate(completed)}
+        for number in completed:
+            assert all(position[prereq] < position[number] for prereq in prerequisites[number])
+
+
+def test_written_files_read_back(tmp_path):
+    courses = generate_catalog(300, seed=2)
+    write_catalog_csv(courses, str(tmp_path / "catalog.csv"))
+    write_catalog_json(courses, str(tmp_path / "catalog.json"))
+    assert list(iter_courses_from_file(str(tmp_path / "catalog.csv"))) == courses
+    assert list(iter_courses_from_file(str(tmp_path / "catalog.json"))) == courses
+    students = generate_students(courses, 10, seed=2)
+    write_completions_csv(students, str(tmp_path / "completions.csv"))
+    rows = (tmp_path / "completions.csv").read_text(encoding="utf-8").splitlines()
+    assert len(rows) == sum(len(student[5]) for student in students)
+
+
+def test_benchmark_run_and_comparison(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(run_benchmarks, "hash_password", lambda password: hash_password(password, rounds=4))
+    arguments = ["--sizes", "200", "--students", "5", "--lookups", "20", "--logins", "1", "--repeat", "1"]
+    baseline = str(tmp_path / "baseline.json")
+    assert run_benchmarks.main(arguments + ["--output", baseline]) == 0
+    with open(baseline, encoding="utf-8") as baseline_file:
+        report = json.load(baseline_file)
+    names = [result["benchmark"] for result in report["results"]]
+    assert {"csv_load", "json_load", "lookup_batch", "search", "eligibility_report", "login"} <= set(names)
+    assert all(result["size"] == 200 and result["best"] >= 0 for result in report["results"])
+
+    # A baseline where every benchmark took a picosecond reports all of them as regressions.
+    for result in report["results"]:
+        result["best"] = 1e-12
+    with open(baseline, "w", encoding="utf-8") as baseline_file:
+        json.dump(report, baseline_file)
+    capsys.readouterr()
+    regressions = run_benchmarks.main(arguments + ["--output", str(tmp_path / "new.json"), "--compare", baseline])
+    assert regressions == len(report["results"])
+    assert "REGRESSION" in capsys.readouterr().out
@@ -0,0 +1,62 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_bulk_insert.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the batched course insertion: batch counters, the
+#               courses rejected inside a batch and the failed batches.
+# ============================================================================
+
+
+# Modules imports
+import pytest  # Test framework
+from models.course import Course  # Import the Course class
+from services import mdb_api  # Database API under test
+
+
+COURSES = [Course(f"CS{index:03d}", f"Course {index}") for index in range(10)]
+
+
+def test_courses_are_inserted_in_batches(backend):
+    stats = mdb_api.insert_courses(iter(COURSES), batch_size=4)
+    assert (stats["inserted"], stats["failed"], stats["batches"], stats["errors"]) == (10, 0, 3, [])
+    assert len(stats["batch_times"]) == 3
+    assert mdb_api.list_courses_sorted() == COURSES
+
+
+def test_batch_size_must_be_positive(backend):
+    with pytest.raises(ValueError):
+        mdb_api.insert_courses(COURSES, batch_size=0)
+
+
+def test_existing_courses_are_reported_and_the_rest_inserted(backend):
+    mdb_api.insert_courses(COURSES[2:4])
+    stats = mdb_api.insert_courses(COURSES, batch_size=4)
+    assert (stats["inserted"], stats["failed"], stats["batches"]) == (8, 2, 3)
+    assert len(stats["errors"]) == 1
+    assert stats["errors"][0]["batch"] == 1 and stats["errors"][0]["failed"] == 2
+    assert len(mdb_api.list_courses_sorted()) == 10
+    # The derived data still sees every course.
+    assert [number for number, _ in mdb_api.find_courses_by_prefix("CS00")] == [f"CS{index:03d}" for index in range(10)]
+    assert mdb_api.find_course_details("CS003") is not None
+
+
+def test_failed_batch_does_not_stop_the_loading(backend, monkeypatch):
+    insert_courses = backend.insert_courses
+    calls = []
+
+    # The second batch is lost, like on a connection error.
+    def flaky_insert_courses(documents):
+        calls.append(len(documents))
+        if len(calls) == 2:
+            raise ConnectionError("connection lost")
+        return insert_courses(documents)
+
+    monkeypatch.setattr(backend, "insert_courses", flaky_insert_courses)
+    stats = mdb_api.insert_courses(COURSES, batch_size=4)
+    assert calls == [4, 4, 2]
+    assert (stats["inserted"], stats["failed"], stats["batches"]) == (6, 4, 3)
+    assert stats["errors"] == [{"batch": 2, "failed": 4, "messages": ["connection lost"]}]
+    assert [course.number for course in mdb_api.list_courses_sorted()] == \
+           ["CS000", "CS001", "CS002", "CS003", "CS008", "CS009"]
@@ -0,0 +1,66 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_catalog_snapshot.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the binary catalog snapshots: write/read round trip
+#               and loading a snapshot into the storage backend.
+# ============================================================================
+
+
+# Modules imports
+import os  # Used to check the written files
+from models.course import Course  # Import the Course class
+from services import mdb_api  # Database API the snapshot is loaded into
+from utils.catalog_snapshot import CatalogSnapshot, write_snapshot  # Snapshot format under test
+from utils.data_loader import csv_to_snapshot, load_courses_from_snapshot  # Snapshot conversion and loader
+
+
+COURSES = [
+    Course("MAT200", "Calculus", ("MAT100",)),
+    Course("CS101", "Intro to Programming"),
+    Course("CS201", "Data Structures", ("CS101", "MAT200", "PHY100")),
+    Course("CS101", "Duplicate definition", ("CS201",)),  # Only the first definition is written
+    Course("CS999", "Unicode name: Informática Avançada", ("CS201",)),
+]
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / "catalog.snap")
+    catalog = write_snapshot(iter(COURSES), path)
+    assert catalog.duplicates == 1
+    with CatalogSnapshot(path) as snapshot:
+        assert len(snapshot) == 4
+        assert list(snapshot) == [COURSES[0], COURSES[1], COURSES[2], COURSES[4]]
+        assert [course.number for course in snapshot.iter_sorted()] == ["CS101", "CS201", "CS999", "MAT200"]
+        assert snapshot.get("CS201") == COURSES[2]
+        assert snapshot.get("CS999").name == "Unicode name: Informática Avançada"
+        assert snapshot.get("CS000") is None
+        assert "MAT200" in snapshot and "MAT100" not in snapshot
+        assert snapshot.unresolved() == ["MAT100", "PHY100"]
+
+
+def test_load_snapshot(backend, tmp_path):
+    path = str(tmp_path / "catalog.snap")
+    write_snapshot(iter(COURSES), path)
+    report = load_courses_from_snapshot(path, mdb_api.insert_courses, chunk_size=2)
+    assert report["courses"] == 4 and report["chunks"] == 2 and report["cycle"] is None
+    assert report["unresolved"] == {"MAT100": ["MAT200"], "PHY100": ["CS201"]}
+    assert mdb_api.find_course_by_number("CS201") == COURSES[2]
+
+
+def test_cyclic_catalog_is_not_converted(tmp_path):
+    csv_path = tmp_path / "catalog.csv"
+    csv_path.write_text("CS100,Intro,CS200\nCS200,Data Structures,CS100\n", encoding="utf-8")
+    snapshot_path = str(tmp_path / "catalog.snap")
+    assert not csv_to_snapshot(str(csv_path), snapshot_path)
+    assert not os.path.exists(snapshot_path)
+
+
+def test_cyclic_snapshot_is_not_loaded(backend, tmp_path):
+    path = str(tmp_path / "catalog.snap")
+    write_snapshot([Course("CS100", "Intro", ("CS200",)), Course("CS200", "Data Structures", ("CS100",))], path)
+    report = load_courses_from_snapshot(path, mdb_api.insert_courses)
+    assert report["cycle"] is not None and report["courses"] == 0
+    assert mdb_api.list_courses_sorted() == []
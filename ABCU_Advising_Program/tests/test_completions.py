@@ -0,0 +1,79 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_completions.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the completed courses updates: atomic single updates
+#               from concurrent sessions and the bulk import of a CSV file.
+# ============================================================================
+
+
+# Modules imports
+import threading  # Concurrent sessions of the same student
+from models.course import Course  # Import the Course class
+from models.user import User  # Import the User class
+from services import mdb_api  # Database API under test
+from utils.data_loader import import_completions_from_csv  # CSV import of the completed courses
+
+
+COURSES = [Course(f"CS{index:03d}", f"Course {index}") for index in range(20)]
+
+
+# Insert the catalog and two students, Ada has already completed CS000.
+def add_students():
+    mdb_api.insert_courses(COURSES)
+    mdb_api.insert_users([User("Ada", "Lovelace", "ada@example.com", b"hash", "student", ["CS000"]),
+                          User("Bob", "Builder", "bob@example.com", b"hash")])
+
+
+def test_add_completed_course(backend, capsys):
+    add_students()
+    assert mdb_api.add_completed_course("ada@example.com", "CS001")
+    assert mdb_api.add_completed_course("ada@example.com", "CS001")  # Already present, not added twice
+    assert mdb_api.find_user_by_email("ada@example.com").completed_courses == ["CS000", "CS001"]
+    assert not mdb_api.add_completed_course("eve@example.com", "CS001")
+    assert "User not found." in capsys.readouterr().out
+
+
+def test_concurrent_sessions_do_not_lose_updates(backend):
+    add_students()
+    threads = [threading.Thread(target=mdb_api.add_completed_course, args=("bob@example.com", course.number))
+               for course in COURSES]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    completed = mdb_api.find_user_by_email("bob@example.com").completed_courses
+    assert sorted(completed) == [course.number for course in COURSES]
+
+
+def test_bulk_completions_report(backend):
+    add_students()
+    report = mdb_api.add_completed_courses_bulk([("ada@example.com", "CS000"), ("ada@example.com", "CS002"),
+                                                 ("bob@example.com", "CS002"), ("bob@example.com", "XX999"),
+                                                 ("eve@example.com", "CS003"), ("bob@example.com", "CS002")])
+    assert (report["completions"], report["users"], report["matched"], report["modified"]) == (6, 3, 2, 2)
+    assert report["unknown_users"] == ["eve@example.com"]
+    assert report["unknown_courses"] == ["XX999"]
+    assert mdb_api.find_user_by_email("ada@example.com").completed_courses == ["CS000", "CS002"]
+    assert mdb_api.find_user_by_email("bob@example.com").completed_courses == ["CS002"]
+
+
+def test_bulk_completions_without_validation_keep_unknown_courses(backend):
+    add_students()
+    report = mdb_api.add_completed_courses_bulk([("bob@example.com", "XX999")], validate_courses=False)
+    assert report["unknown_courses"] == [] and report["modified"] == 1
+    assert mdb_api.find_user_by_email("bob@example.com").completed_courses == ["XX999"]
+
+
+def test_import_completions_from_csv(backend, tmp_path, capsys):
+    add_students()
+    csv_path = tmp_path / "completions.csv"
+    csv_path.write_text("ada@example.com,cs005,A\n\nbob@example.com\nbob@example.com, CS006 \n", encoding="utf-8")
+    report = import_completions_from_csv(str(csv_path), mdb_api.add_completed_courses_bulk)
+    assert (report["completions"], report["modified"]) == (2, 2)
+    assert "Malformed row found, skipping at 3" in capsys.readouterr().out
+    assert mdb_api.find_user_by_email("ada@example.com").completed_courses == ["CS000", "CS005"]
+    assert mdb_api.find_user_by_email("bob@example.com").completed_courses == ["CS006"]
+    assert import_completions_from_csv(str(tmp_path / "missing.csv"), mdb_api.add_completed_courses_bulk) is None
@@ -0,0 +1,126 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_course_cache.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the read-through course cache: LRU eviction, time to
+#               live, negative caching and invalidation by the writes.
+# ============================================================================
+
+
+# Modules imports
+import pytest  # Test framework
+from models.course import Course  # Import the Course class
+from services import mdb_api, course_cache  # API and cache under test
+from services.backends.memory_backend import MemoryBackend  # Backend kept in process memory
+
+
+CATALOG = [Course(f"CS{index:03d}", f"Course {index}") for index in range(10)]
+
+
+# Memory backend holding the catalog, with the cache settings restored after the test.
+@pytest.fixture
+def memory_backend(monkeypatch):
+    backend = MemoryBackend()
+    mdb_api.use_backend(backend)
+    mdb_api.insert_courses(CATALOG)
+    mdb_api.course_cache.clear()
+    for cache in (mdb_api.course_cache, mdb_api.course_detail_cache):
+        for setting in ("max_size", "ttl", "missing_ttl"):
+            monkeypatch.setattr(cache, setting, getattr(cache, setting))
+    yield backend
+    mdb_api.use_backend(MemoryBackend())
+
+
+# Clock of the cache moved forward by the tests.
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(course_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+# Count the course lookups that reach the backend.
+def count_queries(monkeypatch, backend) -> list:
+    queries = []
+    find_courses = backend.find_courses
+    monkeypatch.setattr(backend, "find_courses", lambda numbers, fields=None: queries.append(list(numbers))
+                        or find_courses(numbers, fields))
+    return queries
+
+
+def test_lru_eviction_at_the_configured_size(memory_backend, monkeypatch):
+    monkeypatch.setenv("COURSE_CACHE_SIZE", "3")
+    mdb_api._configure_course_cache()
+    for number in ("CS000", "CS001", "CS002"):
+        mdb_api.find_course_by_number(number)
+    mdb_api.find_course_by_number("CS000")  # Now the most recently used
+    mdb_api.find_course_by_number("CS003")  # Evicts CS001, the least recently used
+    stats = mdb_api.course_cache_stats()
+    assert stats["size"] == 3 and stats["evictions"] == 1
+    queries = count_queries(monkeypatch, memory_backend)
+    mdb_api.find_course_by_number("CS000")
+    mdb_api.find_course_by_number("CS001")
+    assert queries == [["CS001"]]
+
+
+def test_ttl_expiry(memory_backend, monkeypatch, clock):
+    mdb_api.course_cache.ttl = 10
+    mdb_api.find_course_by_number("CS000")
+    queries = count_queries(monkeypatch, memory_backend)
+    clock[0] += 5
+    assert mdb_api.find_course_by_number("CS000") == CATALOG[0]
+    assert queries == []
+    clock[0] += 6
+    assert mdb_api.find_course_by_number("CS000") == CATALOG[0]
+    assert queries == [["CS000"]]
+    assert mdb_api.course_cache_stats()["expirations"] == 1
+
+
+def test_negative_caching_with_short_ttl(memory_backend, monkeypatch, clock):
+    mdb_api.course_cache.ttl = None
+    mdb_api.course_cache.missing_ttl = 30
+    queries = count_queries(monkeypatch, memory_backend)
+    assert mdb_api.find_course_by_number("XX999") is None
+    assert mdb_api.find_courses_by_numbers(["XX999", "CS000"]) == {"XX999": None, "CS000": CATALOG[0]}
+    assert queries == [["XX999"], ["CS000"]]
+    # The course is written by another process, the unknown number expires while the courses never do.
+    memory_backend.insert_course({**CATALOG[0].to_dict(), "number": "XX999"})
+    clock[0] += 31
+    assert mdb_api.find_course_by_number("XX999").number == "XX999"
+    assert mdb_api.find_course_by_number("CS000") == CATALOG[0]
+    assert queries == [["XX999"], ["CS000"], ["XX999"]]
+
+
+@pytest.mark.parametrize("write", [
+    lambda course: mdb_api.insert_course(course),
+    lambda course: mdb_api.insert_courses([course]),
+])
+def test_insert_invalidates_the_missing_entry(memory_backend, write):
+    assert mdb_api.find_course_by_number("CS100") is None
+    write(Course("CS100", "New course"))
+    assert mdb_api.find_course_by_number("CS100") == Course("CS100", "New course")
+
+
+def test_clear_courses_invalidates_the_cache(memory_backend):
+    assert mdb_api.find_course_by_number("CS000") == CATALOG[0]
+    mdb_api.clear_courses()
+    assert mdb_api.find_course_by_number("CS000") is None
+    assert mdb_api.course_cache_stats()["size"] == 1
+
+
+def test_lookup_racing_an_insert_does_not_cache_a_stale_miss(memory_backend, monkeypatch):
+    find_courses = memory_backend.find_courses
+
+    # The backend answers "not found", then another thread inserts the course before the answer is cached.
+    def racing_find_courses(numbers, fields=None):
+        found = find_courses(numbers, fields)
+        monkeypatch.setattr(memory_backend, "find_courses", find_courses)
+        mdb_api.insert_course(Course("CS100", "New course"))
+        return found
+
+    monkeypatch.setattr(memory_backend, "find_courses", racing_find_courses)
+    mdb_api.course_cache.missing_ttl = None
+    assert mdb_api.find_course_by_number("CS100") is None
+    assert mdb_api.find_course_by_number("CS100") == Course("CS100", "New course")
@@ -0,0 +1,83 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_course_catalog.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the compact Course objects and of the column-based
+#               CourseCatalog: lookups, iteration order and prerequisites.
+# ============================================================================
+
+
+# Modules imports
+import dataclasses  # Used to check that the courses are frozen
+import pytest  # Test framework
+from models.course import Course  # Import the Course class
+from models.course_catalog import CourseCatalog, StringTable  # Catalog under test
+from utils.data_loader import load_catalog_from_file  # Streamed catalog loading
+
+
+# ENG100 is only a prerequisite, the second CS100 is a duplicate and is skipped.
+COURSES = [
+    Course("CS300", "Algorithms", ["CS200", "ENG100"]),
+    Course("CS100", "Intro"),
+    Course("CS200", "Data Structures", ("CS100",)),
+    Course("CS100", "Duplicate"),
+    Course("MAT100", "Cálculo"),
+]
+
+
+def test_course_is_frozen_and_interned():
+    course = Course("".join(["CS", "100"]), "Intro", ["CS050"])
+    assert course.prerequisites == ("CS050",)
+    assert course.number is Course("CS100").number
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        course.name = "Other"
+    assert not hasattr(course, "__dict__")
+    assert Course.from_dict({"_id": 1, **course.to_dict()}) == course
+    assert course.content_hash() == Course("CS100", "Intro", ("CS050",)).content_hash()
+    assert course.content_hash() != Course("CS100", "Intro").content_hash()
+
+
+def test_string_table():
+    table = StringTable(["CS100", "", "Cálculo"])
+    assert len(table) == 3
+    assert [table[i] for i in range(3)] == ["CS100", "", "Cálculo"]
+
+
+def test_catalog_lookups():
+    catalog = CourseCatalog(COURSES)
+    assert len(catalog) == 4 and catalog.duplicates == 1
+    assert catalog.get("CS300") == COURSES[0]
+    assert catalog.get("CS100") == Course("CS100", "Intro")
+    assert catalog.get("MAT100").name == "Cálculo"
+    assert catalog.get("ENG100") is None and catalog.get("CS000") is None and catalog.get("ZZ999") is None
+    assert "CS200" in catalog and "ENG100" not in catalog
+    assert catalog.unresolved() == ["ENG100"]
+
+
+def test_catalog_iteration_orders():
+    catalog = CourseCatalog(iter(COURSES))
+    assert [course.number for course in catalog] == ["CS300", "CS100", "CS200", "MAT100"]
+    assert [course.number for course in catalog.iter_sorted()] == ["CS100", "CS200", "CS300", "MAT100"]
+
+
+def test_prerequisite_ids_are_rows_then_unresolved():
+    catalog = CourseCatalog(COURSES)
+    assert list(catalog.prerequisite_ids(catalog.row_of("CS300"))) == [2, 4]  # CS200 row, then ENG100
+    assert list(catalog.prerequisite_ids(catalog.row_of("CS100"))) == []
+    assert catalog.row_of("ENG100") == -1
+
+
+def test_empty_catalog():
+    catalog = CourseCatalog()
+    assert len(catalog) == 0 and list(catalog) == [] and catalog.get("CS100") is None
+
+
+def test_load_catalog_from_file(tmp_path, capsys):
+    csv_path = tmp_path / "catalog.csv"
+    csv_path.write_text("CS100,Intro\nCS200,Data Structures,CS100\n", encoding="utf-8")
+    catalog = load_catalog_from_file(str(csv_path))
+    assert list(catalog) == [Course("CS100", "Intro"), Course("CS200", "Data Structures", ("CS100",))]
+    assert load_catalog_from_file(str(tmp_path / "missing.csv")) is None
+    assert "Could not open file" in capsys.readouterr().out
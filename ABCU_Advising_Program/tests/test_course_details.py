@@ -0,0 +1,172 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_course_details.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the materialized course-detail documents: the
+#               incremental updates must match a full rebuild.
+# ============================================================================
+
+
+# Modules imports
+import random  # Random catalogs for the comparison with a rebuild
+from models.course import Course  # Import the Course class
+from services import mdb_api  # Database API keeping the details up to date
+from services import course_details  # Module under test
+from services.course_details import rebuild_course_details  # Full build compared with the incremental updates
+
+
+CATALOG = [
+    Course("CS100", "Intro"),
+    Course("CS200", "Data Structures", ("CS100",)),
+    Course("CS300", "Algorithms", ("CS200", "MAT100")),
+    Course("CS400", "Compilers", ("CS300", "CS200")),
+    Course("MAT100", "Discrete Math"),
+]
+
+
+# Return all the stored details (placeholders included) by course number.
+def stored_details(backend) -> dict[str, dict]:
+    return {detail["number"]: detail for detail in backend.iter_course_details()}
+
+
+# Return the details built from scratch from the stored courses, without changing the stored ones.
+def rebuilt_details(backend) -> dict[str, dict]:
+    incremental = stored_details(backend)
+    rebuild_course_details(backend)
+    rebuilt = stored_details(backend)
+    backend.clear_course_details()
+    backend.write_course_details(list(incremental.values()), [])
+    return rebuilt
+
+
+def test_first_load_builds_details(backend):
+    mdb_api.insert_courses(CATALOG, batch_size=2)
+    details = stored_details(backend)
+    assert details == rebuilt_details(backend)
+    assert details["CS300"]["prerequisites"] == [{"number": "CS200", "name": "Data Structures"},
+                                                 {"number": "MAT100", "name": "Discrete Math"}]
+    assert details["CS200"]["dependents"] == ["CS300", "CS400"]
+    assert [details[number]["depth"] for number in ("CS100", "CS200", "CS300", "CS400")] == [0, 1, 2, 3]
+
+
+def test_single_insert_updates_details(backend):
+    mdb_api.insert_courses(CATALOG[:4])
+    assert stored_details(backend)["MAT100"]["in_catalog"] is False  # Placeholder of the missing prerequisite
+    assert mdb_api.insert_course(CATALOG[4])
+    details = stored_details(backend)
+    assert details == rebuilt_details(backend)
+    assert details["CS300"]["prerequisites"][1] == {"number": "MAT100", "name": "Discrete Math"}
+    assert mdb_api.find_course_details("MAT100")["dependents"] == ["CS300"]
+
+
+def test_first_load_does_not_refresh_after_rebuild(backend, monkeypatch):
+    calls = []
+    original = course_details.refresh_course_details
+    monkeypatch.setattr(mdb_api.course_details, "refresh_course_details",
+                        lambda *args: calls.append(args) or original(*args))
+    mdb_api.insert_courses(CATALOG)
+    assert len(calls) == 1  # The full build only, the batch is not refreshed again
+
+
+# Return the depth of the given courses as stored in their details.
+def depths(backend, *numbers) -> list:
+    details = stored_details(backend)
+    return [details[number]["depth"] for number in numbers]
+
+
+def test_cycle_marks_only_the_courses_on_or_after_it(backend):
+    mdb_api.insert_courses(CATALOG + [Course("ENG100", "Writing")])
+    # CS100 now requires CS300: CS100 -> CS200 -> CS300 -> CS100 is a cycle and CS400 comes after it.
+    mdb_api.sync_catalog([Course("CS100", "Intro", ("CS300",))] + CATALOG[1:] + [Course("ENG100", "Writing")])
+    assert depths(backend, "CS100", "CS200", "CS300", "CS400") == [None] * 4
+    assert depths(backend, "MAT100", "ENG100") == [0, 0]
+    # A course added after the cycle was found is not on it and gets its depth.
+    assert mdb_api.insert_course(Course("ENG200", "Technical Writing", ("ENG100",)))
+    assert depths(backend, "ENG200") == [1]
+    assert stored_details(backend) == rebuilt_details(backend)
+    # Removing the edge that closes the cycle gives the depths back.
+    mdb_api.sync_catalog(CATALOG + [Course("ENG100", "Writing"), Course("ENG200", "Technical Writing", ("ENG100",))])
+    assert depths(backend, "CS100", "CS200", "CS300", "CS400", "ENG200") == [0, 1, 2, 3, 1]
+    assert stored_details(backend) == rebuilt_details(backend)
+
+
+def test_incremental_details_match_rebuild(backend):
+    rng = random.Random(25)
+    numbers = [f"C{index:02d}" for index in range(30)]
+    for _ in range(15):
+        # Random catalog versions, some with cycles and prerequisites missing from the catalog.
+        present = rng.sample(numbers, rng.randint(10, 30))
+        catalog = [Course(number, f"Course {number} v{rng.randint(0, 2)}", rng.sample(numbers, rng.randint(0, 3)))
+                   for number in present]
+        mdb_api.sync_catalog(catalog)
+        assert stored_details(backend) == rebuilt_details(backend)
+
+
+def test_cycle_is_found_without_extra_rounds(backend, monkeypatch):
+    others = [Course(f"C{index:03d}", "Course") for index in range(200)]
+    mdb_api.insert_courses(CATALOG + others)
+    rounds = []
+    original = course_details._prerequisites_first
+    monkeypatch.setattr(course_details, "_prerequisites_first",
+                        lambda numbers, details: rounds.append(numbers) or original(numbers, details))
+    # CS100 now requires CS300 closing a cycle, while the other courses are renamed in the same sync.
+    mdb_api.sync_catalog([Course("CS100", "Intro", ("CS300",))] + CATALOG[1:] +
+                         [Course(course.number, "Renamed") for course in others])
+    assert depths(backend, "CS100", "CS200", "CS300", "CS400", "MAT100", "C000") == [None] * 4 + [0, 0]
+    # The cycle is found from the structure of the graph, not by counting more rounds than courses.
+    assert len(rounds) < 10
+
+
+# Count the detail lookups that reach the backend.
+def count_detail_queries(monkeypatch, backend) -> list:
+    queries = []
+    find_course_details = backend.find_course_details
+    monkeypatch.setattr(backend, "find_course_details",
+                        lambda numbers: queries.append(list(numbers)) or find_course_details(numbers))
+    return queries
+
+
+def test_detail_lookups_are_cached(backend, monkeypatch):
+    mdb_api.insert_courses(CATALOG)
+    queries = count_detail_queries(monkeypatch, backend)
+    assert mdb_api.find_course_details("CS200")["dependents"] == ["CS300", "CS400"]
+    assert mdb_api.find_course_details("CS200")["dependents"] == ["CS300", "CS400"]
+    assert mdb_api.find_course_details("XX999") is None
+    assert mdb_api.find_course_details("XX999") is None
+    assert queries == [["CS200"], ["XX999"]]
+    assert mdb_api.course_detail_cache_stats()["hits"] >= 2
+
+
+def test_detail_cache_follows_the_writes(backend):
+    mdb_api.insert_courses(CATALOG)
+    assert mdb_api.find_course_details("CS400")["depth"] == 3
+    assert mdb_api.find_course_details("ENG100") is None
+    # A new course changes the cached details of its prerequisite and of the course itself.
+    assert mdb_api.insert_course(Course("ENG100", "Writing", ("CS400",)))
+    assert mdb_api.find_course_details("CS400")["dependents"] == ["ENG100"]
+    assert mdb_api.find_course_details("ENG100")["depth"] == 4
+    # A sync removing CS100 changes the depth of the courses after it.
+    mdb_api.sync_catalog(CATALOG[1:] + [Course("ENG100", "Writing", ("CS400",))])
+    assert mdb_api.find_course_details("CS400")["depth"] == 2
+    mdb_api.rebuild_course_details()
+    assert mdb_api.find_course_details("CS400")["depth"] == 2
+    mdb_api.clear_courses()
+    assert mdb_api.find_course_details("CS400") is None
+
+
+def test_detail_lookup_racing_a_write_does_not_cache_old_details(backend, monkeypatch):
+    mdb_api.insert_courses(CATALOG)
+    find_course_details = backend.find_course_details
+
+    # The old details are read, then another thread adds a dependent before they are cached.
+    def racing_find_course_details(numbers):
+        found = find_course_details(numbers)
+        monkeypatch.setattr(backend, "find_course_details", find_course_details)
+        mdb_api.insert_course(Course("CS500", "Theory", ("CS400",)))
+        return found
+
+    monkeypatch.setattr(backend, "find_course_details", racing_find_course_details)
+    assert mdb_api.find_course_details("CS400")["dependents"] == []
+    assert mdb_api.find_course_details("CS400")["dependents"] == ["CS500"]
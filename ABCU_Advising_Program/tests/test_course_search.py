@@ -0,0 +1,126 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_course_search.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the catalog search index: prefix, range and word
+#               search, the ranking of the results and the index kept in sync
+#               with the writes of the database API.
+# ============================================================================
+
+
+# Modules imports
+import random  # Random queries compared with a full scan
+import pytest  # Test framework
+from benchmarks.generator import generate_catalog  # Synthetic catalog
+from models.course import Course  # Import the Course class
+from services import mdb_api  # Database API keeping the index in sync
+from services.course_search import CourseSearchIndex, tokenize  # Index under test
+
+
+COURSES = [
+    ("CS200", "Data Structures"),
+    ("CS100", "Introduction to Programming"),
+    ("CS210", "Data Structures II"),
+    ("MATH100", "Calculus"),
+    ("CS300", "Databases"),
+    ("CS101", "Programming Lab"),
+]
+
+
+@pytest.fixture
+def index():
+    return CourseSearchIndex(COURSES)
+
+
+def test_tokenize():
+    assert tokenize("Data-Structures  II, data_base") == ["data", "structures", "ii", "base"]
+
+
+def test_prefix(index):
+    assert index.prefix("CS1") == [("CS100", "Introduction to Programming"), ("CS101", "Programming Lab")]
+    assert index.prefix("CS", limit=2) == [("CS100", "Introduction to Programming"), ("CS101", "Programming Lab")]
+    assert index.prefix("MATH") == [("MATH100", "Calculus")]
+    assert index.prefix("BIO") == []
+
+
+def test_range(index):
+    assert [number for number, _ in index.range("CS101", "CS210")] == ["CS101", "CS200", "CS210"]
+    assert [number for number, _ in index.range("CS", "CS2", limit=10)] == ["CS100", "CS101"]
+    assert [number for number, _ in index.range("CS000", "ZZZ", limit=2)] == ["CS100", "CS101"]
+    assert index.range("CS400", "CS100") == []
+
+
+def test_word_search_and_ranking(index):
+    # Exact words first, then the words starting with the last one; shorter names first in each group.
+    assert index.search("data") == [("CS200", "Data Structures"), ("CS210", "Data Structures II"),
+                                    ("CS300", "Databases")]
+    assert index.search("data structures ii") == [("CS210", "Data Structures II")]
+    assert index.search("programming") == [("CS101", "Programming Lab"), ("CS100", "Introduction to Programming")]
+    assert index.search("introduction prog") == [("CS100", "Introduction to Programming")]
+    assert index.search("intro prog") == []  # Only the last word can be incomplete
+    assert index.search("cs1") == [("CS101", "Programming Lab"), ("CS100", "Introduction to Programming")]
+    assert index.search("data", k=1) == [("CS200", "Data Structures")]
+    assert index.search("missing data") == []
+    assert index.search("  ") == [] and index.search("data", k=0) == []
+
+
+def test_add_replace_and_remove(index):
+    index.add("CS400", "Advanced Data Mining")
+    index.add("CS200", "Algorithms")  # The old name is no longer searchable
+    assert [number for number, _ in index.search("data")] == ["CS210", "CS400", "CS300"]
+    assert index.search("algorithms") == [("CS200", "Algorithms")]
+    index.remove("CS210")
+    index.remove("XX999")
+    assert index.search("structures") == []
+    assert "structures" not in index.words and len(index) == 6
+    index.clear()
+    assert len(index) == 0 and index.search("data") == [] and index.prefix("") == []
+
+
+# Return the search results computed with a scan of the whole catalog.
+def scan_search(courses, query: str, k: int) -> list[tuple[str, str]]:
+    *required, last = tokenize(query)
+    matches = []
+    for number, name in courses:
+        words = tokenize(f"{number} {name}")
+        if not all(word in words for word in required):
+            continue
+        if last in words:
+            matches.append((0, len(name), number, name))
+        elif any(word.startswith(last) for word in words):
+            matches.append((1, len(name), number, name))
+    return [(number, name) for _, _, number, name in sorted(matches)[:k]]
+
+
+def test_search_matches_a_full_scan():
+    courses = [(course.number, course.name) for course in generate_catalog(3000, seed=3)]
+    index = CourseSearchIndex(courses)
+    rng = random.Random(3)
+    words = sorted({word for number, name in courses for word in tokenize(name)})
+    queries = ["intro", "advanced sec", "data structures ii", "m", "laboratory", "cs0001", "methods in st"]
+    queries += [" ".join(rng.sample(words, 2)) + " " + rng.choice(words)[:2] for _ in range(30)]
+    for query in queries:
+        for k in (1, 10, 50):
+            assert index.search(query, k) == scan_search(courses, query, k), query
+
+
+def test_api_keeps_the_index_in_sync(backend):
+    mdb_api.insert_courses([Course(number, name) for number, name in COURSES])
+    assert mdb_api.search_courses("data", k=1) == [("CS200", "Data Structures")]  # Builds the index
+    mdb_api.insert_course(Course("CS050", "Data Literacy"))
+    mdb_api.insert_courses([Course("CS060", "Big Data")])
+    assert [number for number, _ in mdb_api.search_courses("data")] == \
+           ["CS060", "CS050", "CS200", "CS210", "CS300"]
+    assert mdb_api.find_courses_by_prefix("CS0") == [("CS050", "Data Literacy"), ("CS060", "Big Data")]
+
+    mdb_api.sync_catalog([Course("CS100", "Introduction to Programming"), Course("CS200", "Algorithms"),
+                          Course("CS500", "Data Science")])
+    assert mdb_api.search_courses("data") == [("CS500", "Data Science")]
+    assert [number for number, _ in mdb_api.find_courses_in_range("CS000", "CS999")] == ["CS100", "CS200", "CS500"]
+
+    mdb_api.clear_courses()
+    assert mdb_api.search_courses("data") == [] and mdb_api.find_courses_by_prefix("CS") == []
+    mdb_api.insert_course(Course("CS700", "Data Ethics"))
+    assert mdb_api.search_courses("data") == [("CS700", "Data Ethics")]
@@ -0,0 +1,41 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_csv_to_json.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the chunked CSV to JSON catalog conversion.
+# ============================================================================
+
+
+# Modules imports
+import json  # Used to read the converted files
+from utils import data_loader  # Converter under test
+
+
+CSV = "CS100,Intro\nCS200,Data Structures,CS100\nbad row\nCS300,Algorithms,CS200,MAT999\n"
+EXPECTED = [{"code": "CS100", "title": "Intro", "prerequisites": []},
+            {"code": "CS200", "title": "Data Structures", "prerequisites": ["CS100"]},
+            {"code": "CS300", "title": "Algorithms", "prerequisites": ["CS200", "MAT999"]}]
+
+
+# Stand-in for ProcessPoolExecutor that fails the test if a pool is started.
+def no_pool(*args, **kwargs):
+    raise AssertionError("a process pool was started")
+
+
+def test_small_file_is_converted_without_processes(tmp_path, monkeypatch):
+    csv_path = tmp_path / "catalog.csv"
+    csv_path.write_text(CSV, encoding="utf-8")
+    monkeypatch.setattr(data_loader, "ProcessPoolExecutor", no_pool)
+    data_loader.csv_to_json_courses(str(csv_path), str(tmp_path / "catalog.json"), workers=0)
+    # The malformed row is skipped, the unknown prerequisite is reported and kept.
+    assert json.loads((tmp_path / "catalog.json").read_text(encoding="utf-8")) == EXPECTED
+
+
+def test_parallel_conversion_matches_serial(tmp_path):
+    csv_path = tmp_path / "catalog.csv"
+    csv_path.write_text(CSV * 3, encoding="utf-8")
+    data_loader.csv_to_json_courses(str(csv_path), str(tmp_path / "serial.json"), workers=1, chunk_bytes=16)
+    data_loader.csv_to_json_courses(str(csv_path), str(tmp_path / "parallel.json"), workers=2, chunk_bytes=16)
+    assert (tmp_path / "serial.json").read_bytes() == (tmp_path / "parallel.json").read_bytes()
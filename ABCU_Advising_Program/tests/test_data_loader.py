@@ -0,0 +1,125 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_data_loader.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the streaming catalog loaders and of the catalog
+#               synchronization from a file.
+# ============================================================================
+
+
+# Modules imports
+from models.course import Course  # Courses given to the prerequisite tracker
+from services import mdb_api  # Database API the loaders write to
+from utils.data_loader import (stream_courses_from_csv_file, stream_courses_from_json_file,
+                               sync_catalog_from_file, PrerequisiteTracker)  # Loaders under test
+
+
+# Catalog where CS200 and CS300 require each other, so neither could ever be taken.
+CYCLIC_CSV = "CS100,Intro\nCS200,Data Structures,CS100,CS300\nCS300,Algorithms,CS200\n"
+ACYCLIC_CSV = "CS100,Intro\nCS200,Data Structures,CS100\nCS300,Algorithms,CS200\n"
+CYCLIC_JSON = """[
+  {"code": "CS100", "title": "Intro"},
+  {"code": "CS200", "title": "Data Structures", "prerequisites": ["CS100", "CS300"]},
+  {"code": "CS300", "title": "Algorithms", "prerequisites": ["CS200"]}
+]"""
+
+
+# Write a catalog file in the test directory and return its path.
+def write_file(tmp_path, name: str, content: str) -> str:
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+def test_stream_csv_loads_acyclic_catalog(backend, tmp_path):
+    report = stream_courses_from_csv_file(write_file(tmp_path, "catalog.csv", ACYCLIC_CSV), mdb_api.insert_courses)
+    assert report["cycle"] is None
+    assert report["courses"] == 3
+    assert [course.number for course in mdb_api.list_courses_sorted()] == ["CS100", "CS200", "CS300"]
+
+
+def test_stream_csv_rejects_cyclic_catalog(backend, tmp_path, capsys):
+    report = stream_courses_from_csv_file(write_file(tmp_path, "catalog.csv", CYCLIC_CSV), mdb_api.insert_courses)
+    assert report["cycle"] in (["CS200", "CS300", "CS200"], ["CS300", "CS200", "CS300"])
+    assert report["courses"] == 0 and report["results"] == []
+    assert "Prerequisite cycle found" in capsys.readouterr().out
+    assert mdb_api.list_courses_sorted() == []
+
+
+def test_stream_csv_stops_at_the_chunk_closing_a_cycle(backend, tmp_path):
+    # The chunks before the one closing the cycle are inserted, the cycle itself never is.
+    report = stream_courses_from_csv_file(write_file(tmp_path, "catalog.csv", CYCLIC_CSV), mdb_api.insert_courses,
+                                          chunk_size=1)
+    assert report["cycle"] == ["CS300", "CS200", "CS300"]
+    assert report["courses"] == 2
+    assert [course.number for course in mdb_api.list_courses_sorted()] == ["CS100", "CS200"]
+
+
+def test_stream_csv_reads_the_file_once(backend, tmp_path, monkeypatch):
+    opened = []
+    real_open = open
+    monkeypatch.setattr("builtins.open", lambda *args, **kwargs: opened.append(args[0]) or real_open(*args, **kwargs))
+    stream_courses_from_csv_file(write_file(tmp_path, "catalog.csv", ACYCLIC_CSV), mdb_api.insert_courses)
+    assert len(opened) == 1
+
+
+def test_tracker_finds_cycles_closed_in_any_order():
+    tracker = PrerequisiteTracker()
+    # Courses listed before their prerequisites: no cycle until CS100 closes it.
+    for number, prereqs in [("CS400", ["CS300"]), ("CS300", ["CS200"]), ("CS200", ["CS100"])]:
+        tracker.add(Course(number=number, prerequisites=prereqs))
+        assert tracker.find_cycle() is None
+    tracker.add(Course(number="CS100", prerequisites=["CS300"]))
+    assert tracker.find_cycle() == ["CS100", "CS200", "CS300", "CS100"]
+
+
+def test_tracker_ignores_repeated_courses_and_finds_self_loops():
+    tracker = PrerequisiteTracker()
+    tracker.add(Course(number="CS100"))
+    tracker.add(Course(number="CS100", prerequisites=["CS100", "MATH101"]))  # Only the first definition counts
+    assert tracker.find_cycle() is None
+    assert tracker.unresolved() == {"MATH101": ["CS100"]}
+    tracker.add(Course(number="CS200", prerequisites=["CS200"]))
+    assert tracker.find_cycle() == ["CS200", "CS200"]
+
+
+def test_sync_rejects_cyclic_catalog(backend, tmp_path):
+    stream_courses_from_csv_file(write_file(tmp_path, "catalog.csv", ACYCLIC_CSV), mdb_api.insert_courses)
+    assert sync_catalog_from_file(write_file(tmp_path, "cyclic.csv", CYCLIC_CSV), mdb_api.sync_catalog) is None
+    # The stored catalog is unchanged.
+    assert mdb_api.find_course_by_number("CS200").prerequisites == ("CS100",)
+
+
+def test_stream_json_rejects_cyclic_catalog(backend, tmp_path, capsys):
+    report = stream_courses_from_json_file(write_file(tmp_path, "catalog.json", CYCLIC_JSON), mdb_api.insert_courses)
+    assert report["cycle"] in (["CS200", "CS300", "CS200"], ["CS300", "CS200", "CS300"])
+    assert report["courses"] == 0 and report["results"] == []
+    assert "Prerequisite cycle found" in capsys.readouterr().out
+    assert mdb_api.list_courses_sorted() == []
+
+
+def test_stream_json_inserts_nothing_from_invalid_first_chunk(backend, tmp_path):
+    report = stream_courses_from_json_file(write_file(tmp_path, "catalog.json", CYCLIC_JSON[:-10]),
+                                           mdb_api.insert_courses)
+    assert report["courses"] == 0
+    assert mdb_api.list_courses_sorted() == []
+
+
+def test_stream_json_inserts_the_first_chunk_before_reading_the_rest(backend, tmp_path):
+    inserted_while_reading = []
+
+    # Record how many courses are stored when each chunk is inserted.
+    def insert(chunk):
+        inserted_while_reading.append(len(mdb_api.list_courses_sorted()))
+        return mdb_api.insert_courses(chunk)
+
+    report = stream_courses_from_json_file(write_file(tmp_path, "catalog.json", CYCLIC_JSON), insert, chunk_size=1)
+    assert report["cycle"] == ["CS300", "CS200", "CS300"]
+    assert inserted_while_reading == [0, 1]
+
+
+def test_sync_rejects_cyclic_json_catalog(backend, tmp_path):
+    assert sync_catalog_from_file(write_file(tmp_path, "cyclic.json", CYCLIC_JSON), mdb_api.sync_catalog) is None
+    assert mdb_api.list_courses_sorted() == []
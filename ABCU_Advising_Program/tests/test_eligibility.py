@@ -0,0 +1,80 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_eligibility.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the bulk eligibility engine computed with bitsets.
+# ============================================================================
+
+
+# Modules imports
+import csv  # Used to read the exported files
+import random  # Random students for the comparison with the prerequisite graph
+from models.course import Course  # Import the Course class
+from models.prereq_graph import PrerequisiteGraph  # Graph of the course prerequisites
+from services import eligibility  # Engine under test
+
+
+CATALOG = [
+    Course("CS100", "Intro"),
+    Course("CS200", "Data Structures", ("CS100",)),
+    Course("CS300", "Algorithms", ("CS200", "MAT100")),
+    Course("CS400", "Networks", ("CS200", "EE100")),  # EE100 is not in the catalog
+    Course("MAT100", "Discrete Math"),
+]
+
+
+def test_bitset_helpers():
+    bitset = eligibility._bitset([0, 3, 9, 64], 70)
+    assert bitset == (1 << 0) | (1 << 3) | (1 << 9) | (1 << 64)
+    assert eligibility._bit_positions(bitset) == [0, 3, 9, 64]
+    assert eligibility._bit_positions(0) == []
+    assert eligibility._bitset([], 0) == 0
+
+
+def test_engine_matches_the_prerequisite_graph():
+    graph = PrerequisiteGraph(CATALOG)
+    engine = eligibility.EligibilityEngine(graph)
+    rng = random.Random(19)
+    students = [rng.sample(["CS100", "CS200", "CS300", "MAT100", "EE100", "XX999"], rng.randint(0, 6))
+                for _ in range(150)]
+    counts, courses = engine.evaluate(students, with_courses=True)
+    for completed, columns in zip(students, courses):
+        assert [engine.numbers[column] for column in columns] == graph.eligible_courses(completed)
+    assert counts == [sum(number in graph.eligible_courses(completed) for completed in students)
+                      for number in engine.numbers]
+    assert engine.evaluate(students, with_courses=False) == (counts, None)
+
+
+def test_report_shards_and_exports(tmp_path):
+    students = [(f"s{index:03d}@example.com", ["CS100", "CS200"] if index % 3 else []) for index in range(10)]
+    pairs_path = tmp_path / "pairs.csv"
+    summary_path = tmp_path / "summary.csv"
+    report = eligibility.eligibility_report(iter(students), PrerequisiteGraph(CATALOG), str(pairs_path),
+                                            str(summary_path), workers=1, shard_size=4)
+    assert report["students"] == 10 and report["shards"] == 3
+    # 4 students completed nothing (CS100 and MAT100 open), 6 completed CS100 and CS200 (MAT100 open).
+    assert report["counts"] == {"CS100": 4, "CS200": 0, "CS300": 0, "CS400": 0, "MAT100": 10}
+    assert report["pairs"] == 14
+    with open(pairs_path, newline="", encoding="utf-8") as pairs_file:
+        assert ["s000@example.com", "CS100"] in list(csv.reader(pairs_file))
+    with open(summary_path, newline="", encoding="utf-8") as summary_file:
+        assert list(csv.reader(summary_file))[0] == ["CS100", "Intro", "4"]
+
+
+def test_single_shard_does_not_start_a_pool(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a process pool was started")
+
+    monkeypatch.setattr(eligibility, "ProcessPoolExecutor", no_pool)
+    report = eligibility.eligibility_report([("s@example.com", ["CS100"])], PrerequisiteGraph(CATALOG), workers=0)
+    assert report["counts"]["CS200"] == 1 and report["shards"] == 1
+
+
+def test_parallel_report_matches_serial():
+    students = [(f"s{index:03d}@example.com", ["CS100", "MAT100"][:index % 3]) for index in range(30)]
+    graph = PrerequisiteGraph(CATALOG)
+    serial = eligibility.eligibility_report(iter(students), graph, workers=1, shard_size=7)
+    parallel = eligibility.eligibility_report(iter(students), graph, workers=2, shard_size=7)
+    assert parallel["counts"] == serial["counts"] and parallel["shards"] == serial["shards"] == 5
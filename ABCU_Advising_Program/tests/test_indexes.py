@@ -0,0 +1,62 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_indexes.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the unique course numbers and emails: rejected
+#               duplicates, the report of the stored duplicates and dedupe.
+# ============================================================================
+
+
+# Modules imports
+import pytest  # Test framework
+from models.course import Course  # Import the Course class
+from models.user import User  # Import the User class
+from services import mdb_api  # Database API under test
+from services.backends.memory_backend import MemoryBackend  # Backend kept in process memory
+
+
+def test_duplicate_course_and_user_are_rejected(backend, capsys):
+    assert mdb_api.ensure_indexes()
+    assert mdb_api.insert_course(Course("CS100", "Intro"))
+    assert not mdb_api.insert_course(Course("CS100", "Other"))
+    assert "Course number CS100 already exists." in capsys.readouterr().out
+    assert mdb_api.find_course_by_number("CS100").name == "Intro"
+    assert mdb_api.insert_user(User("Ada", "Lovelace", "ada@example.com", b"hash"))
+    assert not mdb_api.insert_user(User("Ada", "Other", "ada@example.com", b"hash"))
+    assert "User ada@example.com already exists." in capsys.readouterr().out
+    assert mdb_api.find_duplicate_courses() == [] and mdb_api.find_duplicate_users() == []
+    assert mdb_api.dedupe_courses() == 0
+
+
+# MongoDB collections (replaced by mongomock) holding duplicates written before the unique indexes existed.
+@pytest.fixture
+def duplicated_collections():
+    mongomock = pytest.importorskip("mongomock")  # In-memory stand-in of the MongoDB collections
+    db = mongomock.MongoClient().db
+    db.courses.insert_many([{"number": "CS100", "name": "First", "prerequisites": [], "content_hash": "a"},
+                            {"number": "CS200", "name": "Data", "prerequisites": [], "content_hash": "b"},
+                            {"number": "CS100", "name": "Second", "prerequisites": [], "content_hash": "c"},
+                            {"number": "CS100", "name": "Third", "prerequisites": [], "content_hash": "d"}])
+    db.users.insert_many([{"name": "Ada", "surname": "Lovelace", "email": "ada@example.com", "_password_hash": "h",
+                           "role": "student", "completed_courses": []} for _ in range(2)])
+    yield db
+    mdb_api.use_backend(MemoryBackend())
+
+
+def test_stored_duplicates_are_reported_and_deduped(duplicated_collections, capsys):
+    mdb_api.use_collections(duplicated_collections.courses, duplicated_collections.users)
+    output = capsys.readouterr().out
+    assert "WARNING: 1 course numbers are duplicated, unique index not created: ['CS100']" in output
+    assert "WARNING: 1 user emails are duplicated, unique index not created: ['ada@example.com']" in output
+    assert [(dup["value"], dup["count"]) for dup in mdb_api.find_duplicate_courses()] == [("CS100", 3)]
+    assert [(dup["value"], dup["count"]) for dup in mdb_api.find_duplicate_users()] == [("ada@example.com", 2)]
+
+    # The oldest course is kept and the unique course index can now be built.
+    assert mdb_api.dedupe_courses() == 2
+    assert mdb_api.find_course_by_number("CS100").name == "First"
+    assert mdb_api.find_duplicate_courses() == []
+    duplicated_collections.users.delete_one({"email": "ada@example.com"})
+    assert mdb_api.ensure_indexes()
+    assert not mdb_api.insert_course(Course("CS100", "Again"))
@@ -0,0 +1,48 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_json_array.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the incremental parser of top-level JSON arrays.
+# ============================================================================
+
+
+# Modules imports
+import io  # In-memory text files
+import json  # Reference parser
+import pytest  # Test framework
+from utils.data_loader import iter_json_array  # Parser under test
+
+
+# Text with strings containing brackets, commas, quotes and escapes, nested values and numbers.
+TRICKY = ('[ {"code": "CS]100", "title": "Arrays [1, 2], \\"quoted\\" and \\\\", "prerequisites": ["[", "]"]},\n'
+          '  [1, [2, [3]]], "}{", 12345678901234567890, -1.5e3, true, null, {"nested": {"a": "]"}},'
+          ' "Informática \\u00e9" ]')
+
+
+# Parse the text reading the given number of characters at a time.
+def parse(text: str, read_size: int = 65536) -> list:
+    return list(iter_json_array(io.StringIO(text), read_size))
+
+
+@pytest.mark.parametrize("text", ["[]", "  [ \n\t ]  ", "\n[\n]\n"])
+def test_empty_array(text):
+    assert parse(text) == []
+    assert parse(text, read_size=1) == []
+
+
+@pytest.mark.parametrize("read_size", [1, 2, 3, 7, 64, 65536])
+def test_elements_match_json_loads(read_size):
+    assert parse(TRICKY, read_size) == json.loads(TRICKY)
+
+
+def test_number_split_across_blocks():
+    # With 2 characters per block "123" could be read as 1 and then 23.
+    assert parse("[123,45]", read_size=2) == [123, 45]
+
+
+@pytest.mark.parametrize("text", ["", "{}", '"text"', "[1 2]", "[1,"])
+def test_invalid_documents(text):
+    with pytest.raises(ValueError):
+        parse(text, read_size=3)
@@ -0,0 +1,58 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_load_test.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the concurrent session load test: action mix parsing,
+#               percentiles and a short run with a fixed number of actions.
+# ============================================================================
+
+
+# Modules imports
+import pytest  # Test framework
+from benchmarks import load_test  # Load test under test
+from services import mdb_api  # Database API used by the sessions
+from utils.password_hashing import hash_password  # Fast password hash of the generated users
+
+
+def test_parse_mix():
+    assert load_test.parse_mix("login=1, lookup=2.5,list") == {"login": 1.0, "lookup": 2.5, "list": 1.0}
+    with pytest.raises(ValueError, match="Unknown action 'delete'"):
+        load_test.parse_mix("lookup=1,delete=1")
+    with pytest.raises(ValueError):
+        load_test.parse_mix("lookup=0,login=0")
+
+
+def test_percentile_uses_the_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+    assert load_test.percentile(values, 0.50) == 50.0
+    assert load_test.percentile(values, 0.95) == 95.0
+    assert load_test.percentile(values, 0.99) == 99.0
+    assert load_test.percentile(values, 0.0) == 1.0
+    assert load_test.percentile([0.5], 0.99) == 0.5
+    assert load_test.percentile([], 0.5) == 0.0
+
+
+def test_invalid_arguments_are_rejected():
+    with pytest.raises(SystemExit):
+        load_test.parse_arguments(["--sessions", "0"])
+    with pytest.raises(SystemExit):
+        load_test.parse_arguments(["--mix", "unknown=1"])
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_sessions_run_the_planned_actions(backend, monkeypatch):
+    monkeypatch.setattr(load_test, "hash_password", lambda password: hash_password(password, rounds=4))
+    arguments = load_test.parse_arguments(["--sessions", "4", "--actions", "25", "--duration", "60",
+                                           "--courses", "300", "--backend", backend])
+    report = load_test.run_load_test(arguments)
+    assert report["sessions"] == 4 and report["operations"] == 100
+    # Each session logs in first, and no action fails.
+    assert report["actions"]["login"]["count"] >= 4
+    assert sum(values["count"] for values in report["actions"].values()) == 100
+    assert all(values["errors"] == 0 for values in report["actions"].values())
+    for values in report["actions"].values():
+        assert values["p50_seconds"] <= values["p95_seconds"] <= values["p99_seconds"] <= values["max_seconds"]
+    # The test releases its storage when it ends.
+    assert mdb_api.find_course_by_number("CS00001") is None
@@ -0,0 +1,136 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_metrics.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the timing registry: histogram percentiles, timing of
+#               functions and generators, the disabled fast path and the
+#               Prometheus export.
+# ============================================================================
+
+
+# Modules imports
+import pytest  # Test framework
+from utils import metrics  # Registry under test
+
+
+# Empty registry with the collection enabled, the previous state is restored after the test.
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(metrics, "_enabled", True)
+    metrics.reset()
+    yield metrics
+    metrics.reset()
+
+
+# Clock of the timers moved forward by the tests.
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(metrics.time, "perf_counter", lambda: now[0])
+    return now
+
+
+def test_percentiles_are_interpolated_in_the_buckets():
+    metric = metrics.Metric("lookup")
+    assert metric.percentile(0.5) == 0.0
+    for _ in range(90):
+        metric.observe(3e-6)
+    for _ in range(10):
+        metric.observe(0.1)
+    # Within the 2 to 4 microseconds bucket, and never above the slowest call.
+    assert 2e-6 < metric.percentile(0.50) < 4e-6
+    assert 0.05 < metric.percentile(0.99) <= 0.1
+    assert metric.percentile(1.0) == 0.1
+    values = metric.to_dict()
+    assert values["calls"] == 100 and values["max_seconds"] == 0.1
+    assert values["mean_seconds"] == pytest.approx((90 * 3e-6 + 10 * 0.1) / 100)
+
+
+def test_timed_function_records_rows_and_errors(registry, clock):
+    @metrics.timed("load", rows=len)
+    def load(fail=False):
+        clock[0] += 0.5
+        if fail:
+            raise ValueError("bad file")
+        return [1, 2, 3]
+
+    assert load() == [1, 2, 3]
+    with pytest.raises(ValueError):
+        load(fail=True)
+    values = registry.snapshot()["load"]
+    assert (values["calls"], values["errors"], values["rows"]) == (2, 1, 3)
+    assert values["total_seconds"] == 1.0
+
+
+def test_timed_generator_measures_the_whole_iteration(registry, clock):
+    @metrics.timed(rows=len)
+    def chunks(count):
+        for _ in range(count):
+            clock[0] += 0.25
+            yield [1, 2]
+
+    assert list(chunks(4)) == [[1, 2]] * 4
+    values = registry.snapshot()["test_metrics.test_timed_generator_measures_the_whole_iteration.<locals>.chunks"]
+    assert (values["calls"], values["errors"], values["rows"]) == (1, 0, 8)
+    assert values["total_seconds"] == 1.0
+
+
+def test_generator_closed_early_is_not_an_error(registry, clock):
+    @metrics.timed("numbers")
+    def numbers():
+        yield from range(10)
+
+    generator = numbers()
+    assert next(generator) == 0
+    generator.close()
+    values = registry.snapshot()["numbers"]
+    assert (values["calls"], values["errors"], values["rows"]) == (1, 0, 1)
+
+
+def test_disabled_metrics_do_not_read_the_clock(monkeypatch):
+    monkeypatch.setattr(metrics, "_enabled", False)
+    metrics.reset()
+
+    def no_clock():
+        raise AssertionError("the clock was read")
+
+    monkeypatch.setattr(metrics.time, "perf_counter", no_clock)
+
+    @metrics.timed("double")
+    def double(value):
+        return value * 2
+
+    @metrics.timed("letters")
+    def letters():
+        yield from "ab"
+
+    assert double(2) == 4
+    assert list(letters()) == ["a", "b"]
+    with metrics.timer("block") as timing:
+        timing.rows = 5
+    assert metrics.snapshot() == {}
+
+
+def test_prometheus_export(registry, clock):
+    registry.observe("find", 3e-6, rows=2)
+    registry.observe("find", 0.5, error=True)
+    with registry.timer("block") as timing:
+        clock[0] += 1.0
+        timing.rows = 7
+    lines = registry.export_prometheus().splitlines()
+    assert lines[:2] == ["# HELP abcu_call_duration_seconds Duration of the calls.",
+                         "# TYPE abcu_call_duration_seconds histogram"]
+    # The buckets are cumulative and end with +Inf equal to the count.
+    buckets = [line for line in lines if line.startswith('abcu_call_duration_seconds_bucket{function="find"')]
+    assert len(buckets) == len(metrics.BUCKETS) + 1
+    counts = [int(line.rsplit(" ", 1)[1]) for line in buckets]
+    assert counts == sorted(counts) and counts[0] == 0 and counts[-1] == 2
+    assert 'abcu_call_duration_seconds_bucket{function="find",le="4e-06"} 1' in lines
+    assert buckets[-1] == 'abcu_call_duration_seconds_bucket{function="find",le="+Inf"} 2'
+    assert 'abcu_call_duration_seconds_sum{function="block"} 1' in lines
+    assert 'abcu_call_duration_seconds_count{function="find"} 2' in lines
+    assert 'abcu_call_errors_total{function="find"} 1' in lines
+    assert 'abcu_rows_total{function="block"} 7' in lines
+    assert "# TYPE abcu_rows_total counter" in lines
@@ -0,0 +1,69 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_pagination.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the keyset-paginated listings of the courses and of
+#               the users: resume keys, page sizes and field projections.
+# ============================================================================
+
+
+# Modules imports
+from models.course import Course  # Import the Course class
+from models.user import User  # Import the User class
+from services import mdb_api  # Database API under test
+
+
+# Courses inserted in reverse order, the listings must sort them by number.
+COURSES = [Course(f"CS{index:03d}", f"Course {index}", (f"CS{index - 1:03d}",) if index else ())
+           for index in reversed(range(25))]
+
+
+def test_iter_courses_sorted_resumes_after_a_key(backend):
+    mdb_api.insert_courses(COURSES)
+    numbers = [course.number for course in mdb_api.iter_courses_sorted(batch_size=4)]
+    assert numbers == [f"CS{index:03d}" for index in range(25)]
+    resumed = list(mdb_api.iter_courses_sorted(after="CS019", batch_size=2))
+    assert [course.number for course in resumed] == ["CS020", "CS021", "CS022", "CS023", "CS024"]
+    assert resumed[0] == Course("CS020", "Course 20", ("CS019",))
+    assert mdb_api.list_courses_sorted() == sorted(COURSES, key=lambda course: course.number)
+
+
+def test_iter_courses_sorted_with_fields_yields_dictionaries(backend):
+    mdb_api.insert_courses(COURSES)
+    first = next(mdb_api.iter_courses_sorted(fields=["name"]))
+    assert first == {"number": "CS000", "name": "Course 0"}
+
+
+def test_get_courses_page_walks_the_catalog(backend):
+    mdb_api.insert_courses(COURSES)
+    pages = []
+    page, after = mdb_api.get_courses_page(page_size=10)
+    pages.append(page)
+    while after is not None:
+        page, after = mdb_api.get_courses_page(page_size=10, after=after)
+        pages.append(page)
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [course.number for page in pages for course in page] == [f"CS{index:03d}" for index in range(25)]
+
+
+def test_full_last_page_returns_a_key_then_an_empty_page(backend):
+    mdb_api.insert_courses(COURSES[:20])  # CS005 to CS024
+    page, after = mdb_api.get_courses_page(page_size=10, after="CS014", fields=["name"])
+    assert after == "CS024" and page[0] == {"number": "CS015", "name": "Course 15"}
+    assert mdb_api.get_courses_page(page_size=10, after=after) == ([], None)
+
+
+def test_user_listings_by_email(backend):
+    mdb_api.insert_users([User("User", str(index), f"user{index:02d}@example.com", b"hash")
+                          for index in reversed(range(7))])
+    emails = [user["email"] for user in mdb_api.iter_users(after="user02@example.com", batch_size=2)]
+    assert emails == [f"user{index:02d}@example.com" for index in range(3, 7)]
+    page, after = mdb_api.get_users_page(page_size=3, fields=["role"])
+    assert page == [{"email": f"user{index:02d}@example.com", "role": "student"} for index in range(3)]
+    page, after = mdb_api.get_users_page(page_size=3, after=after)
+    assert [user["email"] for user in page] == [f"user{index:02d}@example.com" for index in range(3, 6)]
+    page, after = mdb_api.get_users_page(page_size=3, after=after)
+    assert [user["email"] for user in page] == ["user06@example.com"] and after is None
+    assert len(mdb_api.get_users_list()) == 7
@@ -0,0 +1,65 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_password_hashing.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the password checks, of the rehash of the outdated
+#               password hashes and of the logins with a malformed hash.
+# ============================================================================
+
+
+# Modules imports
+import asyncio  # Event loop running the asynchronous login
+import pytest  # Test framework
+from models.user import User  # Import the User class definition
+from services import async_api, mdb_api  # Login of a stored user
+from utils import password_hashing  # Hashing helpers under test
+
+
+# Use the minimum bcrypt work factor so that the tests are fast.
+@pytest.fixture(autouse=True)
+def fast_rounds(monkeypatch):
+    monkeypatch.setattr(password_hashing, "BCRYPT_ROUNDS", 4)
+
+
+def test_check_password():
+    user = User.create("Ada", "Lovelace", "ada@example.com", "secret")
+    assert user.check_password("secret")
+    assert not user.check_password("wrong")
+
+
+def test_hash_rounds():
+    assert password_hashing.hash_rounds(password_hashing.hash_password("secret", rounds=5)) == 5
+    assert password_hashing.hash_rounds(b"not a hash") is None
+    assert password_hashing.hash_rounds(b"$2b$xx$salt") is None
+
+
+def test_rehash_outdated_hash(monkeypatch):
+    user = User("Ada", "Lovelace", "ada@example.com", password_hashing.hash_password("secret", rounds=4))
+    monkeypatch.setattr(password_hashing, "BCRYPT_ROUNDS", 5)
+    assert user.check_password("secret")
+    assert user.rehash_if_needed("secret")
+    assert password_hashing.hash_rounds(user._password_hash) == 5
+    assert user.check_password("secret")
+    assert not user.rehash_if_needed("secret")
+
+
+def test_stronger_hash_is_not_downgraded():
+    stored = password_hashing.hash_password("secret", rounds=5)
+    user = User("Ada", "Lovelace", "ada@example.com", stored)
+    assert user.check_password("secret")
+    assert not user.rehash_if_needed("secret")
+    assert user._password_hash == stored
+
+
+def test_malformed_hash_never_matches():
+    assert not password_hashing.verify_password("secret", b"plain-text")
+    assert not password_hashing.needs_rehash(b"plain-text")
+
+
+def test_login_with_malformed_stored_hash(backend):
+    mdb_api.insert_user(User("Ada", "Lovelace", "ada@example.com", b"$2b$04$corrupt"))
+    user = mdb_api.find_user_by_email("ada@example.com")
+    assert not user.check_password("secret")
+    assert asyncio.run(async_api.login("ada@example.com", "secret")) is None
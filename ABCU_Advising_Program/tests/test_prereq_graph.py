@@ -0,0 +1,90 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_prereq_graph.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the prerequisite graph: topological order, closures,
+#               eligibility, unlocked courses and cycle detection.
+# ============================================================================
+
+
+# Modules imports
+import pytest  # Test framework
+from models.course import Course  # Import the Course class
+from models.prereq_graph import PrerequisiteGraph, CyclicCatalogError  # Graph under test
+
+
+# CS100 -> CS200 -> CS300 and CS100, MAT100 -> CS250 -> CS300; CS400 needs ENG100 that is not in the catalog.
+CATALOG = [
+    Course("CS300", "Algorithms", ("CS200", "CS250")),
+    Course("CS200", "Data Structures", ("CS100",)),
+    Course("CS250", "Discrete Math", ("CS100", "MAT100")),
+    Course("CS100", "Intro"),
+    Course("MAT100", "Calculus"),
+    Course("CS400", "Capstone", ("CS300", "ENG100")),
+]
+
+
+@pytest.fixture
+def graph():
+    return PrerequisiteGraph(CATALOG)
+
+
+def test_topological_order_places_prerequisites_first(graph):
+    order = graph.topological_order()
+    assert sorted(order) == sorted(course.number for course in CATALOG)
+    position = {number: index for index, number in enumerate(order)}
+    for course in CATALOG:
+        for prereq in course.prerequisites:
+            if prereq in graph:
+                assert position[prereq] < position[course.number]
+
+
+def test_depths(graph):
+    assert [graph.depth(number) for number in ("CS100", "MAT100", "CS200", "CS250", "CS300", "CS400")] == \
+           [0, 0, 1, 1, 2, 3]
+
+
+def test_prerequisite_closures(graph):
+    assert graph.prerequisites_of("CS300", transitive=False) == {"CS200", "CS250"}
+    assert graph.prerequisites_of("CS300") == {"CS200", "CS250", "CS100", "MAT100"}
+    assert graph.prerequisites_of("CS400") == {"CS300", "CS200", "CS250", "CS100", "MAT100"}
+    assert graph.prerequisites_of("CS100") == set()
+
+
+def test_unlocks(graph):
+    assert graph.unlocks("CS100") == {"CS200", "CS250"}
+    assert graph.unlocks("CS100", transitive=True) == {"CS200", "CS250", "CS300", "CS400"}
+    assert graph.unlocks("CS400", transitive=True) == set()
+
+
+def test_eligible_courses(graph):
+    assert graph.eligible_courses([]) == ["CS100", "MAT100"]
+    assert graph.eligible_courses(["CS100"]) == ["CS200", "MAT100"]
+    assert graph.eligible_courses(["CS100", "MAT100", "CS200"]) == ["CS250"]
+    assert graph.eligible_courses(["CS100", "MAT100", "CS200", "CS250"]) == ["CS300"]
+    # The prerequisites outside the catalog must be completed too.
+    done = ["CS100", "MAT100", "CS200", "CS250", "CS300"]
+    assert graph.eligible_courses(done) == []
+    assert graph.eligible_courses(done + ["ENG100"]) == ["CS400"]
+
+
+def test_repeated_courses_use_the_first_definition():
+    graph = PrerequisiteGraph([Course("CS100", "Intro"), Course("CS100", "Other", ("CS100",))])
+    assert len(graph) == 1
+    assert graph.prerequisites_of("CS100") == set()
+
+
+def test_cycle_is_rejected():
+    with pytest.raises(CyclicCatalogError) as error:
+        PrerequisiteGraph([Course("CS100", "Intro"), Course("CS200", "A", ("CS100", "CS300")),
+                           Course("CS300", "B", ("CS200",)), Course("CS400", "C", ("CS300",))])
+    assert error.value.cycle in (["CS200", "CS300", "CS200"], ["CS300", "CS200", "CS300"])
+    assert "Prerequisite cycle found" in str(error.value)
+
+
+def test_self_prerequisite_is_a_cycle():
+    with pytest.raises(CyclicCatalogError) as error:
+        PrerequisiteGraph([Course("CS100", "Intro", ("CS100",))])
+    assert error.value.cycle == ["CS100", "CS100"]
@@ -0,0 +1,68 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_semester_planner.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the term by term semester planner.
+# ============================================================================
+
+
+# Modules imports
+import pytest  # Test framework
+from models.course import Course  # Import the Course class
+from models.prereq_graph import PrerequisiteGraph  # Graph of the course prerequisites
+from services.semester_planner import plan_semesters  # Planner under test
+
+
+# Six independent introductory courses, all required by CS400, and a chain CS100 -> CS200 -> CS300 -> CS400.
+GRAPH = PrerequisiteGraph([
+    *(Course(f"GEN{index}", f"General {index}") for index in range(6)),
+    Course("CS100", "Intro"),
+    Course("CS200", "Data Structures", ("CS100",)),
+    Course("CS300", "Algorithms", ("CS200",)),
+    Course("CS400", "Capstone", ("CS300", *(f"GEN{index}" for index in range(6)))),
+    Course("CS500", "Thesis", ("CS400", "LAB100")),  # LAB100 is not in the catalog
+])
+
+
+# Check that every course of the plan comes after all its prerequisites.
+def assert_prerequisites_first(terms: list[list[str]], completed=()) -> None:
+    taken = set(completed)
+    for term in terms:
+        for number in term:
+            assert all(GRAPH.numbers[p] in taken for p in GRAPH.prereqs[GRAPH.index[number]]), number
+        taken.update(term)
+
+
+@pytest.mark.parametrize("max_per_term, terms", [(1, 10), (2, 6), (3, 4), (7, 4)])
+def test_term_limit(max_per_term, terms):
+    report = plan_semesters(GRAPH, [], ["CS400"], max_per_term)
+    assert len(report["terms"]) == terms
+    assert all(len(term) <= max_per_term for term in report["terms"])
+    assert sorted(number for term in report["terms"] for number in term) == sorted(
+        ["CS100", "CS200", "CS300", "CS400", *(f"GEN{index}" for index in range(6))])
+    assert_prerequisites_first(report["terms"])
+    assert report["minimum_terms"] <= terms
+
+
+def test_critical_path_first():
+    # With three courses per term the plan takes 4 terms only if the chain starts in the first term.
+    report = plan_semesters(GRAPH, [], ["CS400"], 3)
+    assert [term for term in report["terms"] if {"CS100", "CS200", "CS300"} & set(term)] == report["terms"][:3]
+    assert report["minimum_terms"] == 4
+
+
+def test_completed_unknown_and_blocked_targets():
+    report = plan_semesters(GRAPH, ["CS100", "CS200", "GEN0"], ["CS100", "XX999", "CS500", "CS300"], 3)
+    assert report["completed"] == ["CS100"]
+    assert report["unknown"] == ["XX999"]
+    assert report["blocked"] == {"CS500": ["LAB100"]}
+    assert report["terms"] == [["CS300"]]
+    report = plan_semesters(GRAPH, ["LAB100", "CS300", *(f"GEN{index}" for index in range(6))], ["CS500"], 3)
+    assert report["terms"] == [["CS400"], ["CS500"]]
+
+
+def test_invalid_term_limit():
+    with pytest.raises(ValueError):
+        plan_semesters(GRAPH, [], ["CS400"], 0)
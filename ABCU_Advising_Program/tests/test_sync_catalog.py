@@ -0,0 +1,65 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          test_sync_catalog.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Tests of the differential catalog synchronization.
+# ============================================================================
+
+
+# Modules imports
+from models.course import Course  # Import the Course class
+from services import mdb_api  # Database API under test
+
+
+CATALOG = [
+    Course("CS100", "Intro"),
+    Course("CS200", "Data Structures", ("CS100",)),
+    Course("CS300", "Algorithms", ("CS200",)),
+]
+
+
+def test_first_sync_adds_all_the_courses(backend):
+    report = mdb_api.sync_catalog(CATALOG)
+    assert report["added"] == ["CS100", "CS200", "CS300"]
+    assert report["updated"] == [] and report["removed"] == [] and report["unchanged"] == 0
+    assert report["written"] == 3
+    assert mdb_api.list_courses_sorted() == CATALOG
+
+
+def test_sync_adds_updates_and_removes(backend):
+    mdb_api.sync_catalog(CATALOG)
+    mdb_api.find_course_by_number("CS300")  # Cached, the sync must drop it from the cache
+    new_catalog = [CATALOG[0], Course("CS200", "Data Structures", ("CS100",)),
+                   Course("CS300", "Algorithms", ("CS200", "CS250")), Course("CS250", "Discrete Structures"),
+                   Course("CS100", "Duplicate")]
+    report = mdb_api.sync_catalog(new_catalog)
+    assert report["added"] == ["CS250"]
+    assert report["updated"] == ["CS300"]
+    assert report["removed"] == [] and report["unchanged"] == 2
+    assert report["duplicates"] == ["CS100"]
+    assert mdb_api.find_course_by_number("CS300").prerequisites == ("CS200", "CS250")
+    assert mdb_api.find_course_by_number("CS100").name == "Intro"  # The first definition is used
+
+    report = mdb_api.sync_catalog(CATALOG[:2])
+    assert report["removed"] == ["CS250", "CS300"]
+    assert [course.number for course in mdb_api.list_courses_sorted()] == ["CS100", "CS200"]
+    assert mdb_api.find_course_by_number("CS300") is None
+
+
+def test_unchanged_catalog_writes_nothing(backend):
+    mdb_api.sync_catalog(CATALOG)
+    report = mdb_api.sync_catalog(list(reversed(CATALOG)))
+    assert report["unchanged"] == 3 and report["written"] == 0
+    assert report["added"] == report["updated"] == report["removed"] == []
+
+
+def test_dry_run_reports_without_writing(backend):
+    mdb_api.sync_catalog(CATALOG)
+    report = mdb_api.sync_catalog([Course("CS100", "Introduction"), Course("CS400", "Compilers")], dry_run=True)
+    assert report["dry_run"] and report["written"] == 0
+    assert report["added"] == ["CS400"]
+    assert report["updated"] == ["CS100"]
+    assert report["removed"] == ["CS200", "CS300"]
+    assert mdb_api.list_courses_sorted() == CATALOG
@@ -0,0 +1,182 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          catalog_snapshot.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Binary catalog snapshot. The file is opened with mmap and
+#               queried in place, without parsing or loading the catalog.
+# ============================================================================
+
+
+# Modules imports
+import mmap  # Memory mapped file access
+import os  # File management functions
+import struct  # Binary header packing
+import sys  # Used to check the byte order of the machine
+from array import array  # Compact arrays of machine integers
+from bisect import bisect_left  # Binary search on the sorted index
+from models.course import Course  # Import the Course class
+from models.course_catalog import CourseCatalog  # Column-based catalog written to the snapshot
+
+
+# File layout, all the integers are little endian:
+#   header        magic, version, courses, numbers, strings, prerequisites and the position of each section
+#   string table  string_count + 1 offsets (u64) followed by the UTF-8 data of all the strings: first the
+#                 course numbers (one per course, then the prerequisites not defined as courses) and then
+#                 the course names
+#   records       one fixed-width record (u32 number id, u32 name id, u32 prerequisites start, u32 count)
+#                 for each course, the course number of the record r is the string r
+#   prerequisites u32 ids of the prerequisites of all the courses, an id lower than the number of courses
+#                 is the record of that course
+#   index         u32 records sorted by course number, used to find a course with a binary search
+MAGIC = b"ABCUCAT\0"
+VERSION = 1
+HEADER = struct.Struct("<8sIIIIIxxxxQQQQQ")
+RECORD = struct.Struct("<IIII")
+
+
+# Error raised when a file is not a catalog snapshot or was written by an unsupported version.
+class SnapshotError(ValueError):
+    pass
+
+
+# Write the courses to a snapshot file. Only the first definition of each course number is written.
+# The file is written next to the destination and renamed at the end, so a reader never sees a partial file.
+# Returns the written catalog.
+def write_snapshot(courses, snapshot_path: str) -> CourseCatalog:
+    catalog = courses if isinstance(courses, CourseCatalog) else CourseCatalog(courses)
+    course_count = len(catalog)
+    number_count = len(catalog.numbers)
+
+    # Single string table: the course numbers followed by the course names.
+    string_data = bytes(catalog.numbers.data) + bytes(catalog.names.data)
+    offsets = array("Q", catalog.numbers.offsets)
+    offsets.extend(len(catalog.numbers.data) + offset for offset in catalog.names.offsets[1:])
+
+    records = bytearray(RECORD.size * course_count)
+    for row in range(course_count):
+        start = catalog.prereq_start[row]
+        RECORD.pack_into(records, row * RECORD.size, row, number_count + row, start,
+                         catalog.prereq_start[row + 1] - start)
+    prereq_ids = array("I", catalog.prereq_ids)
+    index = array("I", catalog.sorted_rows)
+    if sys.byteorder != "little":
+        for section in (offsets, prereq_ids, index):
+            section.byteswap()
+
+    # Every section starts at a multiple of 8 bytes so the arrays can be read in place.
+    sections = [offsets.tobytes(), string_data, bytes(records), prereq_ids.tobytes(), index.tobytes()]
+    positions = []
+    position = HEADER.size
+    for section in sections:
+        positions.append(position)
+        position += len(section) + (-len(section) % 8)
+
+    temporary_path = snapshot_path + ".tmp"
+    with open(temporary_path, "wb") as snapshot_file:
+        snapshot_file.write(HEADER.pack(MAGIC, VERSION, course_count, number_count, number_count + course_count,
+                                        len(prereq_ids), *positions))
+        for section in sections:
+            snapshot_file.write(section)
+            snapshot_file.write(b"\0" * (-len(section) % 8))
+    os.replace(temporary_path, snapshot_path)
+    return catalog
+
+
+# Catalog snapshot opened with mmap. Only the header is read when the file is opened, the courses are decoded
+# when they are requested, so opening a catalog of any size is immediate. Use it with a with statement or
+# call close() when done.
+class CatalogSnapshot:
+
+    def __init__(self, snapshot_path: str):
+        self.path = snapshot_path
+        with open(snapshot_path, "rb") as snapshot_file:
+            size = os.fstat(snapshot_file.fileno()).st_size
+            if size < HEADER.size:
+                raise SnapshotError(f"'{snapshot_path}' is not a catalog snapshot.")
+            self._map = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.course_count, self.number_count, string_count, prereq_count,
+         offsets_pos, data_pos, records_pos, prereqs_pos, index_pos) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise SnapshotError(f"'{snapshot_path}' is not a catalog snapshot.")
+        if version != VERSION:
+            self._map.close()
+            raise SnapshotError(f"Unsupported snapshot version {version} in '{snapshot_path}'.")
+        self._view = memoryview(self._map)
+        self._offsets = self._integers(offsets_pos, string_count + 1, "Q")
+        self._data = self._view[data_pos:records_pos]
+        self._records = self._integers(records_pos, self.course_count * 4, "I")
+        self._prereqs = self._integers(prereqs_pos, prereq_count, "I")
+        self._index = self._integers(index_pos, self.course_count, "I")
+
+    # Return a section of integers read in place, or copied and converted on a big endian machine.
+    def _integers(self, position: int, count: int, typecode: str):
+        size = array(typecode).itemsize
+        section = self._view[position:position + count * size]
+        if sys.byteorder == "little":
+            return section.cast(typecode)
+        values = array(typecode, section.tobytes())
+        values.byteswap()
+        return values
+
+    # Return the string with the given id of the string table.
+    def string(self, string_id: int) -> str:
+        return str(self._data[self._offsets[string_id]:self._offsets[string_id + 1]], "utf-8")
+
+    def close(self) -> None:
+        # The views on the map must be released before closing it.
+        for view in (self._offsets, self._data, self._records, self._prereqs, self._index):
+            if isinstance(view, memoryview):
+                view.release()
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.course_count
+
+    def __contains__(self, course_number: str) -> bool:
+        return self.row_of(course_number) >= 0
+
+    # Iterate the courses in the order they were written.
+    def __iter__(self):
+        for row in range(self.course_count):
+            yield self.course_at(row)
+
+    # Iterate the courses sorted by number.
+    def iter_sorted(self):
+        for row in self._index:
+            yield self.course_at(row)
+
+    # Return the record of the course with the given number or -1 when it is not in the catalog.
+    def row_of(self, course_number: str) -> int:
+        position = bisect_left(self._index, course_number, key=self.string)
+        if position < self.course_count and self.string(self._index[position]) == course_number:
+            return self._index[position]
+        return -1
+
+    # Return the prerequisite ids of the course in the given record.
+    def prerequisite_ids(self, row: int):
+        start, count = self._records[row * 4 + 2], self._records[row * 4 + 3]
+        return self._prereqs[start:start + count]
+
+    # Return the course stored in the given record.
+    def course_at(self, row: int) -> Course:
+        return Course(self.string(self._records[row * 4]), self.string(self._records[row * 4 + 1]),
+                      tuple(self.string(p) for p in self.prerequisite_ids(row)))
+
+    # Return the course with the given number or None when it is not in the catalog.
+    def get(self, course_number: str) -> Course | None:
+        row = self.row_of(course_number)
+        return self.course_at(row) if row >= 0 else None
+
+    # Return the course numbers used as prerequisites that are not defined as courses.
+    def unresolved(self) -> list[str]:
+        return sorted(self.string(i) for i in range(self.course_count, self.number_count))
@@ -11,12 +11,23 @@
 
 # Modules imports
 import csv  # Import the helper module to work with CSV files
+from array import array  # Compact integer arrays of the prerequisite tracker
+import io  # In-memory text buffers for the CSV chunks
 import json  # Import the helper module to work with JSON files
 import os  # File management functions for code portability
+from collections import deque  # Queue of the pending conversion tasks
+from concurrent.futures import ProcessPoolExecutor  # Pool of processes converting the CSV chunks
 from models.course import Course  # Import the Course class
+from models.course_catalog import CourseCatalog  # Compact catalog for bulk in-memory use
+from utils.json_writer import JsonArrayWriter, format_element, element_separator  # Streaming JSON output
+from utils.catalog_snapshot import CatalogSnapshot, SnapshotError, write_snapshot  # Binary catalog snapshots
+from models.prereq_graph import PrerequisiteGraph, CyclicCatalogError  # Used to reject cyclic catalogs
+from utils.metrics import timed  # Timing registry of the loaders (collected when ABCU_METRICS=1)
 
 
 # Function to load the courses into the list of courses from the supplied CSV file.
+# The returned list can be given directly to services.mdb_api.insert_courses for a batched insert.
+@timed(rows=len)
 def load_courses_from_csv_file(csv_path: str) -> list[Course]:
     courses: list[Course] = []  # List that will contain the loaded courses
 
@@ -59,70 +70,344 @@ def load_courses_from_csv_file(csv_path: str) -> list[Course]:
                 print("ERROR: Missing prerequisite:", prereq)
                 return []
 
+    # Ensure that the prerequisites do not contain a cycle, otherwise the courses of the cycle could never be taken.
+    try:
+        PrerequisiteGraph(courses)
+    except CyclicCatalogError as e:
+        print(f"ERROR: {e}")
+        return []
+
     return courses  # Return the loaded course list
 
 
-# Function that takes a CSV courses file and convert it to JSON format.
-def csv_to_json_courses(csv_path: str, json_path: str) -> None:
-    courses = []  # Contains the list of the courses
-    course_numbers = set()  # A set to keep all the course numbers.
-    data_rows = []  # Intermediary storage for data validation
+# Keeps the course numbers read so far, their prerequisites and the prerequisites not seen yet while streaming
+# a catalog, so the prerequisites can be validated without keeping the courses in memory.
+# Each course number is mapped to an integer id and the prerequisites are stored as ids in a single array,
+# so the memory used is a few bytes per course and prerequisite besides the course numbers.
+class PrerequisiteTracker:
 
-    if not os.path.exists(csv_path):
-        print(f"File not found!: {csv_path}")
-        return
+    def __init__(self):
+        self.ids: dict[str, int] = {}  # Course number (of a course or of a prerequisite) -> id
+        self.starts = array('i')  # id -> position of the course in edges, -1 while the course is not read
+        self.edges = array('i')  # For each course read: the number of prerequisites followed by their ids
+        self.safe = bytearray()  # id -> 1 when the course and all its prerequisites are read and not in a cycle
+        self.pending: dict[str, list[str]] = {}  # Unknown prerequisite -> course numbers that need it
+        self._new = array('i')  # Courses read since the last find_cycle call
+
+    # Return the id of the course number, adding it the first time.
+    def _id(self, number: str) -> int:
+        i = self.ids.get(number)
+        if i is None:
+            i = self.ids[number] = len(self.starts)
+            self.starts.append(-1)
+            self.safe.append(0)
+        return i
+
+    # Return the prerequisite ids of a course that has been read.
+    def _prereqs(self, i: int) -> array:
+        start = self.starts[i] + 1
+        return self.edges[start:start + self.edges[start - 1]]
+
+    # Register a course: it resolves the pending references to it and adds its unknown prerequisites.
+    def add(self, course: Course) -> None:
+        i = self._id(course.number)
+        if self.starts[i] < 0:  # Only the first definition of a course is used
+            prereq_ids = [self._id(prereq) for prereq in course.prerequisites]
+            self.starts[i] = len(self.edges)
+            self.edges.append(len(prereq_ids))
+            self.edges.extend(prereq_ids)
+            if all(self.safe[prereq_id] for prereq_id in prereq_ids):
+                self.safe[i] = 1  # The usual case of prerequisites listed first, no cycle can go through it
+            else:
+                self._new.append(i)
+        self.pending.pop(course.number, None)
+        for prereq in course.prerequisites:
+            prereq_id = self.ids.get(prereq)  # None when only named by a repeated course
+            if prereq_id is None or self.starts[prereq_id] < 0:
+                self.pending.setdefault(prereq, []).append(course.number)
+
+    # Return the prerequisites that were never defined as courses with the courses that reference them.
+    def unresolved(self) -> dict[str, list[str]]:
+        return self.pending
+
+    # Return a prerequisite cycle closed by the courses read since the last call (the first course repeated at
+    # the end), or None. A new cycle goes through one of the new courses, so it is searched with a depth first
+    # visit from them. The visit skips the safe courses, so a catalog listing the prerequisites before the courses
+    # (or after them) is checked in time proportional to the courses read.
+    def find_cycle(self) -> list[str] | None:
+        new, self._new = self._new, array('i')
+        state: dict[int, bool] = {}  # Visited course -> True while it is on the current path
+        for root in new:
+            if self.safe[root] or root in state:
+                continue
+            state[root] = True
+            path = [root]
+            pending = [iter(self._prereqs(root))]  # Prerequisites still to visit for each course of the path
+            while path:
+                for prereq in pending[-1]:
+                    if self.starts[prereq] < 0 or self.safe[prereq]:
+                        continue
+                    if state.get(prereq):
+                        # The path follows the prerequisites, reverse it to show the course order.
+                        cycle = path[path.index(prereq):] + [prereq]
+                        numbers = {i: number for number, i in self.ids.items() if i in state}
+                        return [numbers[i] for i in reversed(cycle)]
+                    if prereq not in state:
+                        state[prereq] = True
+                        path.append(prereq)
+                        pending.append(iter(self._prereqs(prereq)))
+                        break
+                else:
+                    node = path.pop()
+                    pending.pop()
+                    state[node] = False
+                    # A course whose prerequisites are all read and safe can never be part of a cycle.
+                    if all(self.starts[prereq] >= 0 and self.safe[prereq] for prereq in self._prereqs(node)):
+                        self.safe[node] = 1
+        return None
+
+
+# Check the courses read by the tracker since the last chunk for a prerequisite cycle before they are inserted.
+# The cycle found is reported to the user and stored in the loading report. Returns True if one was found.
+def _stop_at_cycle(tracker: PrerequisiteTracker, report: dict) -> bool:
+    report["cycle"] = tracker.find_cycle()
+    if report["cycle"] is None:
+        return False
+    print(f"ERROR: {CyclicCatalogError(report['cycle'])}")
+    if report["courses"]:
+        print(f"The {report['courses']} courses read before the cycle have been loaded.")
+    return True
+
+
+# Generator that reads the CSV file and yields the valid courses in lists of at most chunk_size courses.
+# Only the current chunk is kept in memory, the prerequisites are checked by the tracker when given.
+@timed(rows=len)
+def iter_csv_course_chunks(csv_path: str, chunk_size: int = 1000, tracker: PrerequisiteTracker | None = None,
+                           skipped: list | None = None):
+    chunk: list[Course] = []
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        for index, row in enumerate(csv.reader(csvfile), start=1):
+            # A row must have at minimum the course number and name, the invalid rows are skipped.
+            if len(row) < 2 or not row[0].strip() or not row[1].strip():
+                print(f"Malformed row found, skipping at {index}: {row}")
+                if skipped is not None:
+                    skipped.append(index)
+                continue
+            course = Course(
+                number=row[0].strip(),
+                name=row[1].strip(),
+                prerequisites=[field.strip() for field in row[2:] if field.strip()]
+            )
+            if tracker is not None:
+                tracker.add(course)
+            chunk.append(course)
+            # When the chunk is full give it to the caller and start a new one.
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:  # Give back the last partially filled chunk.
+        yield chunk
+
+
+# Load the courses from the CSV file streaming them to insert_function (for example services.mdb_api.insert_courses)
+# in chunks of chunk_size courses. The memory used depends on the number of course numbers and prerequisites and
+# not on the file size. Each chunk is checked for prerequisite cycles before it is inserted: the chunk that closes
+# a cycle and the rest of the file are not inserted, the chunks before it (which contain no cycle) stay loaded.
+# The prerequisites that are never defined are reported at the end.
+# Returns a report with the loading counters, the insert_function results, the unresolved prerequisites
+# and the prerequisite cycle that stopped the loading (None if the whole file was loaded).
+@timed(rows=lambda report: report["courses"])
+def stream_courses_from_csv_file(csv_path: str, insert_function, chunk_size: int = 1000) -> dict:
+    tracker = PrerequisiteTracker()
+    skipped: list[int] = []
+    report = {"courses": 0, "chunks": 0, "skipped": skipped, "results": [], "unresolved": {}, "cycle": None}
+    try:
+        for chunk in iter_csv_course_chunks(csv_path, chunk_size, tracker, skipped):
+            if _stop_at_cycle(tracker, report):
+                return report
+            report["courses"] += len(chunk)
+            report["chunks"] += 1
+            report["results"].append(insert_function(chunk))
+    except FileNotFoundError:
+        # Manage the file reading error gracefully by giving a message to the user.
+        print(f"ERROR: Could not open file '{csv_path}'!!")
+        return report
+
+    report["unresolved"] = tracker.unresolved()
+    for prereq, course_numbers in report["unresolved"].items():
+        print(f"ERROR: Missing prerequisite: {prereq} (required by {', '.join(course_numbers)})")
+    return report
+
+
+# Default size in bytes of the CSV chunks converted by csv_to_json_courses.
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Course numbers of the whole catalog, set in each conversion worker process by _set_known_numbers.
+_known_numbers: set[str] | None = None
+
+
+# Split a file in byte ranges of about chunk_bytes bytes. Each range ends at the end of a line,
+# so every range contains whole CSV rows (fields with new lines inside quotes are not supported).
+def _csv_byte_ranges(csv_path: str, chunk_bytes: int) -> list[tuple[int, int]]:
+    size = os.path.getsize(csv_path)
+    ranges = []
+    with open(csv_path, mode='rb') as csv_file:
+        start = 0
+        while start < size:
+            csv_file.seek(min(start + chunk_bytes, size))
+            csv_file.readline()  # Move to the start of the next line
+            end = min(csv_file.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+# Read the CSV rows of a byte range of the file.
+def _read_csv_range(csv_path: str, start: int, end: int) -> list[list[str]]:
+    with open(csv_path, mode='rb') as csv_file:
+        csv_file.seek(start)
+        text = csv_file.read(end - start).decode('utf-8')
+    return list(csv.reader(io.StringIO(text)))
+
+
+# Return the course number of a valid CSV row, None for a malformed row.
+def _valid_row_number(row: list[str]) -> str | None:
+    if len(row) < 2:
+        return None
+    course_number = row[0].strip()
+    return course_number if course_number and row[1].strip() else None
+
+
+# First pass of the conversion, run on a chunk: return the course numbers of the valid rows and the number of rows.
+def _scan_csv_chunk(csv_path: str, start: int, end: int) -> tuple[list[str], int]:
+    rows = _read_csv_range(csv_path, start, end)
+    return [number for number in map(_valid_row_number, rows) if number is not None], len(rows)
 
-    # Reading and parsing the CSV file with sanity checks
-    try:  # Use try/except block to safely work with files
-        with open(csv_path, mode='r', encoding='utf-8') as csv_file:
-            reader = csv.reader(csv_file)
-            # Iterate through rows to extract the data
-            for index, row in enumerate(reader, start=1):
-                if len(row) < 2:
-                    print(f"Malformed row found, skipping at {index}: {row}")
-                    continue
-                # Extract and save the course number, description and prerequisites
-                course_number = row[0].strip()
-                course_description = row[1].strip()
-                prerequisites = [pr.strip() for pr in row[2:] if pr.strip()]
-                # Check that the CSV row has data inside
-                if not course_number or not course_description:
-                    print(f"Course number or description missing at {index}: {row}")
-                    continue
-                # Save the course in the list of course numbers.
-                course_numbers.add(course_number)
-                data_rows.append((course_number, course_description, prerequisites))
-    # Manage the exception of failing to open and reading the file.
-    except Exception as e:
-        print(f"CSV file read fail: {e}")
-        return
 
-    # Check the named prerequisites are also present as courses in the list and store the courses list.
-    for course_number, course_description, prerequisites in data_rows:
-        # Check if single course prerequisite is a valid course.
+# Store the course numbers of the catalog in a conversion worker process, they are sent once per process.
+def _set_known_numbers(course_numbers: set[str]) -> None:
+    global _known_numbers
+    _known_numbers = course_numbers
+
+
+# Second pass of the conversion, run on a chunk: validate the rows and format the courses as JSON array elements.
+# first_row is the number of the first row of the chunk inside the file, used in the messages.
+# Returns the formatted elements joined together, the messages of the malformed rows, the messages of the
+# missing prerequisites and the number of courses.
+def _convert_csv_chunk(csv_path: str, start: int, end: int, first_row: int, indent: int | None,
+                       course_numbers: set[str] | None = None) -> tuple[str, list[str], list[str], int]:
+    course_numbers = _known_numbers if course_numbers is None else course_numbers
+    elements = []
+    messages = []
+    prereq_messages = []
+    for index, row in enumerate(_read_csv_range(csv_path, start, end), start=first_row):
+        if len(row) < 2:
+            messages.append(f"Malformed row found, skipping at {index}: {row}")
+            continue
+        # Extract the course number, description and prerequisites
+        course_number = row[0].strip()
+        course_description = row[1].strip()
+        prerequisites = [pr.strip() for pr in row[2:] if pr.strip()]
+        # Check that the CSV row has data inside
+        if not course_number or not course_description:
+            messages.append(f"Course number or description missing at {index}: {row}")
+            continue
+        # Check the named prerequisites are also present as courses in the catalog.
         invalid_prerq = [prerq for prerq in prerequisites if prerq not in course_numbers]
         if invalid_prerq:
-            print(f"The course number '{course_number}' has non existent prerequisites: {invalid_prerq}")
-        # Save the well-formed course inside the list of courses
-        course = {  # JSON format scheme
+            prereq_messages.append(f"The course number '{course_number}' has non existent prerequisites: "
+                                   f"{invalid_prerq}")
+        elements.append(format_element({  # JSON format scheme
             "code": course_number,
             "title": course_description,
             "prerequisites": prerequisites
-        }
-        courses.append(course)
+        }, indent))
+    return element_separator(indent).join(elements), messages, prereq_messages, len(elements)
 
-    # Save the courses data structure in a JSON formatted file
-    try:  # Use try/except block to safely work with files
-        with open(json_path, mode='w', encoding='utf-8') as json_file:
-            json.dump(courses, json_file, indent=4)
+
+# Run function on the pool for each task and yield the results in the task order.
+# At most window tasks are pending at the same time, so the finished chunks waiting to be written stay few.
+def _ordered_results(pool, function, tasks, window: int):
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.submit(function, *task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+# Convert the CSV courses file to a JSON courses file.
+# The CSV is read in chunks of about chunk_bytes bytes in two passes: the first collects the course numbers,
+# the second validates the rows (also checking that the prerequisites are courses) and formats them. The JSON
+# array is written to the file one chunk at a time, so the memory used depends on the number of courses and not
+# on the file size. The chunks are processed in parallel by a pool of at most workers processes (0 or None means
+# one per core), never more than the chunks: a file smaller than chunk_bytes is converted without starting a pool.
+# With compact True the JSON is written without spaces and new lines.
+@timed()
+def csv_to_json_courses(csv_path: str, json_path: str, compact: bool = False, workers: int | None = None,
+                        chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> None:
+    if not os.path.exists(csv_path):
+        print(f"File not found!: {csv_path}")
+        return
+
+    indent = None if compact else 4
+    pool = None
+    try:
+        # First pass: the course numbers of the whole catalog and the first row number of each chunk.
+        ranges = _csv_byte_ranges(csv_path, chunk_bytes)
+        workers = min(workers or os.cpu_count() or 1, len(ranges))
+        if workers > 1:
+            pool = ProcessPoolExecutor(max_workers=workers)
+        if pool is None:
+            scans = [_scan_csv_chunk(csv_path, start, end) for start, end in ranges]
+        else:
+            scans = list(pool.map(_scan_csv_chunk, [csv_path] * len(ranges), *zip(*ranges)))
+        course_numbers: set[str] = set()
+        tasks = []
+        first_row = 1
+        for (start, end), (numbers, row_count) in zip(ranges, scans):
+            course_numbers.update(numbers)
+            tasks.append((csv_path, start, end, first_row, indent))
+            first_row += row_count
+        del scans
+
+        # Second pass: the chunks are converted and written in the file order.
+        if pool is None:
+            results = (_convert_csv_chunk(*task, course_numbers) for task in tasks)
+        else:
+            # The workers of the first pass are replaced by workers that receive the course numbers once.
+            pool.shutdown()
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_set_known_numbers,
+                                       initargs=(course_numbers,))
+            results = _ordered_results(pool, _convert_csv_chunk, tasks, 2 * workers)
+        prereq_messages = []  # Printed after the malformed rows messages
+        with open(json_path, mode='w', encoding='utf-8') as json_file, JsonArrayWriter(json_file, indent) as writer:
+            for fragment, messages, chunk_prereq_messages, count in results:
+                for message in messages:
+                    print(message)
+                prereq_messages.extend(chunk_prereq_messages)
+                writer.write_formatted(fragment, count)
+        for message in prereq_messages:
+            print(message)
         print(f"JSON file data written to '{json_path}'")
 
+    # Manage the exception of failing to read or write the files.
     except Exception as e:
-        print(f"An error occurred while writing the JSON file: {e}")
+        print(f"An error occurred while converting the CSV file: {e}")
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
 
 # Loads the course data from a JSON file and insert it with the provided functions as a parameter.
-def load_courses_from_json_file(json_path: str, insert_function) -> None:
+# With batch_size equal to zero insert_function receives one course at a time, otherwise it receives
+# lists of up to batch_size courses (for example services.mdb_api.insert_courses).
+# The values returned by each insert_function call are collected and returned.
+@timed()
+def load_courses_from_json_file(json_path: str, insert_function, batch_size: int = 0) -> list:
+    results = []  # Results of the insert_function calls
+    batch = []  # Courses waiting to be inserted when working in batch mode
     # Reading and parsing the CSV file with sanity checks
     try:  # Use try/except block to safely work with files
         with open(json_path, mode='r', encoding='utf-8') as json_file:
@@ -131,6 +416,10 @@ def load_courses_from_json_file(json_path: str, insert_function) -> None:
         # Create a list of all the courses codes available.
         available_courses = {course.get("code") for course in courses if course.get("code")}
 
+        # Reject the catalog if the prerequisites contain a cycle, before inserting any course.
+        PrerequisiteGraph([Course(number=course.get("code"), prerequisites=course.get("prerequisites", []))
+                           for course in courses if course.get("code")])
+
         # For each course extract the data and store in the passed binary search tree object.
         for course in courses:
             course_code = course.get("code")
@@ -153,8 +442,331 @@ def load_courses_from_json_file(json_path: str, insert_function) -> None:
                 prerequisites=course_prereq
             )
             # Insert the course using the function provided as parameter
-            insert_function(course)
+            if batch_size > 0:
+                batch.append(course)
+                if len(batch) == batch_size:
+                    results.append(insert_function(batch))
+                    batch = []
+            else:
+                results.append(insert_function(course))
+
+        # Insert the last partially filled batch.
+        if batch:
+            results.append(insert_function(batch))
 
+    except CyclicCatalogError as e:
+        print(f"ERROR: {e}")
     except Exception as e:
         print(f"An error occurred while reading the JSON file: {e}")
 
+    return results
+
+
+# Generator that parses a JSON file containing a top-level array and yields its elements one at a time.
+# The file is read in blocks of read_size characters, so only the current element and a block are in memory.
+def iter_json_array(json_file, read_size: int = 65536):
+    decoder = json.JSONDecoder()
+    buffer = ""  # Text read from the file and not yet parsed
+    pos = 0  # Parsing position inside the buffer
+    eof = False
+
+    # Read the next block of the file dropping the already parsed text. Returns False at the end of the file.
+    def read_more() -> bool:
+        nonlocal buffer, pos, eof
+        data = json_file.read(read_size)
+        if not data:
+            eof = True
+            return False
+        buffer = buffer[pos:] + data
+        pos = 0
+        return True
+
+    # Move after the white spaces and return the next character, an empty string at the end of the file.
+    def next_char() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read_more():
+                return ""
+
+    if next_char() != "[":
+        raise ValueError("The JSON file must contain an array.")
+    pos += 1
+    if next_char() == "]":
+        return
+
+    while True:
+        next_char()
+        # Decode the next element, reading more of the file while the element is incomplete.
+        while True:
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+                # The element is complete only when it is followed by a comma or the end of the array,
+                # otherwise a value like a number may continue in the next block.
+                after = end
+                while after < len(buffer) and buffer[after] in " \t\r\n":
+                    after += 1
+                if (after == len(buffer) or buffer[after] not in ",]") and not eof and read_more():
+                    continue
+                break
+            except json.JSONDecodeError:
+                if eof or not read_more():
+                    raise
+        pos = end
+        yield element
+
+        # After an element there must be a comma or the end of the array.
+        char = next_char()
+        if char == ",":
+            pos += 1
+        elif char == "]":
+            return
+        else:
+            raise ValueError(f"Unexpected character '{char}' inside the JSON array.")
+
+
+# Generator that reads the JSON file one course at a time and yields the valid courses in lists
+# of at most chunk_size courses. The prerequisites are checked by the tracker when given.
+@timed(rows=len)
+def iter_json_course_chunks(json_path: str, chunk_size: int = 1000, tracker: PrerequisiteTracker | None = None,
+                            skipped: list | None = None):
+    chunk: list[Course] = []
+    with open(json_path, mode='r', encoding='utf-8') as json_file:
+        for index, entry in enumerate(iter_json_array(json_file), start=1):
+            # Course entry sanity check: code and title are required and the prerequisites must be a list of codes.
+            course_code = entry.get("code") if isinstance(entry, dict) else None
+            course_description = entry.get("title") if isinstance(entry, dict) else None
+            course_prereq = entry.get("prerequisites", []) if isinstance(entry, dict) else None
+            if (not isinstance(course_code, str) or not course_code or not isinstance(course_description, str)
+                    or not course_description or not isinstance(course_prereq, list)
+                    or not all(isinstance(prereq, str) for prereq in course_prereq)):
+                print(f"Malformed course found, skipping at {index}: {entry}")
+                if skipped is not None:
+                    skipped.append(index)
+                continue
+            course = Course(number=course_code, name=course_description, prerequisites=course_prereq)
+            if tracker is not None:
+                tracker.add(course)
+            chunk.append(course)
+            # When the chunk is full give it to the caller and start a new one.
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:  # Give back the last partially filled chunk.
+        yield chunk
+
+
+# Load the courses from the JSON file streaming them to insert_function (for example services.mdb_api.insert_courses)
+# in chunks of chunk_size courses. The file is parsed incrementally, so the memory used does not depend on the
+# file size and the first chunk is inserted as soon as it is read. The prerequisite cycles are checked like
+# stream_courses_from_csv_file does, an error in the JSON text stops the loading at the chunk containing it.
+# The undefined prerequisites are reported at the end.
+# Returns a report like stream_courses_from_csv_file.
+@timed(rows=lambda report: report["courses"])
+def stream_courses_from_json_file(json_path: str, insert_function, chunk_size: int = 1000) -> dict:
+    tracker = PrerequisiteTracker()
+    skipped: list[int] = []
+    report = {"courses": 0, "chunks": 0, "skipped": skipped, "results": [], "unresolved": {}, "cycle": None}
+    try:
+        for chunk in iter_json_course_chunks(json_path, chunk_size, tracker, skipped):
+            if _stop_at_cycle(tracker, report):
+                return report
+            report["courses"] += len(chunk)
+            report["chunks"] += 1
+            report["results"].append(insert_function(chunk))
+    except FileNotFoundError:
+        print(f"ERROR: Could not open file '{json_path}'!!")
+        return report
+    except ValueError as e:  # Also covers json.JSONDecodeError
+        print(f"An error occurred while reading the JSON file: {e}")
+        return report
+
+    report["unresolved"] = tracker.unresolved()
+    for prereq, course_numbers in report["unresolved"].items():
+        print(f"ERROR: Missing prerequisite: {prereq} (required by {', '.join(course_numbers)})")
+    return report
+
+
+# Generator that yields one at a time the courses of a CSV or JSON catalog, chosen by the file extension.
+@timed()
+def iter_courses_from_file(file_path: str, tracker: PrerequisiteTracker | None = None):
+    if file_path.lower().endswith(".json"):
+        chunks = iter_json_course_chunks(file_path, tracker=tracker)
+    else:
+        chunks = iter_csv_course_chunks(file_path, tracker=tracker)
+    for chunk in chunks:
+        yield from chunk
+
+
+# Generator of the courses of a CSV or JSON catalog that raises CyclicCatalogError after the last course if
+# their prerequisites contain a cycle, so a consumer that writes only once all the courses are read
+# (like services.mdb_api.sync_catalog) writes nothing.
+def _iter_acyclic_courses(file_path: str, tracker: PrerequisiteTracker):
+    yield from iter_courses_from_file(file_path, tracker)
+    cycle = tracker.find_cycle()
+    if cycle is not None:
+        raise CyclicCatalogError(cycle)
+
+
+# Read a CSV or JSON catalog file into a compact CourseCatalog, streaming the file so that only the
+# catalog columns are kept in memory. Returns None if the file can not be read.
+@timed(rows=len)
+def load_catalog_from_file(file_path: str) -> CourseCatalog | None:
+    try:
+        return CourseCatalog(iter_courses_from_file(file_path))
+    except FileNotFoundError:
+        print(f"ERROR: Could not open file '{file_path}'!!")
+        return None
+    except ValueError as e:
+        print(f"An error occurred while reading the catalog file: {e}")
+        return None
+
+
+# Convert a CSV or JSON catalog file to a binary snapshot file (see utils/catalog_snapshot.py).
+# The source file is streamed, the prerequisites that are never defined as courses are reported and kept.
+# Returns False if the source file can not be read or its prerequisites contain a cycle.
+def _file_to_snapshot(file_path: str, snapshot_path: str) -> bool:
+    try:
+        # The whole catalog is read before the file is written, so a cyclic catalog writes nothing.
+        catalog = write_snapshot(_iter_acyclic_courses(file_path, PrerequisiteTracker()), snapshot_path)
+    except FileNotFoundError:
+        print(f"ERROR: Could not open file '{file_path}'!!")
+        return False
+    except CyclicCatalogError as e:
+        print(f"ERROR: {e}")
+        return False
+    except ValueError as e:
+        print(f"An error occurred while reading the catalog file: {e}")
+        return False
+    if catalog.duplicates:
+        print(f"{catalog.duplicates} duplicated courses skipped.")
+    unresolved = catalog.unresolved()
+    if unresolved:
+        print(f"Prerequisites not defined as courses: {unresolved[:20]}{' ...' if len(unresolved) > 20 else ''}")
+    return True
+
+
+# Convert a CSV catalog file to a binary snapshot file.
+@timed()
+def csv_to_snapshot(csv_path: str, snapshot_path: str) -> bool:
+    return _file_to_snapshot(csv_path, snapshot_path)
+
+
+# Convert a JSON catalog file to a binary snapshot file.
+@timed()
+def json_to_snapshot(json_path: str, snapshot_path: str) -> bool:
+    return _file_to_snapshot(json_path, snapshot_path)
+
+
+# Open a binary snapshot file for queries without loading it. Returns None if the file can not be opened.
+@timed()
+def open_catalog_snapshot(snapshot_path: str) -> CatalogSnapshot | None:
+    try:
+        return CatalogSnapshot(snapshot_path)
+    except FileNotFoundError:
+        print(f"ERROR: Could not open file '{snapshot_path}'!!")
+    except SnapshotError as e:
+        print(f"ERROR: {e}")
+    return None
+
+
+# Load the courses of a binary snapshot file passing chunks of chunk_size courses to insert_function
+# (for example services.mdb_api.insert_courses, with any storage backend).
+# Returns a report like stream_courses_from_csv_file.
+@timed(rows=lambda report: report["courses"])
+def load_courses_from_snapshot(snapshot_path: str, insert_function, chunk_size: int = 1000) -> dict:
+    report = {"courses": 0, "chunks": 0, "skipped": [], "results": [], "unresolved": {}, "cycle": None}
+    snapshot = open_catalog_snapshot(snapshot_path)
+    if snapshot is None:
+        return report
+    with snapshot:
+        # A snapshot written before the cycle check could still contain one, it is rejected before inserting.
+        try:
+            PrerequisiteGraph(snapshot)
+        except CyclicCatalogError as e:
+            print(f"ERROR: {e}")
+            report["cycle"] = e.cycle
+            return report
+        # The snapshot was validated when written, the unknown prerequisites are the ones it kept.
+        unresolved = set(snapshot.unresolved())
+        for start in range(0, len(snapshot), chunk_size):
+            chunk = [snapshot.course_at(row) for row in range(start, min(start + chunk_size, len(snapshot)))]
+            for course in chunk:
+                for prereq in course.prerequisites:
+                    if prereq in unresolved:
+                        report["unresolved"].setdefault(prereq, []).append(course.number)
+            report["results"].append(insert_function(chunk))
+            report["courses"] += len(chunk)
+            report["chunks"] += 1
+    return report
+
+
+# Synchronize the stored catalog with a CSV or JSON file using sync_function (for example
+# services.mdb_api.sync_catalog) so that only the changed courses are written.
+# A catalog whose prerequisites contain a cycle is rejected without writing anything.
+# Returns the sync_function report with the unresolved prerequisites added, or None if the file can not be read.
+@timed(rows=lambda report: report["written"])
+def sync_catalog_from_file(file_path: str, sync_function, dry_run: bool = False) -> dict | None:
+    tracker = PrerequisiteTracker()
+    try:
+        report = sync_function(_iter_acyclic_courses(file_path, tracker), dry_run=dry_run)
+    except FileNotFoundError:
+        print(f"ERROR: Could not open file '{file_path}'!!")
+        return None
+    except CyclicCatalogError as e:
+        print(f"ERROR: {e}")
+        return None
+    except ValueError as e:
+        # A partially read catalog would delete the courses not read yet, so nothing has been written.
+        print(f"An error occurred while reading the catalog file: {e}")
+        return None
+    report["unresolved"] = tracker.unresolved()
+    return report
+
+
+# Generator that reads a CSV file of completed courses and yields (email, course number) pairs.
+# Each row contains the student email and the course number, further fields (like the grade) are ignored.
+@timed()
+def iter_completions_from_csv(csv_path: str):
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        for index, row in enumerate(csv.reader(csvfile), start=1):
+            if len(row) < 2 or not row[0].strip() or not row[1].strip():
+                print(f"Malformed row found, skipping at {index}: {row}")
+                continue
+            yield row[0].strip(), row[1].strip().upper()
+
+
+# Import the completed courses of a CSV file using bulk_function (for example
+# services.mdb_api.add_completed_courses_bulk). Returns its report or None if the file can not be read.
+@timed(rows=lambda report: report["completions"])
+def import_completions_from_csv(csv_path: str, bulk_function) -> dict | None:
+    try:
+        return bulk_function(iter_completions_from_csv(csv_path))
+    except FileNotFoundError:
+        print(f"ERROR: Could not open file '{csv_path}'!!")
+        return None
+
+
+# Load the users to create from a CSV file with "name,surname,email,password,role" rows.
+# Returns the list of (name, surname, email, password, role) tuples, an empty list if the file can not be read.
+@timed(rows=len)
+def load_user_rows_from_csv(csv_path: str) -> list[tuple]:
+    rows = []
+    try:
+        with open(csv_path, newline='', encoding='utf-8') as csvfile:
+            for index, row in enumerate(csv.reader(csvfile), start=1):
+                fields = [value.strip() for value in row]
+                if len(fields) < 4 or not all(fields[:4]):
+                    print(f"Malformed row found, skipping at {index}")  # The row is not printed, it has a password
+                    continue
+                role = fields[4].lower() if len(fields) > 4 else "student"
+                if role not in ("student", "admin"):
+                    role = "student"
+                rows.append((fields[0], fields[1], fields[2], fields[3], role))
+    except FileNotFoundError:
+        print(f"ERROR: Could not open file '{csv_path}'!!")
+        return []
+    return rows
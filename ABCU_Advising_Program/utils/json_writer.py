@@ -0,0 +1,115 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          json_writer.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Streaming writer of a JSON array, the elements are written to
+#               the file one at a time instead of dumping a whole list.
+# ============================================================================
+
+
+# Modules imports
+import json  # Import the helper module to work with JSON files
+from json.encoder import encode_basestring_ascii  # Fast string escaping used by json.dump
+
+
+# Encoders by indent, created once because creating an encoder for each element is slow.
+_encoders: dict[int | None, json.JSONEncoder] = {}
+# Types written by the fast formatting of the flat records.
+_SCALARS = (str, int, float, bool, type(None))
+
+
+# Return the encoder with the given indent creating it the first time.
+def _encoder(indent: int | None) -> json.JSONEncoder:
+    encoder = _encoders.get(indent)
+    if encoder is None:
+        encoder = _encoders[indent] = json.JSONEncoder(indent=indent,
+                                                       separators=(",", ":") if indent is None else None)
+    return encoder
+
+
+# Return the JSON text of a string, number, boolean or null.
+def _scalar(value) -> str:
+    return encode_basestring_ascii(value) if isinstance(value, str) else _encoder(None).encode(value)
+
+
+# Format a dictionary of scalars and lists of scalars (like a course) as an indented array element.
+# The json module indents in pure Python, building the text directly is about twice as fast.
+def _format_flat_dict(element: dict, indent: int) -> str:
+    padding = " " * indent
+    lines = []
+    for key, value in element.items():
+        if isinstance(value, list):
+            text = ("[\n" + ",\n".join(padding * 3 + _scalar(item) for item in value) + "\n" + padding * 2 + "]"
+                    if value else "[]")
+        else:
+            text = _scalar(value)
+        lines.append(f"{padding * 2}{_scalar(key)}: {text}")
+    return padding + "{\n" + ",\n".join(lines) + "\n" + padding + "}"
+
+
+# Return True when the element can be written by _format_flat_dict.
+def _is_flat_dict(element) -> bool:
+    return (isinstance(element, dict) and len(element) > 0
+            and all(isinstance(key, str) for key in element)
+            and all(isinstance(value, _SCALARS)
+                    or (isinstance(value, list) and all(isinstance(item, _SCALARS) for item in value))
+                    for value in element.values()))
+
+
+# Return the text of an element as it appears inside the array. With indent the output is the same of
+# json.dump(list, indent=indent), without indent it is compact (no spaces and no new lines).
+def format_element(element, indent: int | None = 4) -> str:
+    if indent is None:
+        return _encoder(None).encode(element)
+    if _is_flat_dict(element):
+        return _format_flat_dict(element, indent)
+    # Every line of the element is indented by one more level because it is inside the array.
+    padding = " " * indent
+    return padding + _encoder(indent).encode(element).replace("\n", "\n" + padding)
+
+
+# Return the text written between two elements of the array.
+def element_separator(indent: int | None = 4) -> str:
+    return "," if indent is None else ",\n"
+
+
+# Writer of a JSON array to an open text file. Use it with a with statement, the array is closed at the end.
+class JsonArrayWriter:
+
+    def __init__(self, json_file, indent: int | None = 4):
+        self.json_file = json_file
+        self.indent = indent
+        self.count = 0  # Elements written so far
+
+    # Write one element.
+    def write(self, element) -> None:
+        self.write_formatted(format_element(element, self.indent), 1)
+
+    # Write count elements already formatted with format_element and joined by element_separator,
+    # for example a fragment produced by another process.
+    def write_formatted(self, fragment: str, count: int) -> None:
+        if count == 0:
+            return
+        if self.count == 0:
+            self.json_file.write("[" if self.indent is None else "[\n")
+        else:
+            self.json_file.write(element_separator(self.indent))
+        self.json_file.write(fragment)
+        self.count += count
+
+    # Close the array. An empty array is written as [] like json.dump does.
+    def close(self) -> None:
+        if self.count == 0:
+            self.json_file.write("[]")
+        else:
+            self.json_file.write("]" if self.indent is None else "\n]")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        # The array is not closed after an error, the file is incomplete anyway.
+        if exc_type is None:
+            self.close()
@@ -0,0 +1,241 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          metrics.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Timing registry of the service and loader functions: call
+#               counts, latency histograms, rows processed and errors, with
+#               JSON and Prometheus export and an optional cProfile hook.
+#               Set ABCU_METRICS=1 (or call enable()) to collect the metrics.
+# ============================================================================
+
+
+# Modules imports
+import bisect  # Histogram bucket of a duration
+import contextlib  # Context managers of the timers and of the profiler
+import cProfile  # Profiler of a single command
+import functools  # Used to keep the name of the decorated functions
+import inspect  # Used to recognize the generator functions
+import io  # Buffer of the profiler report
+import json  # JSON export
+import os  # OS tools
+import pstats  # Profiler report
+import threading  # Lock to share the registry between threads
+import time  # Timings
+
+
+# Upper bounds in seconds of the latency histogram buckets: from 1 microsecond to about 2 minutes doubling
+# at each bucket, the last bucket has no upper bound.
+BUCKETS = [1e-6 * 2 ** i for i in range(28)]
+
+# The metrics are collected only when enabled, otherwise a timed function costs a single flag check.
+_enabled = os.getenv("ABCU_METRICS", "0").lower() in ("1", "true", "yes")
+
+
+# Counters of a timed function or block.
+class Metric:
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total = 0.0  # Seconds spent in all the calls
+        self.max = 0.0  # Slowest call
+        self.buckets = [0] * (len(BUCKETS) + 1)  # Calls of each histogram bucket, the last one is unbounded
+
+    # Record one call.
+    def observe(self, seconds: float, rows: int = 0, error: bool = False) -> None:
+        self.calls += 1
+        self.errors += error
+        self.rows += rows
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+
+    # Return the estimated duration below which the given fraction of the calls finished.
+    # The value is interpolated inside the histogram bucket, so it is precise within a factor of two.
+    def percentile(self, fraction: float) -> float:
+        if self.calls == 0:
+            return 0.0
+        rank = fraction * self.calls
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            if count and seen + count >= rank:
+                low = BUCKETS[i - 1] if i > 0 else 0.0
+                high = BUCKETS[i] if i < len(BUCKETS) else self.max
+                return min(self.max, low + (high - low) * (rank - seen) / count)
+            seen += count
+        return self.max
+
+    # Return the counters as a dictionary.
+    def to_dict(self) -> dict:
+        return {"calls": self.calls, "errors": self.errors, "rows": self.rows, "total_seconds": self.total,
+                "mean_seconds": self.total / self.calls if self.calls else 0.0, "max_seconds": self.max,
+                "p50_seconds": self.percentile(0.50), "p95_seconds": self.percentile(0.95),
+                "p99_seconds": self.percentile(0.99)}
+
+
+# Registry of the metrics by name.
+_metrics: dict[str, Metric] = {}
+_lock = threading.Lock()
+
+
+# Turn the collection of the metrics on or off.
+def enable(enabled: bool = True) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+# Record a call of the named function or block.
+def observe(name: str, seconds: float, rows: int = 0, error: bool = False) -> None:
+    with _lock:
+        metric = _metrics.get(name)
+        if metric is None:
+            metric = _metrics[name] = Metric(name)
+        metric.observe(seconds, rows, error)
+
+
+# Rows processed by the block measured with timer(), set by the code inside the block.
+class _Timing:
+    rows = 0
+
+
+# Context manager measuring a block of code, the rows processed can be set on the returned object:
+#     with timer("load_catalog") as timing:
+#         timing.rows = len(courses)
+@contextlib.contextmanager
+def timer(name: str):
+    timing = _Timing()
+    if not _enabled:
+        yield timing
+        return
+    start = time.perf_counter()
+    try:
+        yield timing
+    except BaseException:
+        observe(name, time.perf_counter() - start, timing.rows, error=True)
+        raise
+    observe(name, time.perf_counter() - start, timing.rows)
+
+
+# Decorator measuring every call of a function. The metric is named "module.function" unless name is given.
+# rows is an optional function receiving the result and returning the number of rows processed.
+# For a generator function the whole iteration is measured and the rows are the yielded items (rows, when
+# given, receives each item, for example len for the generators of chunks).
+def timed(name: str | None = None, rows=None):
+    def decorator(function):
+        metric_name = name or f"{function.__module__.rsplit('.', 1)[-1]}.{function.__qualname__}"
+
+        if inspect.isgeneratorfunction(function):
+            @functools.wraps(function)
+            def generator_wrapper(*args, **kwargs):
+                if not _enabled:
+                    return (yield from function(*args, **kwargs))
+                start = time.perf_counter()
+                count = 0
+                try:
+                    for item in function(*args, **kwargs):
+                        count += rows(item) if rows else 1
+                        yield item
+                except BaseException as e:
+                    # A generator closed before the end is not an error.
+                    observe(metric_name, time.perf_counter() - start, count, error=not isinstance(e, GeneratorExit))
+                    raise
+                observe(metric_name, time.perf_counter() - start, count)
+            return generator_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            except BaseException:
+                observe(metric_name, time.perf_counter() - start, error=True)
+                raise
+            observe(metric_name, time.perf_counter() - start, rows(result) if rows and result is not None else 0)
+            return result
+        return wrapper
+    return decorator
+
+
+# Remove all the collected metrics.
+def reset() -> None:
+    with _lock:
+        _metrics.clear()
+
+
+# Return the collected metrics as a dictionary by name.
+def snapshot() -> dict[str, dict]:
+    with _lock:
+        return {name: metric.to_dict() for name, metric in sorted(_metrics.items())}
+
+
+# Return the collected metrics as JSON text.
+def export_json() -> str:
+    return json.dumps(snapshot(), indent=4)
+
+
+# Return the collected metrics in the Prometheus text exposition format.
+def export_prometheus() -> str:
+    lines = ["# HELP abcu_call_duration_seconds Duration of the calls.",
+             "# TYPE abcu_call_duration_seconds histogram"]
+    with _lock:
+        metrics = sorted(_metrics.items())
+        for name, metric in metrics:
+            cumulative = 0
+            for bound, count in zip(BUCKETS, metric.buckets):
+                cumulative += count
+                lines.append(f'abcu_call_duration_seconds_bucket{{function="{name}",le="{bound:.9g}"}} {cumulative}')
+            lines.append(f'abcu_call_duration_seconds_bucket{{function="{name}",le="+Inf"}} {metric.calls}')
+            lines.append(f'abcu_call_duration_seconds_sum{{function="{name}"}} {metric.total:.9g}')
+            lines.append(f'abcu_call_duration_seconds_count{{function="{name}"}} {metric.calls}')
+        lines += ["# HELP abcu_call_errors_total Calls ended with an exception.",
+                  "# TYPE abcu_call_errors_total counter"]
+        lines += [f'abcu_call_errors_total{{function="{name}"}} {metric.errors}' for name, metric in metrics]
+        lines += ["# HELP abcu_rows_total Rows processed by the calls.",
+                  "# TYPE abcu_rows_total counter"]
+        lines += [f'abcu_rows_total{{function="{name}"}} {metric.rows}' for name, metric in metrics]
+    return "\n".join(lines) + "\n"
+
+
+# Write the collected metrics to a file, in the Prometheus format when the name ends with .prom or .txt,
+# otherwise as JSON.
+def write_metrics(path: str) -> None:
+    text = export_prometheus() if path.lower().endswith((".prom", ".txt")) else export_json()
+    with open(path, "w", encoding="utf-8") as metrics_file:
+        metrics_file.write(text)
+
+
+# Return a table of the collected metrics to print on the terminal.
+def format_table() -> str:
+    lines = [f"{'function':<42} {'calls':>8} {'errors':>6} {'rows':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+    for name, values in snapshot().items():
+        lines.append(f"{name:<42} {values['calls']:>8} {values['errors']:>6} {values['rows']:>9} "
+                     f"{values['p50_seconds'] * 1000:>9.3f} {values['p95_seconds'] * 1000:>9.3f} "
+                     f"{values['p99_seconds'] * 1000:>9.3f}")
+    return "\n".join(lines)
+
+
+# Context manager profiling the code inside the block with cProfile. The statistics are saved to path
+# (readable with pstats or snakeviz) when given, and the limit slowest functions by cumulative time printed.
+@contextlib.contextmanager
+def profile(path: str | None = None, limit: int = 25):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if path:
+            profiler.dump_stats(path)
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(limit)
+        print(report.getvalue())
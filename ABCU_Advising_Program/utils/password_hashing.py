@@ -0,0 +1,70 @@
+# ============================================================================
+# Title         CS499 Capstone
+# Name          password_hashing.py
+# Author        Gianmarco Vendramin
+# Version       1.0
+# Date          October 17, 2026
+# Description   Password hashing and verification with bcrypt, run on a
+#               bounded pool of threads and with a configurable work factor.
+# ============================================================================
+
+
+# Modules imports
+import os  # OS tools
+from concurrent.futures import Future, ThreadPoolExecutor  # Pool running the bcrypt work
+# bcrypt is imported by the functions that use it, so it is loaded only when a password is checked or hashed.
+
+
+# bcrypt work factor used for the new hashes (each step doubles the hashing time).
+# The stored hashes with a lower work factor are replaced at the next successful login.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# bcrypt releases the GIL while hashing, so a pool of threads uses all the cores.
+# PASSWORD_HASH_WORKERS sets the size of the pool, by default one thread per core.
+_executor = ThreadPoolExecutor(max_workers=int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 4))),
+                               thread_name_prefix="password_hash")
+
+
+# Hash a password with the configured work factor (or the given one).
+def hash_password(password: str, rounds: int | None = None) -> bytes:
+    import bcrypt  # To hash the user password for safe storage in the database
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds or BCRYPT_ROUNDS))
+
+
+# Verify if the given password matches the stored hash. A malformed (corrupt) hash never matches.
+def verify_password(password: str, password_hash: bytes) -> bool:
+    import bcrypt  # To check the password against the stored hash
+    try:
+        return bcrypt.checkpw(password.encode(), password_hash)
+    except ValueError:  # Invalid salt
+        return False
+
+
+# Return the work factor stored inside a bcrypt hash like b"$2b$12$...", or None when the hash is malformed.
+def hash_rounds(password_hash: bytes) -> int | None:
+    try:
+        return int(password_hash.split(b"$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+# Return True when the hash was made with a work factor lower than the configured one.
+# A hash with a higher work factor is kept, so lowering BCRYPT_ROUNDS never weakens the stored hashes.
+def needs_rehash(password_hash: bytes) -> bool:
+    rounds = hash_rounds(password_hash)
+    return rounds is not None and rounds < BCRYPT_ROUNDS
+
+
+# Start hashing a password on the pool and return the future of the hash.
+def submit_hash(password: str) -> Future:
+    return _executor.submit(hash_password, password)
+
+
+# Start verifying a password on the pool and return the future of the result.
+def submit_verify(password: str, password_hash: bytes) -> Future:
+    return _executor.submit(verify_password, password, password_hash)
+
+
+# Hash many passwords in parallel on the pool, the hashes are returned in the same order.
+def hash_passwords(passwords) -> list[bytes]:
+    return list(_executor.map(hash_password, passwords))